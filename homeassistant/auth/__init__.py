@@ -5,6 +5,7 @@ import asyncio
 from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import timedelta
+from functools import partial
 import time
 from typing import Any, cast
 
@@ -15,7 +16,12 @@ from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
 from . import auth_store, jwt_wrapper, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import (
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_CACHE_TIME,
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -158,6 +164,10 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Verified access tokens with their refresh token and the time
+        # until which they are trusted without verifying them again
+        self._access_tokens: dict[str, tuple[models.RefreshToken, float]] = {}
+        self._access_tokens_by_refresh_token: dict[str, set[str]] = {}
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -309,6 +319,8 @@ class AuthManager:
         if tasks:
             await asyncio.gather(*tasks)
 
+        for refresh_token_id in user.refresh_tokens:
+            self._async_forget_access_tokens(refresh_token_id)
         await self._store.async_remove_user(user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
@@ -555,6 +567,14 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        if cached := self._access_tokens.get(token):
+            cached_refresh_token, trusted_until = cached
+            if time.time() < trusted_until:
+                if not cached_refresh_token.user.is_active:
+                    return None
+                return cached_refresh_token
+            self._async_forget_access_token(token)
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -572,17 +592,56 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            claims = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
             return None
 
-        if refresh_token is None or not refresh_token.user.is_active:
+        if refresh_token is None:
+            return None
+
+        self._async_remember_access_token(token, refresh_token, claims["exp"])
+        if not refresh_token.user.is_active:
             return None
 
         return refresh_token
 
+    @callback
+    def _async_remember_access_token(
+        self,
+        token: str,
+        refresh_token: models.RefreshToken,
+        expiration: int,
+    ) -> None:
+        """Trust a verified access token for a while unless it is revoked."""
+        # Tokens are accepted with the same leeway as when verifying them
+        trusted_until = min(time.time() + ACCESS_TOKEN_CACHE_TIME, expiration + 10)
+        if len(self._access_tokens) >= ACCESS_TOKEN_CACHE_SIZE:
+            self._async_forget_access_token(next(iter(self._access_tokens)))
+        self._access_tokens[token] = (refresh_token, trusted_until)
+        if (
+            tokens := self._access_tokens_by_refresh_token.get(refresh_token.id)
+        ) is None:
+            tokens = self._access_tokens_by_refresh_token[refresh_token.id] = set()
+            self.async_register_revoke_token_callback(
+                refresh_token.id,
+                partial(self._async_forget_access_tokens, refresh_token.id),
+            )
+        tokens.add(token)
+
+    @callback
+    def _async_forget_access_token(self, token: str) -> None:
+        """Stop trusting a verified access token."""
+        refresh_token, _ = self._access_tokens.pop(token)
+        self._access_tokens_by_refresh_token[refresh_token.id].discard(token)
+
+    @callback
+    def _async_forget_access_tokens(self, refresh_token_id: str) -> None:
+        """Stop trusting the verified access tokens of a refresh token."""
+        for token in self._access_tokens_by_refresh_token.pop(refresh_token_id, ()):
+            del self._access_tokens[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
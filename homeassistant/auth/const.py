@@ -4,6 +4,11 @@ from datetime import timedelta
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 
+# How long a verified access token is trusted without verifying it again
+ACCESS_TOKEN_CACHE_TIME = 60
+# The maximum number of verified access tokens kept
+ACCESS_TOKEN_CACHE_SIZE = 1024
+
 GROUP_ID_ADMIN = "system-admin"
 GROUP_ID_USER = "system-users"
 GROUP_ID_READ_ONLY = "system-read-only"
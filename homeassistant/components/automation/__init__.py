@@ -76,6 +76,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_enabled_cv,
     trace_get,
     trace_path,
 )
@@ -987,12 +988,19 @@ async def _async_process_if(
             LOGGER.warning("Invalid condition: %s", ex)
             return None
 
+    paths = [["condition", str(index)] for index in range(len(checks))]
+
     def if_action(variables: Mapping[str, Any] | None = None) -> bool:
         """AND all conditions."""
         errors: list[ConditionErrorIndex] = []
+        tracing = trace_enabled_cv.get()
         for index, check in enumerate(checks):
             try:
-                with trace_path(["condition", str(index)]):
+                if not tracing:
+                    if check(hass, variables) is False:
+                        return False
+                    continue
+                with trace_path(paths[index]):
                     if check(hass, variables) is False:
                         return False
             except ConditionError as ex:
@@ -1,5 +1,6 @@
 """Constants for the Backup integration."""
 from logging import getLogger
+import os
 
 DOMAIN = "backup"
 LOGGER = getLogger(__package__)
@@ -13,3 +14,8 @@ EXCLUDE_FROM_BACKUP = [
     "backups/*.tar",
     "OZW_Log.txt",
 ]
+
+# The compression level of the archive of the config directory
+DEFAULT_COMPRESSION_LEVEL = 6
+# The number of threads compressing the archive of the config directory
+COMPRESSION_THREADS = min(4, os.cpu_count() or 1)
@@ -4,28 +4,49 @@ from __future__ import annotations
 import asyncio
 from dataclasses import asdict, dataclass
 import hashlib
+import io
 import json
 from pathlib import Path
+import sqlite3
 import tarfile
 from tarfile import TarError
-from tempfile import TemporaryDirectory
-from typing import Any, Protocol, cast
-
-from securetar import SecureTarFile, atomic_contents_add
+import time
+from typing import Any, BinaryIO, Protocol, cast
 
 from homeassistant.const import __version__ as HAVERSION
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import integration_platform
-from homeassistant.helpers.json import save_json
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads_object
 
-from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
+from .const import (
+    COMPRESSION_THREADS,
+    DEFAULT_COMPRESSION_LEVEL,
+    DOMAIN,
+    EXCLUDE_FROM_BACKUP,
+    LOGGER,
+)
+from .util import (
+    SQLITE_SIDECAR_SUFFIXES,
+    ParallelGzipWriter,
+    is_sqlite_database,
+    snapshot_sqlite_database,
+)
 
 BUF_SIZE = 2**20 * 4  # 4MB
 
 
+@dataclass(slots=True)
+class BackupStats:
+    """Statistics of generating a backup."""
+
+    duration: float
+    contents_size: float
+    throughput: float
+
+
 @dataclass(slots=True)
 class Backup:
     """Backup class."""
@@ -35,6 +56,8 @@ class Backup:
     date: str
     path: Path
     size: float
+    # Only known for the backups generated since the manager was created
+    stats: BackupStats | None = None
 
     def as_dict(self) -> dict:
         """Return a dict representation of this backup."""
@@ -154,7 +177,9 @@ class BackupManager:
         LOGGER.debug("Removed backup located at %s", backup.path)
         self.backups.pop(slug)
 
-    async def generate_backup(self) -> Backup:
+    async def generate_backup(
+        self, compression_level: int = DEFAULT_COMPRESSION_LEVEL
+    ) -> Backup:
         """Generate a backup."""
         if self.backing_up:
             raise HomeAssistantError("Backup already in progress")
@@ -189,10 +214,22 @@ class BackupManager:
                 "compressed": True,
             }
             tar_file_path = Path(self.backup_dir, f"{backup_data['slug']}.tar")
-            size_in_bytes = await self.hass.async_add_executor_job(
+            start = time.monotonic()
+            (
+                size_in_bytes,
+                contents_size_in_bytes,
+            ) = await self.hass.async_add_executor_job(
                 self._mkdir_and_generate_backup_contents,
                 tar_file_path,
                 backup_data,
+                compression_level,
+            )
+            duration = time.monotonic() - start
+            contents_size = contents_size_in_bytes / 1_048_576
+            stats = BackupStats(
+                duration=round(duration, 2),
+                contents_size=round(contents_size, 2),
+                throughput=round(contents_size / max(duration, 0.001), 2),
             )
             backup = Backup(
                 slug=slug,
@@ -200,10 +237,17 @@ class BackupManager:
                 date=date_str,
                 path=tar_file_path,
                 size=round(size_in_bytes / 1_048_576, 2),
+                stats=stats,
             )
             if self.loaded_backups:
                 self.backups[slug] = backup
-            LOGGER.debug("Generated new backup with slug %s", slug)
+            LOGGER.debug(
+                "Generated new backup with slug %s of %s MB in %s seconds (%s MB/s)",
+                slug,
+                stats.contents_size,
+                stats.duration,
+                stats.throughput,
+            )
             return backup
         finally:
             self.backing_up = False
@@ -222,33 +266,154 @@ class BackupManager:
         self,
         tar_file_path: Path,
         backup_data: dict[str, Any],
-    ) -> int:
-        """Generate backup contents and return the size."""
+        compression_level: int,
+    ) -> tuple[int, int]:
+        """Generate backup contents and return the size and the contents size.
+
+        The compressed archive of the config directory is streamed straight
+        into the backup, SQLite databases are added as online snapshots.
+        """
         if not self.backup_dir.exists():
             LOGGER.debug("Creating backup directory")
             self.backup_dir.mkdir()
 
-        with TemporaryDirectory() as tmp_dir, SecureTarFile(
-            tar_file_path, "w", gzip=False, bufsize=BUF_SIZE
-        ) as tar_file:
-            tmp_dir_path = Path(tmp_dir)
-            save_json(
-                tmp_dir_path.joinpath("./backup.json").as_posix(),
-                backup_data,
+        with tarfile.open(tar_file_path, "w:", bufsize=BUF_SIZE) as tar_file:
+            mtime = int(time.time())
+            dir_info = tarfile.TarInfo(".")
+            dir_info.type = tarfile.DIRTYPE
+            dir_info.mode = 0o755
+            dir_info.mtime = mtime
+            tar_file.addfile(dir_info)
+            backup_json = json_bytes(backup_data)
+            backup_json_info = tarfile.TarInfo("./backup.json")
+            backup_json_info.size = len(backup_json)
+            backup_json_info.mtime = mtime
+            tar_file.addfile(backup_json_info, io.BytesIO(backup_json))
+            contents_size = self._add_core_archive(tar_file, compression_level, mtime)
+        return tar_file_path.stat().st_size, contents_size
+
+    def _add_core_archive(
+        self,
+        tar_file: tarfile.TarFile,
+        compression_level: int,
+        mtime: int,
+    ) -> int:
+        """Stream the compressed archive of the config directory into tar_file.
+
+        The size of the archive is not known until it is written, the header
+        of the member is written again with the size once it is done.
+        Returns the size of the archive before compression.
+        """
+        info = tarfile.TarInfo("./homeassistant.tar.gz")
+        info.mtime = mtime
+        # The GNU format stores any size in a single header block
+        # so the header can be replaced in place
+        header_offset = tar_file.offset
+        fileobj = cast(BinaryIO, tar_file.fileobj)
+        fileobj.write(info.tobuf(tarfile.GNU_FORMAT, tar_file.encoding, "strict"))
+        data_offset = fileobj.tell()
+        with ParallelGzipWriter(
+            fileobj, compression_level, COMPRESSION_THREADS
+        ) as gzip_writer, tarfile.open(
+            fileobj=gzip_writer,  # type: ignore[arg-type]
+            mode="w|",
+            dereference=False,
+            bufsize=BUF_SIZE,
+        ) as core_tar:
+            _contents_add(
+                core_tar,
+                Path(self.hass.config.path()),
+                EXCLUDE_FROM_BACKUP,
+                "data",
+                self.backup_dir,
             )
-            with SecureTarFile(
-                tmp_dir_path.joinpath("./homeassistant.tar.gz").as_posix(),
-                "w",
-                bufsize=BUF_SIZE,
-            ) as core_tar:
-                atomic_contents_add(
-                    tar_file=core_tar,
-                    origin_path=Path(self.hass.config.path()),
-                    excludes=EXCLUDE_FROM_BACKUP,
-                    arcname="data",
+        info.size = fileobj.tell() - data_offset
+        if remainder := info.size % tarfile.BLOCKSIZE:
+            fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+        end_offset = fileobj.tell()
+        fileobj.seek(header_offset)
+        fileobj.write(info.tobuf(tarfile.GNU_FORMAT, tar_file.encoding, "strict"))
+        fileobj.seek(end_offset)
+        tar_file.offset = end_offset
+        return gzip_writer.size
+
+
+def _is_excluded_by_filter(path: Path, excludes: list[str]) -> bool:
+    """Return if a path is excluded from the backup."""
+    return any(path.match(exclude) for exclude in excludes)
+
+
+def _contents_add(
+    tar_file: tarfile.TarFile,
+    origin_path: Path,
+    excludes: list[str],
+    arcname: str,
+    staging_dir: Path,
+) -> None:
+    """Add a directory and its contents to tar_file unless they are excluded.
+
+    SQLite databases are added as snapshots, without their journal files.
+    """
+    if _is_excluded_by_filter(origin_path, excludes):
+        return
+
+    # Add directory only (recursive=False) to ensure we also archive empty directories
+    tar_file.add(origin_path.as_posix(), arcname=arcname, recursive=False)
+
+    directory_items = list(origin_path.iterdir())
+    databases = {
+        directory_item.name
+        for directory_item in directory_items
+        if not directory_item.is_symlink() and is_sqlite_database(directory_item)
+    }
+    for directory_item in directory_items:
+        if _is_excluded_by_filter(directory_item, excludes):
+            continue
+
+        arcpath = f"{arcname}/{directory_item.name}"
+        if directory_item.is_dir() and not directory_item.is_symlink():
+            _contents_add(tar_file, directory_item, excludes, arcpath, staging_dir)
+            continue
+
+        if directory_item.name in databases:
+            _add_sqlite_snapshot(tar_file, directory_item, arcpath, staging_dir)
+            continue
+
+        if any(
+            directory_item.name.removesuffix(suffix) in databases
+            for suffix in SQLITE_SIDECAR_SUFFIXES
+            if directory_item.name.endswith(suffix)
+        ):
+            continue
+
+        tar_file.add(directory_item.as_posix(), arcname=arcpath, recursive=False)
+
+
+def _add_sqlite_snapshot(
+    tar_file: tarfile.TarFile, path: Path, arcname: str, staging_dir: Path
+) -> None:
+    """Add a snapshot of a SQLite database to tar_file."""
+    try:
+        snapshot, size = snapshot_sqlite_database(path, staging_dir)
+    except (sqlite3.Error, OSError) as err:
+        LOGGER.warning(
+            "Unable to take a snapshot of %s, adding it as is: %s", path, err
+        )
+        tar_file.add(path.as_posix(), arcname=arcname, recursive=False)
+        # The journal files are needed to open the database as it is
+        for suffix in SQLITE_SIDECAR_SUFFIXES:
+            if (sidecar_path := path.with_name(f"{path.name}{suffix}")).exists():
+                tar_file.add(
+                    sidecar_path.as_posix(),
+                    arcname=f"{arcname}{suffix}",
+                    recursive=False,
                 )
-            tar_file.add(tmp_dir_path, arcname=".")
-        return tar_file_path.stat().st_size
+        return
+
+    with snapshot:
+        info = tar_file.gettarinfo(path.as_posix(), arcname)
+        info.size = size
+        tar_file.addfile(info, snapshot)
 
 
 def _generate_slug(date: str, name: str) -> str:
@@ -0,0 +1,190 @@
+"""Utilities for the Backup integration."""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import errno
+import io
+from pathlib import Path
+import shutil
+import sqlite3
+import struct
+import tempfile
+from types import TracebackType
+from typing import BinaryIO
+import zlib
+
+# The size of the chunks compressed by the compression threads
+COMPRESSION_CHUNK_SIZE = 2**20  # 1MB
+# The size of the window of a deflate stream which is used as the
+# dictionary to compress the next chunk
+DEFLATE_WINDOW_SIZE = 2**15
+
+# The number of pages copied at a time when taking a snapshot of a database
+SQLITE_BACKUP_PAGES = 1024
+# Databases up to this size are copied to memory for their snapshot,
+# larger ones are staged in a temporary file
+SQLITE_MEMORY_SNAPSHOT_SIZE = 2**25  # 32MB
+SQLITE_HEADER = b"SQLite format 3\x00"
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+# Files next to a database which are part of its snapshot
+SQLITE_SIDECAR_SUFFIXES = ("-wal", "-journal")
+
+# The gzip header of a deflate compressed member without a file name
+# or modification time, generated by an unknown operating system
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+
+def _compress_chunk(chunk: bytes, zdict: bytes, level: int, last: bool) -> bytes:
+    """Compress a chunk of a deflate stream.
+
+    The chunk is compressed with the end of the previous chunk as the
+    dictionary and ends on a byte boundary so the compressed chunks can
+    be concatenated into a single deflate stream.
+    """
+    compressor = (
+        zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=zdict)
+        if zdict
+        else zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    )
+    return compressor.compress(chunk) + compressor.flush(
+        zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    )
+
+
+class ParallelGzipWriter:
+    """Write a gzip stream compressed by multiple threads.
+
+    The data is split into chunks which are compressed in parallel and
+    written in order as a single gzip member, so it can be read by any
+    gzip reader including tarfile streams.
+    """
+
+    def __init__(self, fileobj: BinaryIO, level: int, threads: int) -> None:
+        """Initialize the writer."""
+        self._fileobj = fileobj
+        self._level = level
+        self._threads = threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="BackupCompression"
+        )
+        self._pending: deque[Future[bytes]] = deque()
+        self._buffer = bytearray()
+        self._zdict = b""
+        self._crc = 0
+        self.size = 0
+        fileobj.write(GZIP_HEADER)
+
+    def __enter__(self) -> ParallelGzipWriter:
+        """Return the writer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Finish the gzip stream unless writing failed."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._executor.shutdown(cancel_futures=True)
+
+    def write(self, data: bytes) -> int:
+        """Write data."""
+        self._buffer += data
+        while len(self._buffer) >= COMPRESSION_CHUNK_SIZE:
+            self._submit(bytes(self._buffer[:COMPRESSION_CHUNK_SIZE]), False)
+            del self._buffer[:COMPRESSION_CHUNK_SIZE]
+        return len(data)
+
+    def _submit(self, chunk: bytes, last: bool) -> None:
+        """Compress a chunk and write the compressed chunks which are done."""
+        self._crc = zlib.crc32(chunk, self._crc)
+        self.size += len(chunk)
+        self._pending.append(
+            self._executor.submit(
+                _compress_chunk, chunk, self._zdict, self._level, last
+            )
+        )
+        self._zdict = chunk[-DEFLATE_WINDOW_SIZE:]
+        # Bound the memory used by the chunks waiting to be written
+        while len(self._pending) > self._threads * 2 or (
+            self._pending and self._pending[0].done()
+        ):
+            self._fileobj.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        """Write the end of the gzip stream."""
+        self._submit(bytes(self._buffer), True)
+        self._buffer.clear()
+        while self._pending:
+            self._fileobj.write(self._pending.popleft().result())
+        self._executor.shutdown()
+        self._fileobj.write(struct.pack("<LL", self._crc, self.size & 0xFFFFFFFF))
+
+
+def is_sqlite_database(path: Path) -> bool:
+    """Return if a file is a SQLite database."""
+    if not path.name.endswith(SQLITE_SUFFIXES):
+        return False
+    try:
+        with path.open("rb") as file:
+            return file.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def snapshot_sqlite_database(path: Path, staging_dir: Path) -> tuple[BinaryIO, int]:
+    """Take a consistent snapshot of a SQLite database which is in use.
+
+    The database is copied with the SQLite backup API a few pages at a
+    time within a read transaction. The transaction keeps the snapshot
+    consistent without restarting the copy when the database is written,
+    and writers are not blocked by it when the database is in WAL mode.
+
+    The backup API can only copy to another database. Databases up to
+    SQLITE_MEMORY_SNAPSHOT_SIZE are copied to an in-memory database. Larger
+    ones are copied to a temporary file in staging_dir, if it has room for
+    them, which is removed while it is still open. Returns the snapshot,
+    which must be closed by the caller, and its size.
+    """
+    source = sqlite3.connect(path, isolation_level=None)
+    try:
+        source.execute("BEGIN")
+        source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        (page_size,) = source.execute("PRAGMA page_size").fetchone()
+        (page_count,) = source.execute("PRAGMA page_count").fetchone()
+        if (size := page_size * page_count) <= SQLITE_MEMORY_SNAPSHOT_SIZE:
+            target = sqlite3.connect(":memory:")
+            try:
+                source.backup(target, pages=SQLITE_BACKUP_PAGES)
+                snapshot = target.serialize()
+            finally:
+                target.close()
+            source.execute("COMMIT")
+            return io.BytesIO(snapshot), len(snapshot)
+
+        if (free := shutil.disk_usage(staging_dir).free) < size:
+            raise OSError(
+                errno.ENOSPC,
+                f"Staging a snapshot of {size} bytes needs more than the {free}"
+                " bytes free in",
+                str(staging_dir),
+            )
+        with tempfile.TemporaryDirectory(
+            prefix=".snapshot-", dir=staging_dir
+        ) as temp_dir:
+            snapshot_path = Path(temp_dir, path.name)
+            target = sqlite3.connect(snapshot_path)
+            try:
+                source.backup(target, pages=SQLITE_BACKUP_PAGES)
+            finally:
+                target.close()
+            source.execute("COMMIT")
+            size = snapshot_path.stat().st_size
+            snapshot_file = snapshot_path.open("rb")
+        return snapshot_file, size
+    finally:
+        source.close()
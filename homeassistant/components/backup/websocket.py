@@ -6,7 +6,7 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
 
-from .const import DOMAIN
+from .const import DEFAULT_COMPRESSION_LEVEL, DOMAIN
 from .manager import BackupManager
 
 
@@ -58,7 +58,14 @@ async def handle_remove(
 
 
 @websocket_api.require_admin
-@websocket_api.websocket_command({vol.Required("type"): "backup/generate"})
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "backup/generate",
+        vol.Optional("compression_level", default=DEFAULT_COMPRESSION_LEVEL): vol.All(
+            int, vol.Range(min=0, max=9)
+        ),
+    }
+)
 @websocket_api.async_response
 async def handle_create(
     hass: HomeAssistant,
@@ -67,5 +74,5 @@ async def handle_create(
 ) -> None:
     """Generate a backup."""
     manager: BackupManager = hass.data[DOMAIN]
-    backup = await manager.generate_backup()
+    backup = await manager.generate_backup(msg["compression_level"])
     connection.send_result(msg["id"], backup)
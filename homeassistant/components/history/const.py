@@ -1,7 +1,15 @@
 """History integration constants."""
+from datetime import timedelta
 
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Time span of the history fetched for each chunk of a chunked response
+HISTORY_CHUNK_TIME_SPAN = timedelta(hours=12)
+
+# Chunks of a chunked response which may wait to be sent to the client
+# before the next chunk is fetched
+MAX_PENDING_HISTORY_CHUNKS = 2
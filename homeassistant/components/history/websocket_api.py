@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Iterable, MutableMapping
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
 import logging
 from typing import Any, cast
 
@@ -27,6 +27,7 @@ from homeassistant.core import (
     State,
     callback,
     is_callback,
+    split_entity_id,
     valid_entity_id,
 )
 from homeassistant.helpers.event import (
@@ -34,15 +35,26 @@ from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
     async_track_state_change_event,
 )
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import JSON_DUMP, json_fragment
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_TIME_SPAN,
+    MAX_PENDING_HISTORY_CHUNKS,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
 
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Names of the JSON encodings of states cached by State.cached_json
+COMPRESSED_STATE_SHAPE = "history_compressed_state"
+COMPRESSED_STATE_NO_ATTRIBUTES_SHAPE = "history_compressed_state_no_attributes"
+
 
 @dataclass(slots=True)
 class HistoryLiveStream:
@@ -62,6 +74,56 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _get_compressed_significant_states(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> MutableMapping[str, list[dict[str, Any]]]:
+    """Fetch significant states in the compressed state format.
+
+    The states are taken from the recent states the recorder keeps in memory
+    when they cover the period, otherwise they are fetched from the database.
+    """
+    instance = get_instance(hass)
+    if (
+        entity_ids
+        and instance.states_meta_manager.active
+        and (
+            states := instance.recent_states.get_significant_states(
+                dt_util.utc_to_timestamp(start_time),
+                dt_util.utc_to_timestamp(end_time) if end_time else None,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        )
+        is not None
+    ):
+        return states
+    return cast(
+        MutableMapping[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -77,22 +139,125 @@ def _ws_get_significant_states(
     return JSON_DUMP(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            _get_compressed_significant_states(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
             ),
         )
     )
 
 
+def _ws_get_significant_states_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_id: str,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    last_state: str | None,
+) -> tuple[str | None, str | None]:
+    """Fetch a chunk of history and convert it to a json event message.
+
+    With a minimal response a first state which repeats last_state, the last
+    state sent for the entity, is dropped like the repeated states within a
+    chunk. Returns the message, None if there is no history in the chunk,
+    and the last state sent.
+    """
+    states = _get_compressed_significant_states(
+        hass,
+        start_time,
+        end_time,
+        [entity_id],
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+    if (
+        minimal_response
+        and (entity_states := states.get(entity_id))
+        and entity_states[0][COMPRESSED_STATE_STATE] == last_state
+        and split_entity_id(entity_id)[0] not in history.NEED_ATTRIBUTE_DOMAINS
+    ):
+        if len(entity_states) == 1:
+            del states[entity_id]
+        else:
+            states[entity_id] = entity_states[1:]
+    if not (entity_states := states.get(entity_id)):
+        return None, last_state
+    return (
+        JSON_DUMP(messages.event_message(msg_id, {"states": states})),
+        entity_states[-1][COMPRESSED_STATE_STATE],
+    )
+
+
+async def _async_send_history_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Send the history of the entities in chunks.
+
+    The history of each entity is fetched in time slices of
+    HISTORY_CHUNK_TIME_SPAN and each slice that has states is sent as an
+    event message. The next slice is only fetched once fewer than
+    MAX_PENDING_HISTORY_CHUNKS messages wait to be sent to the client, so a
+    slow client does not make the whole history pile up in memory. A chunk
+    after the first one of an entity starts with the first state in its
+    slice. The final result message is empty.
+    """
+    end_time = end_time or dt_util.utcnow()
+    instance = get_instance(hass)
+    for entity_id in entity_ids:
+        chunk_start_time = start_time
+        chunk_include_start_time_state = include_start_time_state
+        last_state: str | None = None
+        while chunk_start_time < end_time:
+            if not await connection.async_wait_pending_messages(
+                MAX_PENDING_HISTORY_CHUNKS
+            ):
+                return
+            chunk_end_time = min(chunk_start_time + HISTORY_CHUNK_TIME_SPAN, end_time)
+            # The start time is exclusive when fetching history, move it back
+            # to not miss a state changed exactly at the end of the last slice
+            if chunk_start_time is not start_time:
+                chunk_start_time -= _ONE_MICROSECOND
+            message, last_state = await instance.async_add_read_executor_job(
+                _ws_get_significant_states_chunk,
+                hass,
+                msg_id,
+                chunk_start_time,
+                chunk_end_time,
+                entity_id,
+                chunk_include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                last_state,
+            )
+            if message:
+                connection.send_message(message)
+            chunk_start_time = chunk_end_time
+            chunk_include_start_time_state = False
+    connection.send_result(msg_id, {})
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +268,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -154,8 +320,23 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if msg["chunked"]:
+        await _async_send_history_chunks(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -222,20 +403,15 @@ def _generate_historical_response(
     send_empty: bool,
 ) -> tuple[float, dt | None, str | None]:
     """Generate a historical response."""
-    states = cast(
-        MutableMapping[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    states = _get_compressed_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
     last_time_ts = 0.0
     for state_list in states.values():
@@ -278,7 +454,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -311,16 +487,36 @@ def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, An
     return comp_state
 
 
+def _history_compressed_state_json(state: State) -> str:
+    """Serialize a compressed state with attributes to json."""
+    return JSON_DUMP(_history_compressed_state(state, False))
+
+
+def _history_compressed_state_no_attributes_json(state: State) -> str:
+    """Serialize a compressed state without attributes to json."""
+    return JSON_DUMP(_history_compressed_state(state, True))
+
+
 def _events_to_compressed_states(
     events: Iterable[Event], no_attributes: bool
-) -> MutableMapping[str, list[dict[str, Any]]]:
-    """Convert events to a compressed states."""
-    states_by_entity_ids: dict[str, list[dict[str, Any]]] = {}
+) -> MutableMapping[str, list[json_fragment]]:
+    """Convert events to a compressed states.
+
+    The states are serialized once for all streams and embedded as
+    json fragments.
+    """
+    if no_attributes:
+        shape = COMPRESSED_STATE_NO_ATTRIBUTES_SHAPE
+        encoder = _history_compressed_state_no_attributes_json
+    else:
+        shape = COMPRESSED_STATE_SHAPE
+        encoder = _history_compressed_state_json
+    states_by_entity_ids: dict[str, list[json_fragment]] = {}
     for event in events:
         state: State = event.data["new_state"]
         entity_id: str = state.entity_id
         states_by_entity_ids.setdefault(entity_id, []).append(
-            _history_compressed_state(state, no_attributes)
+            json_fragment(state.cached_json(shape, encoder))
         )
     return states_by_entity_ids
 
@@ -1,6 +1,8 @@
 """Manage the history_stats data."""
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
 import datetime
 
@@ -33,6 +35,89 @@ class HistoryState:
     last_changed: float
 
 
+class HistoryWindow:
+    """The states of the entity during the current period.
+
+    The seconds matched and the match count are kept up to date as states
+    are added at the end of the window and its start moves forward, instead
+    of being computed from all the states of the period on every update.
+    The first state is the state at the start of the period.
+    """
+
+    def __init__(self, entity_states: set[str]) -> None:
+        """Initialize an empty window."""
+        self._entity_states = entity_states
+        self._states: deque[HistoryState] = deque()
+        self._start_timestamp = 0.0
+        # The seconds matched until the last state
+        self._seconds_matched = 0.0
+        self._match_count = 0
+
+    def reset(self, start_timestamp: float, states: Iterable[HistoryState]) -> None:
+        """Replace the states with the states of the period starting at start."""
+        self._states.clear()
+        self._start_timestamp = start_timestamp
+        self._seconds_matched = 0.0
+        self._match_count = 0
+        for state in states:
+            self.append(state)
+
+    def append(self, state: HistoryState) -> None:
+        """Add a state at the end of the window."""
+        states = self._states
+        matches = state.state in self._entity_states
+        if not states:
+            # The first state is the state from the start of the period
+            states.append(HistoryState(state.state, self._start_timestamp))
+            self._match_count = 1 if matches else 0
+            return
+        last_state = states[-1]
+        if last_state.state in self._entity_states:
+            self._seconds_matched += state.last_changed - last_state.last_changed
+        elif matches:
+            self._match_count += 1
+        states.append(state)
+
+    def move_start(self, start_timestamp: float) -> None:
+        """Move the start of the window forward.
+
+        The states replaced before the start are removed, the last one of
+        them becomes the state at the start.
+        """
+        if start_timestamp <= self._start_timestamp:
+            return
+        self._start_timestamp = start_timestamp
+        states = self._states
+        entity_states = self._entity_states
+        while len(states) > 1 and states[1].last_changed <= start_timestamp:
+            first_state = states.popleft()
+            if first_state.state in entity_states:
+                self._seconds_matched -= (
+                    states[0].last_changed - first_state.last_changed
+                )
+                if states[0].state not in entity_states:
+                    self._match_count -= 1
+        if not states:
+            return
+        first_state = states[0]
+        if len(states) > 1 and first_state.state in entity_states:
+            self._seconds_matched -= start_timestamp - first_state.last_changed
+        states[0] = HistoryState(first_state.state, start_timestamp)
+
+    def compute_seconds_and_changes(
+        self, now_timestamp: float, end_timestamp: float
+    ) -> tuple[float, int]:
+        """Return the seconds matched and the match count until now."""
+        seconds_matched = self._seconds_matched
+        # Count time elapsed between last history state and end of measure
+        if self._states and (last_state := self._states[-1]).state in (
+            self._entity_states
+        ):
+            measure_end = min(end_timestamp, now_timestamp)
+            seconds_matched += measure_end - last_state.last_changed
+        return seconds_matched, self._match_count
+
+
 class HistoryStats:
     """Manage history stats."""
 
@@ -50,9 +135,10 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
-        self._previous_run_before_start = False
         self._entity_states = set(entity_states)
+        self._history_current_period = HistoryWindow(self._entity_states)
+        self._previous_run_before_start = False
+        self._previous_run_timestamp = 0.0
         self._duration = duration
         self._start = start
         self._end = end
@@ -81,10 +167,12 @@ class HistoryStats:
         previous_period_end_timestamp = floored_timestamp(previous_period_end)
         utc_now = dt_util.utcnow()
         now_timestamp = floored_timestamp(utc_now)
+        previous_run_timestamp = self._previous_run_timestamp
+        self._previous_run_timestamp = now_timestamp
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
+            self._history_current_period.reset(current_period_start_timestamp, ())
             self._previous_run_before_start = True
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
@@ -92,13 +180,21 @@ class HistoryStats:
         # We avoid querying the database if the below did NOT happen:
         #
         # - The previous run happened before the start time
-        # - The start time changed
+        # - The start time moved backwards
+        # - The start time moved forward after the previous period ended
+        #   before the previous run, as the states since are not known
         # - The period shrank in size
         # - The previous period ended before now
         #
         if (
             not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
+            and (
+                current_period_start_timestamp == previous_period_start_timestamp
+                or (
+                    current_period_start_timestamp > previous_period_start_timestamp
+                    and previous_period_end_timestamp >= previous_run_timestamp
+                )
+            )
             and (
                 current_period_end_timestamp == previous_period_end_timestamp
                 or (
@@ -107,6 +203,8 @@ class HistoryStats:
                 )
             )
         ):
+            # A sliding window only drops the states before its new start
+            self._history_current_period.move_start(current_period_start_timestamp)
             new_data = False
             if event and (new_state := event.data["new_state"]) is not None:
                 if (
@@ -130,10 +228,11 @@ class HistoryStats:
             )
             self._previous_run_before_start = False
 
-        seconds_matched, match_count = self._async_compute_seconds_and_changes(
-            now_timestamp,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
+        (
+            seconds_matched,
+            match_count,
+        ) = self._history_current_period.compute_seconds_and_changes(
+            now_timestamp, current_period_end_timestamp
         )
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
@@ -150,10 +249,13 @@ class HistoryStats:
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
+        self._history_current_period.reset(
+            current_period_start_timestamp,
+            (
+                HistoryState(state.state, state.last_changed.timestamp())
+                for state in states
+            ),
+        )
 
     def _state_changes_during_period(
         self, start_ts: float, end_ts: float
@@ -169,40 +271,3 @@ class HistoryStats:
             include_start_time_state=True,
             no_attributes=True,
         ).get(self.entity_id, [])
-
-    def _async_compute_seconds_and_changes(
-        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
-    ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
-        # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
-        previous_state_matches = (
-            self._history_current_period
-            and self._history_current_period[0].state in self._entity_states
-        )
-        last_state_change_timestamp = start_timestamp
-        elapsed = 0.0
-        match_count = 1 if previous_state_matches else 0
-
-        # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
-
-            if previous_state_matches:
-                elapsed += state_change_timestamp - last_state_change_timestamp
-            elif current_state_matches:
-                match_count += 1
-
-            previous_state_matches = current_state_matches
-            last_state_change_timestamp = state_change_timestamp
-
-        # Count time elapsed between last history state and end of measure
-        if previous_state_matches:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_state_change_timestamp
-
-        # Save value in seconds
-        seconds_matched = elapsed
-        return seconds_matched, match_count
@@ -20,13 +20,12 @@ from homeassistant.helpers import (
     entity_registry as er,
     template,
 )
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_same_state
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
+from .state_index import StateTriggerListener, async_get_state_trigger_index
+
 
 def validate_above_below(value):
     """Validate that above and below can co-exist."""
@@ -140,13 +139,28 @@ async def async_attach_trigger(
                 ex,
             )
 
+    # With static thresholds the result only changes with the value
+    skip_unchanged = (
+        value_template is None
+        and not isinstance(below, str)
+        and not isinstance(above, str)
+    )
+
     @callback
-    def state_automation_listener(event):
+    def state_automation_listener(event, old_value, new_value):
         """Listen for state changes and calls action."""
         entity_id = event.data.get("entity_id")
         from_s = event.data.get("old_state")
         to_s = event.data.get("new_state")
 
+        if (
+            skip_unchanged
+            and from_s is not None
+            and to_s is not None
+            and old_value == new_value
+        ):
+            return
+
         @callback
         def call_action():
             """Call action with right context."""
@@ -213,7 +227,9 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = async_get_state_trigger_index(hass).async_add(
+        entity_ids, attribute, None, StateTriggerListener(state_automation_listener)
+    )
 
     @callback
     def async_remove():
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -17,12 +18,13 @@ from homeassistant.helpers import (
 from homeassistant.helpers.event import (
     EventStateChangedData,
     async_track_same_state,
-    async_track_state_change_event,
     process_state_match,
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType, EventType
 
+from .state_index import StateTriggerListener, async_get_state_trigger_index
+
 _LOGGER = logging.getLogger(__name__)
 
 CONF_ENTITY_ID = "entity_id"
@@ -82,6 +84,20 @@ async def async_validate_trigger_config(
     return config
 
 
+def _wanted_values(config: ConfigType) -> list[str] | None:
+    """Return the new values wanted by a trigger if they can be looked up."""
+    to_state = config.get(CONF_TO)
+    if isinstance(to_state, str):
+        to_state = [to_state]
+    if (
+        not isinstance(to_state, list)
+        or MATCH_ALL in to_state
+        or not all(isinstance(value, str) for value in to_state)
+    ):
+        return None
+    return to_state
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
@@ -123,40 +139,14 @@ async def async_attach_trigger(
     _variables = trigger_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: EventType[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
+    def state_automation_listener(
+        event: EventType[EventStateChangedData], old_value: Any, new_value: Any
+    ) -> None:
+        """Listen for matching state changes and calls action."""
         entity = event.data["entity_id"]
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
-
         @callback
         def call_action():
             """Call action with right context."""
@@ -224,7 +214,19 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # When we listen for state changes with `match_all`, we
+    # will trigger even if just an attribute changes. When
+    # we listen to just an attribute, we should ignore all
+    # other attribute changes.
+    listener = StateTriggerListener(
+        state_automation_listener,
+        match_from_state,
+        match_to_state,
+        changed_only=attribute is not None or not match_all,
+    )
+    unsub = async_get_state_trigger_index(hass).async_add(
+        entity_ids, attribute, _wanted_values(config), listener
+    )
 
     @callback
     def async_remove():
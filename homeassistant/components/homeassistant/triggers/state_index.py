@@ -0,0 +1,233 @@
+"""Shared dispatch of state changed events to state based triggers."""
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from dataclasses import dataclass, field
+from itertools import count
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.typing import EventType
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_TRIGGER_INDEX = "homeassistant_state_trigger_index"
+
+StateTriggerActionType = Callable[[EventType[EventStateChangedData], Any, Any], None]
+
+
+def _match_any(value: Any) -> bool:
+    """Match any value."""
+    return True
+
+
+@dataclass(slots=True, eq=False)
+class StateTriggerListener:
+    """A trigger listening to the state or an attribute of entities.
+
+    The action is called with the event and the old and new value when
+    the old value matches match_from and the new value matches match_to.
+    The new value is matched by the index when the new values wanted by
+    the trigger are known up front.
+    """
+
+    action: StateTriggerActionType
+    match_from: Callable[[Any], bool] = _match_any
+    match_to: Callable[[Any], bool] = _match_any
+    # Only call the action when the value changed
+    changed_only: bool = False
+    order: int = field(default=0, init=False)
+
+
+class _ValueListeners:
+    """Listeners of the state or an attribute of an entity."""
+
+    __slots__ = ("by_new_value", "any_new_value")
+
+    def __init__(self) -> None:
+        """Initialize the listeners."""
+        self.by_new_value: dict[Any, list[StateTriggerListener]] = {}
+        self.any_new_value: list[StateTriggerListener] = []
+
+    def __bool__(self) -> bool:
+        """Return if there are listeners."""
+        return bool(self.by_new_value or self.any_new_value)
+
+    def add_matches(
+        self,
+        matches: list[tuple[StateTriggerListener, Any, Any]],
+        old_value: Any,
+        new_value: Any,
+    ) -> int:
+        """Add the listeners matching a value change to matches.
+
+        Returns the number of listener lists which had matches, the matches
+        of different lists are not in attach order.
+        """
+        changed = old_value != new_value
+        lists = 0
+        if any_new_value := self.any_new_value:
+            count_before = len(matches)
+            matches.extend(
+                (listener, old_value, new_value)
+                for listener in any_new_value
+                if (changed or not listener.changed_only)
+                and listener.match_from(old_value)
+                and listener.match_to(new_value)
+            )
+            lists += len(matches) > count_before
+        if not self.by_new_value:
+            return lists
+        try:
+            indexed = self.by_new_value.get(new_value)
+        except TypeError:
+            # Unhashable values are never wanted by indexed listeners
+            return lists
+        if indexed:
+            count_before = len(matches)
+            matches.extend(
+                (listener, old_value, new_value)
+                for listener in indexed
+                if (changed or not listener.changed_only)
+                and listener.match_from(old_value)
+            )
+            lists += len(matches) > count_before
+        return lists
+
+
+def _attach_order(match: tuple[StateTriggerListener, Any, Any]) -> int:
+    """Return the attach order of a matched listener."""
+    return match[0].order
+
+
+def _value(state: State | None, attribute: str | None) -> Any:
+    """Return the state or the attribute of a state."""
+    if state is None:
+        return None
+    if attribute is None:
+        return state.state
+    return state.attributes.get(attribute)
+
+
+class StateTriggerIndex:
+    """Index of the state based triggers by entity, attribute and new value.
+
+    A single listener is registered for each tracked entity. The state or
+    attribute values of a state change are extracted once and the new value
+    is looked up for the triggers which want specific new values, so the
+    actions of the triggers which do not match are never scheduled.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._entities: dict[str, dict[str | None, _ValueListeners]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._order = count()
+
+    @callback
+    def async_add(
+        self,
+        entity_ids: Collection[str],
+        attribute: str | None,
+        new_values: Collection[Any] | None,
+        listener: StateTriggerListener,
+    ) -> CALLBACK_TYPE:
+        """Add a listener for the state or an attribute of entities.
+
+        If new_values is not None, the listener is only called when the new
+        value is one of new_values and its match_to is not used.
+        """
+        listener.order = next(self._order)
+        if new_values is not None:
+            new_values = frozenset(new_values)
+        for entity_id in entity_ids:
+            if (attributes := self._entities.get(entity_id)) is None:
+                attributes = self._entities[entity_id] = {}
+                self._unsubs[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_dispatch
+                )
+            if (listeners := attributes.get(attribute)) is None:
+                listeners = attributes[attribute] = _ValueListeners()
+            if new_values is None:
+                listeners.any_new_value.append(listener)
+                continue
+            for new_value in new_values:
+                listeners.by_new_value.setdefault(new_value, []).append(listener)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the listener."""
+            self._async_remove(entity_ids, attribute, new_values, listener)
+
+        return async_remove
+
+    @callback
+    def _async_remove(
+        self,
+        entity_ids: Collection[str],
+        attribute: str | None,
+        new_values: Collection[Any] | None,
+        listener: StateTriggerListener,
+    ) -> None:
+        """Remove a listener."""
+        for entity_id in entity_ids:
+            attributes = self._entities[entity_id]
+            listeners = attributes[attribute]
+            if new_values is None:
+                listeners.any_new_value.remove(listener)
+            else:
+                by_new_value = listeners.by_new_value
+                for new_value in new_values:
+                    value_listeners = by_new_value[new_value]
+                    value_listeners.remove(listener)
+                    if not value_listeners:
+                        del by_new_value[new_value]
+            if listeners:
+                continue
+            del attributes[attribute]
+            if attributes:
+                continue
+            del self._entities[entity_id]
+            self._unsubs.pop(entity_id)()
+
+    @callback
+    def _async_dispatch(self, event: EventType[EventStateChangedData]) -> None:
+        """Call the actions of the listeners matching a state change."""
+        entity_id = event.data["entity_id"]
+        if not (attributes := self._entities.get(entity_id)):
+            return
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        matches: list[tuple[StateTriggerListener, Any, Any]] = []
+        lists = 0
+        for attribute, listeners in attributes.items():
+            lists += listeners.add_matches(
+                matches, _value(old_state, attribute), _value(new_state, attribute)
+            )
+        # Call the actions in the order the triggers were attached
+        if lists > 1:
+            matches.sort(key=_attach_order)
+        for listener, old_value, new_value in matches:
+            try:
+                listener.action(event, old_value, new_value)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s",
+                    entity_id,
+                    listener.action,
+                )
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    index: StateTriggerIndex | None = hass.data.get(DATA_STATE_TRIGGER_INDEX)
+    if index is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 import logging
@@ -29,9 +30,14 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    Platform,
 )
 from homeassistant.core import Event, HomeAssistant, State, callback
-from homeassistant.helpers import event as event_helper, state as state_helper
+from homeassistant.helpers import (
+    discovery,
+    event as event_helper,
+    state as state_helper,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.entityfilter import (
@@ -51,6 +57,7 @@ from .const import (
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
     CONF_API_VERSION,
     CONF_BUCKET,
+    CONF_COALESCE,
     CONF_COMPONENT_CONFIG,
     CONF_COMPONENT_CONFIG_DOMAIN,
     CONF_COMPONENT_CONFIG_GLOB,
@@ -58,6 +65,7 @@ from .const import (
     CONF_DEFAULT_MEASUREMENT,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_MAX_QUEUE_SIZE,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
@@ -73,11 +81,14 @@ from .const import (
     CONF_TOKEN,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
+    CONF_WRITERS,
     CONNECTION_ERROR,
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
+    DEFAULT_MAX_QUEUE_SIZE,
     DEFAULT_MEASUREMENT_ATTR,
     DEFAULT_SSL_V2,
+    DEFAULT_WRITERS,
     DOMAIN,
     EVENT_NEW_STATE,
     INFLUX_CONF_FIELDS,
@@ -87,8 +98,10 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_WRITERS,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
+    QUEUE_FULL_MESSAGE,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
     RESUMED_MESSAGE,
@@ -185,6 +198,13 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
         vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
             {cv.string: _CUSTOMIZE_ENTITY_SCHEMA}
         ),
+        vol.Optional(CONF_WRITERS, default=DEFAULT_WRITERS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_WRITERS)
+        ),
+        vol.Optional(CONF_COALESCE, default=False): cv.boolean,
+        vol.Optional(
+            CONF_MAX_QUEUE_SIZE, default=DEFAULT_MAX_QUEUE_SIZE
+        ): cv.positive_int,
     }
 )
 
@@ -320,6 +340,22 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
     return event_to_json
 
 
+def _coalesce_points(json: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Keep only the latest point of each series."""
+    points: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for point in json:
+        key = (
+            point[INFLUX_CONF_MEASUREMENT],
+            *sorted(
+                (tag, str(value)) for tag, value in point[INFLUX_CONF_TAGS].items()
+            ),
+        )
+        # Move the series to the end to keep the points in time order
+        points.pop(key, None)
+        points[key] = point
+    return list(points.values())
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
@@ -492,7 +528,16 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        conf[CONF_WRITERS],
+        conf[CONF_COALESCE],
+        conf[CONF_MAX_QUEUE_SIZE],
+        convert_include_exclude_filter(conf),
+    )
     instance.start()
 
     def shutdown(event):
@@ -503,28 +548,80 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, shutdown)
 
+    discovery.load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+
     return True
 
 
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
-
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    """A threaded event handler class.
+
+    The events are converted to points in batches by the thread and the
+    batches are written by a pool of writers when there is more than one.
+    """
+
+    def __init__(
+        self,
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        writers=DEFAULT_WRITERS,
+        coalesce=False,
+        max_queue_size=0,
+        entity_filter=None,
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
-        self.queue = queue.Queue()
+        self.queue = queue.Queue(max_queue_size)
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.coalesce = coalesce
+        self.entity_filter = entity_filter
         self.write_errors = 0
+        self.write_latency: float | None = None
         self.shutdown = False
+        self._lock = threading.Lock()
+        self._dropped_full = 0
+        self._dropped_old = 0
+        self._queue_full = False
+        self._writer_pool: ThreadPoolExecutor | None = None
+        if writers > 1:
+            self._writer_pool = ThreadPoolExecutor(
+                max_workers=writers, thread_name_prefix=f"{DOMAIN}_writer"
+            )
+            self._free_writers = threading.Semaphore(writers)
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of events waiting to be written."""
+        return self.queue.qsize()
+
+    @property
+    def dropped_points(self) -> int:
+        """Return the number of events dropped because of the backlog."""
+        return self._dropped_full + self._dropped_old
+
     @callback
     def _event_listener(self, event):
         """Listen for new messages on the bus and queue them for Influx."""
+        # Filtered out entities would take the room of other events in the queue
+        if self.entity_filter is not None and not self.entity_filter(
+            event.data["entity_id"]
+        ):
+            return
         item = (time.monotonic(), event)
-        self.queue.put(item)
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self._dropped_full += 1
+            if not self._queue_full:
+                self._queue_full = True
+                _LOGGER.warning(QUEUE_FULL_MESSAGE, self.queue.maxsize)
+        else:
+            self._queue_full = False
 
     @staticmethod
     def batch_timeout():
@@ -560,19 +657,26 @@ class InfluxThread(threading.Thread):
                         dropped += 1
 
         if dropped:
+            self._dropped_old += dropped
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
+        if self.coalesce and len(json) > 1:
+            json = _coalesce_points(json)
+
         return count, json
 
     def write_to_influxdb(self, json):
         """Write preprocessed events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
             try:
+                start = time.monotonic()
                 self.influx.write(json)
+                self.write_latency = time.monotonic() - start
 
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
+                with self._lock:
+                    if self.write_errors:
+                        _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+                        self.write_errors = 0
 
                 _LOGGER.debug(WROTE_MESSAGE, len(json))
                 break
@@ -583,19 +687,36 @@ class InfluxThread(threading.Thread):
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
                 else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    with self._lock:
+                        if not self.write_errors:
+                            _LOGGER.error(err)
+                        self.write_errors += len(json)
 
-    def run(self):
-        """Process incoming events."""
-        while not self.shutdown:
-            count, json = self.get_events_json()
+    def _write_batch(self, count, json):
+        """Write a batch and mark its events as done."""
+        try:
             if json:
                 self.write_to_influxdb(json)
+        finally:
             for _ in range(count):
                 self.queue.task_done()
 
+    def run(self):
+        """Process incoming events."""
+        while not self.shutdown:
+            count, json = self.get_events_json()
+            if self._writer_pool is None:
+                self._write_batch(count, json)
+                continue
+            # Converting waits for a free writer, the queue fills up
+            # and drops events instead of growing when writes are slow
+            self._free_writers.acquire()
+            self._writer_pool.submit(self._write_batch, count, json).add_done_callback(
+                lambda _: self._free_writers.release()
+            )
+        if self._writer_pool is not None:
+            self._writer_pool.shutdown()
+
     def block_till_done(self):
         """Block till all events processed."""
         self.queue.join()
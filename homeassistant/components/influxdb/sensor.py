@@ -1,6 +1,8 @@
 """InfluxDB component which allows you to get data from an Influx database."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import datetime
 import logging
 from typing import Final
@@ -9,7 +11,10 @@ import voluptuous as vol
 
 from homeassistant.components.sensor import (
     PLATFORM_SCHEMA as SENSOR_PLATFORM_SCHEMA,
+    SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.const import (
     CONF_API_VERSION,
@@ -18,15 +23,22 @@ from homeassistant.const import (
     CONF_UNIT_OF_MEASUREMENT,
     CONF_VALUE_TEMPLATE,
     EVENT_HOMEASSISTANT_STOP,
+    EntityCategory,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import PlatformNotReady, TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
 from homeassistant.util import Throttle
 
-from . import create_influx_url, get_influx_connection, validate_version_specific_config
+from . import (
+    InfluxThread,
+    create_influx_url,
+    get_influx_connection,
+    validate_version_specific_config,
+)
 from .const import (
     API_VERSION_2,
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
@@ -49,6 +61,7 @@ from .const import (
     DEFAULT_GROUP_FUNCTION,
     DEFAULT_RANGE_START,
     DEFAULT_RANGE_STOP,
+    DOMAIN,
     INFLUX_CONF_VALUE,
     INFLUX_CONF_VALUE_V2,
     LANGUAGE_FLUX,
@@ -70,6 +83,52 @@ _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL: Final = datetime.timedelta(seconds=60)
 
 
+@dataclass
+class InfluxExportRequiredKeysMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[InfluxThread], StateType]
+
+
+@dataclass
+class InfluxExportSensorEntityDescription(
+    SensorEntityDescription, InfluxExportRequiredKeysMixin
+):
+    """Describes a sensor of the InfluxDB export."""
+
+
+EXPORT_SENSOR_TYPES: tuple[InfluxExportSensorEntityDescription, ...] = (
+    InfluxExportSensorEntityDescription(
+        key="queue_depth",
+        name="InfluxDB export queue depth",
+        icon="mdi:tray-full",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda instance: instance.queue_depth,
+    ),
+    InfluxExportSensorEntityDescription(
+        key="dropped_points",
+        name="InfluxDB export dropped points",
+        icon="mdi:tray-remove",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda instance: instance.dropped_points,
+    ),
+    InfluxExportSensorEntityDescription(
+        key="write_latency",
+        name="InfluxDB export write latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda instance: (
+            None if instance.write_latency is None else instance.write_latency * 1000
+        ),
+    ),
+)
+
+
 def _merge_connection_config_into_query(conf, query):
     """Merge connection details into each configured query."""
     for key in conf:
@@ -161,6 +220,15 @@ def setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the InfluxDB component."""
+    if discovery_info is not None:
+        # Sensors of the export set up by the integration
+        instance: InfluxThread = hass.data[DOMAIN]
+        add_entities(
+            InfluxExportSensor(instance, description)
+            for description in EXPORT_SENSOR_TYPES
+        )
+        return
+
     try:
         influx = get_influx_connection(config, test_read=True)
     except ConnectionError as exc:
@@ -256,6 +324,26 @@ class InfluxSensor(SensorEntity):
         self._state = value
 
 
+class InfluxExportSensor(SensorEntity):
+    """Sensor for the state of the InfluxDB export."""
+
+    entity_description: InfluxExportSensorEntityDescription
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self, instance: InfluxThread, description: InfluxExportSensorEntityDescription
+    ) -> None:
+        """Initialize the sensor."""
+        self._instance = instance
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_export_{description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self._instance)
+
+
 class InfluxFluxSensorData:
     """Class for handling the data retrieval from Influx with Flux query."""
 
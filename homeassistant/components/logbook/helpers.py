@@ -217,6 +217,20 @@ def async_subscribe_events(
     )
 
 
+def page_cursor(key: tuple[float, int]) -> str:
+    """Convert the (time_fired_ts, row_id) key of a page to a cursor."""
+    return f"{key[0]!r}:{key[1]}"
+
+
+def parse_page_cursor(cursor: str) -> tuple[float, int] | None:
+    """Convert a cursor to the (time_fired_ts, row_id) key of a page."""
+    time_fired_ts, _, row_id = cursor.partition(":")
+    try:
+        return (float(time_fired_ts), int(row_id))
+    except ValueError:
+        return None
+
+
 def is_sensor_continuous(ent_reg: er.EntityRegistry, entity_id: str) -> bool:
     """Determine if a sensor is continuous by checking its state class.
 
@@ -6,10 +6,12 @@ from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -21,6 +23,7 @@ from homeassistant.components.recorder.models import (
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import (
+    chunked,
     execute_stmt_lambda_element,
     session_scope,
 )
@@ -62,11 +65,16 @@ from .const import (
 )
 from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
-from .queries import statement_for_request
+from .queries import context_rows_statement, statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# The number of rows humanified before the event cache is cleared
+HUMANIFY_BATCH_SIZE = 1000
+# The maximum number of context ids looked up in one query
+CONTEXT_LOOKUP_CHUNK_SIZE = 256
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -142,32 +150,136 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
+            stmt = self._statement_for_request(session, start_day, end_day)
+            if self.limited_select:
+                rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            else:
+                # Stream the rows of long periods
+                rows = execute_stmt_lambda_element(
+                    session,
+                    stmt,
+                    start_day,
+                    end_day,
+                    HUMANIFY_BATCH_SIZE,
+                    orm_rows=False,
                 )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
+            return self._humanify_batches(rows)
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        after: tuple[float, int] | None = None,
+    ) -> tuple[list[dict[str, Any]], tuple[float, int] | None]:
+        """Get the events of a page of rows for a period of time.
+
+        Pages are selected by the (time_fired_ts, row_id) key of the rows.
+        Returns the events of at most about limit rows after the after key
+        and the key to pass as after for the next page, or None if this was
+        the last page. Rows with the same key are always on the same page.
+        """
+        with session_scope(hass=self.hass, read_only=True) as session:
+            fetch = limit + 1
+            while True:
+                rows = cast(
+                    Sequence[Row],
+                    execute_stmt_lambda_element(
+                        session,
+                        self._statement_for_request(
+                            session, start_day, end_day, after, fetch
+                        ),
+                        orm_rows=False,
+                    ),
                 )
+                end = limit
+                while end < len(rows) and _row_key(rows[end]) == _row_key(
+                    rows[end - 1]
+                ):
+                    end += 1
+                if end < len(rows):
+                    rows = rows[:end]
+                    next_after: tuple[float, int] | None = _row_key(rows[-1])
+                    break
+                if len(rows) < fetch:
+                    next_after = None
+                    break
+                # All the rows after the limit have the same key
+                fetch *= 2
+            if after is not None and rows:
+                self._memoize_contexts_before(session, start_day, end_day, after, rows)
+        return self._humanify_batches(rows), next_after
+
+    def _statement_for_request(
+        self,
+        session: Session,
+        start_day: dt,
+        end_day: dt,
+        after: tuple[float, int] | None = None,
+        limit: int | None = None,
+    ) -> StatementLambdaElement:
+        """Generate the statement for the rows of a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
-            )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+            after,
+            limit,
+        )
+
+    def _memoize_contexts_before(
+        self,
+        session: Session,
+        start_day: dt,
+        end_day: dt,
+        before: tuple[float, int],
+        rows: Sequence[Row],
+    ) -> None:
+        """Memoize the contexts of the rows before the page.
+
+        The first row of a context or of a parent context of the rows of
+        the page can be before the page. Those rows are memoized first so
+        the contexts are resolved the same way as without pages.
+        """
+        context_id_bins = {row.context_id_bin for row in rows} | {
+            row.context_parent_id_bin for row in rows
+        }
+        context_id_bins.discard(None)
+        stmt = self._statement_for_request(session, start_day, end_day)
+        memoize_context = self.logbook_run.context_lookup.setdefault
+        for context_id_bins_chunk in chunked(
+            sorted(context_id_bins), CONTEXT_LOOKUP_CHUNK_SIZE
+        ):
+            for row in execute_stmt_lambda_element(
+                session,
+                context_rows_statement(stmt, before, context_id_bins_chunk),
+                orm_rows=False,
+            ):
+                memoize_context(row.context_id_bin, row)
+
+    def _humanify_batches(self, rows: Sequence[Row] | Result) -> list[dict[str, Any]]:
+        """Humanify rows in batches to bound the size of the event cache."""
+        logbook_events: list[dict[str, Any]] = []
+        for batch in chunked(rows, HUMANIFY_BATCH_SIZE):
+            logbook_events.extend(self.humanify(batch))
+            self.logbook_run.event_cache.clear()
+        return logbook_events
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
@@ -370,6 +482,11 @@ class ContextAugmenter:
             data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
 
 
+def _row_key(row: Row) -> tuple[float, int]:
+    """Return the (time_fired_ts, row_id) key of a row."""
+    return (row.time_fired_ts, row.row_id)
+
+
 def _rows_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
     """Check of rows match by using the same method as Events __hash__."""
     return bool(
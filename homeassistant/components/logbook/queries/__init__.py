@@ -3,8 +3,11 @@ from __future__ import annotations
 
 from collections.abc import Collection
 from datetime import datetime as dt
+from math import inf, nextafter
 
+from sqlalchemy import and_, or_, select
 from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.sql.selectable import CompoundSelect, Select, Subquery
 
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import ulid_to_bytes_or_none
@@ -26,10 +29,118 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    after: tuple[float, int] | None = None,
+    limit: int | None = None,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    With a limit the statement selects a page of at most limit rows after
+    the after key, ordered by the (time_fired_ts, row_id) key.
+    """
     start_day = dt_util.utc_to_timestamp(start_day_dt)
     end_day = dt_util.utc_to_timestamp(end_day_dt)
+    if after is not None:
+        # The queries select the rows after start_day, the previous
+        # float also selects the rows at the time of the after key
+        start_day = max(start_day, nextafter(after[0], -inf))
+    stmt = _statement_for_request(
+        start_day,
+        end_day,
+        event_type_ids,
+        entity_ids,
+        states_metadata_ids,
+        device_ids,
+        filters,
+        context_id,
+    )
+    if limit is None:
+        return stmt
+    rows_limit = limit
+    if after is None:
+        stmt += lambda s: _select_page(s, rows_limit)
+        return stmt
+    after_ts, after_row_id = after
+    stmt += lambda s: _select_page_after(s, after_ts, after_row_id, rows_limit)
+    return stmt
+
+
+def context_rows_statement(
+    stmt: StatementLambdaElement,
+    before: tuple[float, int],
+    context_id_bins: list[bytes],
+) -> StatementLambdaElement:
+    """Generate a statement for the rows of a request linking context ids.
+
+    Selects the rows of the statement with the given context ids up to and
+    including the before key, ordered by the (time_fired_ts, row_id) key.
+    """
+    before_ts, before_row_id = before
+    stmt += lambda s: _select_context_rows(s, before_ts, before_row_id, context_id_bins)
+    return stmt
+
+
+def _select_rows(stmt: Select | CompoundSelect) -> tuple[Select, Subquery]:
+    """Select the rows of a logbook statement to filter them by key."""
+    rows = stmt.order_by(None).subquery()
+    # The outer joins of the context only rows select a row
+    # without an event or a state for contexts without them
+    return select(rows).where(rows.c.row_id.is_not(None)), rows
+
+
+def _select_page(stmt: Select | CompoundSelect, limit: int) -> Select:
+    """Select the first page of rows."""
+    sel, rows = _select_rows(stmt)
+    return sel.order_by(rows.c.time_fired_ts, rows.c.row_id).limit(limit)
+
+
+def _select_page_after(
+    stmt: Select | CompoundSelect, after_ts: float, after_row_id: int, limit: int
+) -> Select:
+    """Select the page of rows after the after key."""
+    sel, rows = _select_rows(stmt)
+    return (
+        sel.where(
+            or_(
+                rows.c.time_fired_ts > after_ts,
+                and_(rows.c.time_fired_ts == after_ts, rows.c.row_id > after_row_id),
+            )
+        )
+        .order_by(rows.c.time_fired_ts, rows.c.row_id)
+        .limit(limit)
+    )
+
+
+def _select_context_rows(
+    stmt: Select | CompoundSelect,
+    before_ts: float,
+    before_row_id: int,
+    context_id_bins: list[bytes],
+) -> Select:
+    """Select the rows with the context ids up to and including the before key."""
+    sel, rows = _select_rows(stmt)
+    return (
+        sel.where(rows.c.context_id_bin.in_(context_id_bins))
+        .where(
+            or_(
+                rows.c.time_fired_ts < before_ts,
+                and_(rows.c.time_fired_ts == before_ts, rows.c.row_id <= before_row_id),
+            )
+        )
+        .order_by(rows.c.time_fired_ts, rows.c.row_id)
+    )
+
+
+def _statement_for_request(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    entity_ids: list[str] | None,
+    states_metadata_ids: Collection[int] | None,
+    device_ids: list[str] | None,
+    filters: Filters | None,
+    context_id: str | None,
+) -> StatementLambdaElement:
+    """Generate the logbook statement for the time frame of a logbook request."""
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
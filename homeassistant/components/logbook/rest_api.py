@@ -18,7 +18,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
-from .helpers import async_determine_event_types
+from .helpers import async_determine_event_types, page_cursor, parse_page_cursor
 from .processor import EventProcessor
 
 
@@ -95,6 +95,24 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTPStatus.BAD_REQUEST
             )
 
+        limit: int | None = None
+        if (limit_str := request.query.get("limit")) is not None:
+            try:
+                limit = int(limit_str)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return self.json_message("Invalid limit", HTTPStatus.BAD_REQUEST)
+
+        after: tuple[float, int] | None = None
+        if (cursor := request.query.get("cursor")) is not None:
+            if limit is None:
+                return self.json_message(
+                    "A cursor requires a limit", HTTPStatus.BAD_REQUEST
+                )
+            if (after := parse_page_cursor(cursor)) is None:
+                return self.json_message("Invalid cursor", HTTPStatus.BAD_REQUEST)
+
         event_types = async_determine_event_types(hass, entity_ids, None)
         event_processor = EventProcessor(
             hass,
@@ -108,13 +126,26 @@ class LogbookView(HomeAssistantView):
 
         def json_events() -> web.Response:
             """Fetch events and generate JSON."""
-            return self.json(
-                event_processor.get_events(
-                    start_day,
-                    end_day,
+            if limit is None:
+                return self.json(
+                    event_processor.get_events(
+                        start_day,
+                        end_day,
+                    )
                 )
+            # With a limit the events are sent in pages
+            # with the cursor of the next page
+            events, next_after = event_processor.get_events_page(
+                start_day, end_day, limit, after
+            )
+            return self.json(
+                {
+                    "events": events,
+                    "next_cursor": page_cursor(next_after) if next_after else None,
+                }
             )
 
         return cast(
-            web.Response, await get_instance(hass).async_add_executor_job(json_events)
+            web.Response,
+            await get_instance(hass).async_add_read_executor_job(json_events),
         )
@@ -24,6 +24,8 @@ from .helpers import (
     async_determine_event_types,
     async_filter_entities,
     async_subscribe_events,
+    page_cursor,
+    parse_page_cursor,
 )
 from .models import LogbookConfig, async_event_to_row
 from .processor import EventProcessor
@@ -167,7 +169,7 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[str, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -444,6 +446,29 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    limit: int,
+    after: tuple[float, int] | None,
+    event_processor: EventProcessor,
+) -> str:
+    """Fetch a page of events and convert it to json in the executor."""
+    events, next_after = event_processor.get_events_page(
+        start_time, end_time, limit, after
+    )
+    return JSON_DUMP(
+        messages.result_message(
+            msg_id,
+            {
+                "events": events,
+                "next_cursor": page_cursor(next_after) if next_after else None,
+            },
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -452,6 +477,8 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): str,
     }
 )
 @websocket_api.async_response
@@ -477,8 +504,24 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    limit: int | None = msg.get("limit")
+    after: tuple[float, int] | None = None
+    if cursor := msg.get("cursor"):
+        if limit is None:
+            connection.send_error(
+                msg["id"], "invalid_cursor", "A cursor requires a limit"
+            )
+            return
+        if (after := parse_page_cursor(cursor)) is None:
+            connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+            return
+    # With a limit the events are sent in pages with the cursor of the next page
+    empty_result: dict[str, Any] | list[dict[str, Any]] = (
+        [] if limit is None else {"events": [], "next_cursor": None}
+    )
+
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(msg["id"], empty_result)
         return
 
     device_ids = msg.get("device_ids")
@@ -488,7 +531,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(msg["id"], empty_result)
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -503,8 +546,22 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if limit is not None:
+        connection.send_message(
+            await get_instance(hass).async_add_read_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                limit,
+                after,
+                event_processor,
+            )
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
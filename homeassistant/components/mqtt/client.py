@@ -2,9 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
+from collections.abc import Callable, Coroutine, Iterable, Iterator, MutableMapping
 from dataclasses import dataclass
-from functools import lru_cache
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -14,6 +13,7 @@ from typing import TYPE_CHECKING, Any
 import uuid
 
 import certifi
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -93,6 +93,7 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
     "https://developers.home-assistant.io/blog/2023-057-21-change-naming-mqtt-entities/"
@@ -223,7 +224,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -295,6 +295,117 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+def _topic_matches_filter(topic_filter: str, topic: str) -> bool:
+    """Return if a topic matches a subscription filter which may hold wildcards."""
+    if topic[:1] == "$" and topic_filter[:1] in ("+", "#"):
+        return False
+    filter_levels = topic_filter.split("/")
+    topic_levels = topic.split("/")
+    for idx, level in enumerate(filter_levels):
+        if level == "#":
+            return True
+        if idx >= len(topic_levels) or level not in ("+", topic_levels[idx]):
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+class _TopicTrieNode:
+    """Node of a subscription trie, one per topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: dict[Subscription, int] = {}
+
+
+class SubscriptionTrie:
+    """Trie of subscriptions keyed on topic levels.
+
+    Matching a topic walks the trie level by level following the literal
+    level, the `+` and the `#` branches, so the cost is proportional to the
+    topic depth rather than to the number of subscriptions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+        self._sequence = 0
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions in insertion order."""
+        found: dict[Subscription, int] = {}
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            found.update(node.subscriptions)
+            nodes.extend(node.children.values())
+        return iter(sorted(found, key=found.__getitem__))
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        self._sequence += 1
+        node.subscriptions[subscription] = self._sequence
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError if the subscription is not in the trie.
+        """
+        path = [self._root]
+        for level in subscription.topic.split("/"):
+            path.append(path[-1].children[level])
+        del path[-1].subscriptions[subscription]
+        # Prune the branch up to the first node still in use
+        for level in reversed(subscription.topic.split("/")):
+            node = path.pop()
+            if node.subscriptions or node.children:
+                break
+            del path[-1].children[level]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if there is a subscription on exactly this filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic in insertion order."""
+        # Wildcards at the first level do not match topics starting with $
+        wildcards = topic[:1] != "$"
+        found: dict[Subscription, int] = {}
+        nodes = [self._root]
+        for level in topic.split("/"):
+            next_nodes: list[_TopicTrieNode] = []
+            for node in nodes:
+                children = node.children
+                if wildcards:
+                    if (multi_level := children.get("#")) is not None:
+                        found.update(multi_level.subscriptions)
+                    if (single_level := children.get("+")) is not None:
+                        next_nodes.append(single_level)
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+            if not (nodes := next_nodes):
+                break
+            wildcards = True
+        for node in nodes:
+            found.update(node.subscriptions)
+            # A `#` filter also matches its parent level
+            if (multi_level := node.children.get("#")) is not None:
+                found.update(multi_level.subscriptions)
+        return sorted(found, key=found.__getitem__)
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -387,7 +498,10 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
+        self._matching_subscriptions_cache: MutableMapping[
+            str, list[Subscription]
+        ] = LRU(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -490,8 +604,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_filter(topic)
         )
 
     async def async_publish(
@@ -572,30 +686,26 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if _is_simple_match(subscription.topic):
             self._simple_subscriptions.setdefault(subscription.topic, []).append(
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
+        self._async_invalidate_matching_subscriptions(subscription.topic)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -608,6 +718,22 @@ class MQTT:
                 self._wildcard_subscriptions.remove(subscription)
         except (KeyError, ValueError) as ex:
             raise HomeAssistantError("Can't remove subscription twice") from ex
+        self._async_invalidate_matching_subscriptions(topic)
+
+    @callback
+    def _async_invalidate_matching_subscriptions(self, topic_filter: str) -> None:
+        """Drop the cached matches of topics affected by a subscription filter."""
+        cache = self._matching_subscriptions_cache
+        if _is_simple_match(topic_filter):
+            if topic_filter in cache:
+                del cache[topic_filter]
+            return
+        for topic in [
+            topic
+            for topic in cache.keys()  # noqa: SIM118
+            if _topic_matches_filter(topic_filter, topic)
+        ]:
+            del cache[topic]
 
     @callback
     def _async_queue_subscriptions(
@@ -640,11 +766,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -654,7 +777,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -815,14 +937,16 @@ class MQTT:
         """Message received callback."""
         self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+        """Return the subscriptions matching a topic."""
+        cache = self._matching_subscriptions_cache
+        if (subscriptions := cache.get(topic)) is not None:
+            return subscriptions
+        subscriptions = [
+            *self._simple_subscriptions.get(topic, ()),
+            *self._wildcard_subscriptions.match(topic),
+        ]
+        cache[topic] = subscriptions
         return subscriptions
 
     @callback
@@ -967,13 +1091,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
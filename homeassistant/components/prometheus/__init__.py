@@ -1,13 +1,17 @@
 """Support for Prometheus metrics export."""
+from __future__ import annotations
+
 from contextlib import suppress
+from dataclasses import dataclass
 import logging
 import string
+from typing import Any
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.utils import floatToGoString
 import voluptuous as vol
 
-from homeassistant import core as hacore
 from homeassistant.components.climate import (
     ATTR_CURRENT_TEMPERATURE,
     ATTR_HVAC_ACTION,
@@ -39,7 +43,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
@@ -92,12 +96,8 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def setup(hass: HomeAssistant, config: ConfigType) -> bool:
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(
-        PrometheusView(prometheus_client, config[DOMAIN][CONF_REQUIRES_AUTH])
-    )
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -120,18 +120,137 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
-    hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
-    hass.bus.listen(
+    hass.http.register_view(PrometheusView(metrics, conf[CONF_REQUIRES_AUTH]))
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
+    hass.bus.async_listen(
         EVENT_ENTITY_REGISTRY_UPDATED, metrics.handle_entity_registry_updated
     )
 
-    for state in hass.states.all():
+    for state in hass.states.async_all():
         if entity_filter(state.entity_id):
             metrics.handle_state(state)
 
     return True
 
 
+def _escape(value: str) -> str:
+    """Escape a documentation string for the Prometheus text format."""
+    return value.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def _label_string(labelnames: list[str], label_values: tuple[str, ...]) -> str:
+    """Return the labels of a sample in the Prometheus text format."""
+    labels = ",".join(
+        [
+            '{}="{}"'.format(name, _escape(value).replace('"', r"\""))
+            for name, value in sorted(zip(labelnames, label_values))
+        ]
+    )
+    return f"{{{labels}}}"
+
+
+@dataclass(slots=True)
+class EntityMetrics:
+    """The label values and metric children of an entity."""
+
+    friendly_name: Any
+    label_values: tuple[str, ...]
+    children: dict[tuple[CachedMetric, tuple[str, ...]], Any]
+
+
+class CachedMetric:
+    """A metric which keeps the exposition text of each label set.
+
+    Only the label sets updated since the last scrape are rendered again.
+    """
+
+    __slots__ = (
+        "metric",
+        "_labelnames",
+        "_header",
+        "_created_name",
+        "_created_header",
+        "_label_strings",
+        "_lines",
+        "_created_lines",
+        "_updated",
+    )
+
+    def __init__(self, metric: Any, labelnames: list[str]) -> None:
+        """Initialize the cached metric."""
+        self.metric = metric
+        self._labelnames = labelnames
+        self._header: str | None = None
+        self._created_name = ""
+        self._created_header = ""
+        self._label_strings: dict[tuple[str, ...], str] = {}
+        self._lines: dict[tuple[str, ...], str] = {}
+        self._created_lines: dict[tuple[str, ...], str] = {}
+        self._updated: dict[tuple[str, ...], Any] = {}
+
+    def labels(self, label_values: tuple[str, ...]) -> Any:
+        """Return the child of a label set."""
+        return self.metric.labels(*label_values)
+
+    def mark_updated(self, label_values: tuple[str, ...], child: Any) -> None:
+        """Mark the child of a label set as updated."""
+        self._updated[label_values] = child
+
+    def remove(self, label_values: tuple[str, ...]) -> None:
+        """Remove a label set."""
+        with suppress(KeyError):
+            self.metric.remove(*label_values)
+        self._label_strings.pop(label_values, None)
+        self._lines.pop(label_values, None)
+        self._created_lines.pop(label_values, None)
+        self._updated.pop(label_values, None)
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format."""
+        if self._header is None:
+            family = self.metric.describe()[0]
+            name = family.name
+            mtype = family.type
+            if mtype == "counter":
+                name = f"{name}_total"
+            documentation = _escape(family.documentation)
+            self._header = f"# HELP {name} {documentation}\n# TYPE {name} {mtype}\n"
+            self._created_name = f"{family.name}_created"
+            self._created_header = (
+                f"# HELP {self._created_name} {documentation}\n"
+                f"# TYPE {self._created_name} gauge\n"
+            )
+        if self._updated:
+            self._render_updated()
+        text = self._header + "".join(self._lines.values())
+        if self._created_lines:
+            text += self._created_header + "".join(self._created_lines.values())
+        return text
+
+    def _render_updated(self) -> None:
+        """Render the lines of the updated label sets."""
+        label_strings = self._label_strings
+        lines = self._lines
+        created_lines = self._created_lines
+        for label_values, child in self._updated.items():
+            if (label_string := label_strings.get(label_values)) is None:
+                label_string = label_strings[label_values] = _label_string(
+                    self._labelnames, label_values
+                )
+            for family in child.collect():
+                for sample in family.samples:
+                    line = (
+                        f"{sample.name}{label_string} "
+                        f"{floatToGoString(sample.value)}\n"
+                    )
+                    if sample.name == self._created_name:
+                        created_lines[label_values] = line
+                    else:
+                        lines[label_values] = line
+        self._updated.clear()
+
+
 class PrometheusMetrics:
     """Model all of the metrics which should be exposed to Prometheus."""
 
@@ -164,9 +283,17 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
-        self._metrics = {}
+        self._metrics: dict[str, CachedMetric] = {}
+        self._entity_metrics: dict[str, EntityMetrics] = {}
         self._climate_units = climate_units
+        # The domain handlers are looked up once instead of on every state change
+        self._handlers = {
+            name.removeprefix("_handle_"): getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_handle_")
+        }
 
+    @callback
     def handle_state_changed_event(self, event):
         """Handle new messages from the bus."""
         if (state := event.data.get("new_state")) is None:
@@ -176,46 +303,55 @@ class PrometheusMetrics:
             _LOGGER.debug("Filtered out entity %s", state.entity_id)
             return
 
-        if (old_state := event.data.get("old_state")) is not None and (
-            old_friendly_name := old_state.attributes.get(ATTR_FRIENDLY_NAME)
-        ) != state.attributes.get(ATTR_FRIENDLY_NAME):
-            self._remove_labelsets(old_state.entity_id, old_friendly_name)
-
         self.handle_state(state)
 
+    @callback
     def handle_state(self, state):
         """Add/update a state in Prometheus."""
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
 
-        ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        entity_metrics = self._entity_metrics.get(entity_id)
+        if entity_metrics is None or entity_metrics.friendly_name != friendly_name:
+            # The label sets of the old friendly name are removed
+            if entity_metrics is not None:
+                self._remove_labelsets(entity_id)
+            self._entity_metrics[entity_id] = EntityMetrics(
+                friendly_name, (entity_id, str(friendly_name), state.domain), {}
+            )
 
-        handler = f"_handle_{domain}"
+        ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
 
-        if hasattr(self, handler) and state.state not in ignored_states:
-            getattr(self, handler)(state)
+        if (
+            handler := self._handlers.get(state.domain)
+        ) and state.state not in ignored_states:
+            handler(state)
 
-        labels = self._labels(state)
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        self._child(state_change, state).inc()
 
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable or unknown state)",
         )
-        entity_available.labels(**labels).set(float(state.state not in ignored_states))
+        self._child(entity_available, state).set(
+            float(state.state not in ignored_states)
+        )
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
             self.prometheus_cli.Gauge,
             "The last_updated timestamp",
         )
-        last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
+        self._child(last_updated_time_seconds, state).set(
+            state.last_updated.timestamp()
+        )
 
+    @callback
     def handle_entity_registry_updated(self, event):
         """Listen for deleted, disabled or renamed entities and remove them from the Prometheus Registry."""
         if (action := event.data.get("action")) in (None, "create"):
@@ -239,20 +375,52 @@ class PrometheusMetrics:
         if metrics_entity_id:
             self._remove_labelsets(metrics_entity_id)
 
-    def _remove_labelsets(self, entity_id, friendly_name=None):
-        """Remove labelsets matching the given entity id from all metrics."""
-        for _, metric in self._metrics.items():
-            for sample in metric.collect()[0].samples:
-                if sample.labels["entity"] == entity_id and (
-                    not friendly_name or sample.labels["friendly_name"] == friendly_name
-                ):
-                    _LOGGER.debug(
-                        "Removing labelset from %s for entity_id: %s",
-                        sample.name,
-                        entity_id,
-                    )
-                    with suppress(KeyError):
-                        metric.remove(*sample.labels.values())
+    def _remove_labelsets(self, entity_id):
+        """Remove the labelsets of the given entity id from all metrics."""
+        if (entity_metrics := self._entity_metrics.pop(entity_id, None)) is None:
+            return
+        for (metric, _), (label_values, _) in entity_metrics.children.items():
+            _LOGGER.debug(
+                "Removing labelset from %s for entity_id: %s",
+                metric.metric,
+                entity_id,
+            )
+            metric.remove(label_values)
+
+    def _child(self, metric, state, *extra_label_values):
+        """Return the child of a metric for the labels of a state.
+
+        The children are cached per entity so the labels are only
+        resolved the first time an entity updates a metric.
+        """
+        entity_metrics = self._entity_metrics[state.entity_id]
+        children = entity_metrics.children
+        key = (metric, extra_label_values)
+        try:
+            label_values, child = children[key]
+        except KeyError:
+            label_values = entity_metrics.label_values
+            if extra_label_values:
+                label_values = (
+                    *label_values,
+                    *(str(value) for value in extra_label_values),
+                )
+            child = metric.labels(label_values)
+            children[key] = (label_values, child)
+        metric.mark_updated(label_values, child)
+        return child
+
+    def generate_latest(self) -> bytes:
+        """Return the metrics in the Prometheus text format.
+
+        The metrics of the other collectors come first, like when all the
+        metrics were in the same registry.
+        """
+        return self.prometheus_cli.generate_latest(
+            self.prometheus_cli.REGISTRY
+        ) + "".join([metric.render() for metric in self._metrics.values()]).encode(
+            "utf-8"
+        )
 
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
@@ -264,26 +432,25 @@ class PrometheusMetrics:
 
             try:
                 value = float(value)
-                metric.labels(**self._labels(state)).set(value)
+                self._child(metric, state).set(value)
             except (ValueError, TypeError):
                 pass
 
     def _metric(self, metric, factory, documentation, extra_labels=None):
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
-
         try:
             return self._metrics[metric]
         except KeyError:
+            labels = ["entity", "friendly_name", "domain"]
+            if extra_labels is not None:
+                labels.extend(extra_labels)
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(
-                full_metric_name,
-                documentation,
+            # The metrics are rendered by generate_latest instead of
+            # the registry of the client
+            self._metrics[metric] = CachedMetric(
+                factory(full_metric_name, documentation, labels, registry=None),
                 labels,
-                registry=self.prometheus_cli.REGISTRY,
             )
             return self._metrics[metric]
 
@@ -314,14 +481,6 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
-
     def _battery(self, state):
         if "battery_level" in state.attributes:
             metric = self._metric(
@@ -331,7 +490,7 @@ class PrometheusMetrics:
             )
             try:
                 value = float(state.attributes[ATTR_BATTERY_LEVEL])
-                metric.labels(**self._labels(state)).set(value)
+                self._child(metric, state).set(value)
             except ValueError:
                 pass
 
@@ -342,7 +501,7 @@ class PrometheusMetrics:
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_input_boolean(self, state):
         metric = self._metric(
@@ -351,7 +510,7 @@ class PrometheusMetrics:
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_input_number(self, state):
         if unit := self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)):
@@ -376,7 +535,7 @@ class PrometheusMetrics:
                 value = TemperatureConverter.convert(
                     value, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS
                 )
-            metric.labels(**self._labels(state)).set(value)
+            self._child(metric, state).set(value)
 
     def _handle_device_tracker(self, state):
         metric = self._metric(
@@ -385,14 +544,14 @@ class PrometheusMetrics:
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_person(self, state):
         metric = self._metric(
             "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_cover(self, state):
         metric = self._metric(
@@ -404,7 +563,7 @@ class PrometheusMetrics:
 
         cover_states = [STATE_CLOSED, STATE_CLOSING, STATE_OPEN, STATE_OPENING]
         for cover_state in cover_states:
-            metric.labels(**dict(self._labels(state), state=cover_state)).set(
+            self._child(metric, state, cover_state).set(
                 float(cover_state == state.state)
             )
 
@@ -415,7 +574,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Position of the cover (0-100)",
             )
-            position_metric.labels(**self._labels(state)).set(float(position))
+            self._child(position_metric, state).set(float(position))
 
         tilt_position = state.attributes.get(ATTR_TILT_POSITION)
         if tilt_position is not None:
@@ -424,7 +583,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Tilt Position of the cover (0-100)",
             )
-            tilt_position_metric.labels(**self._labels(state)).set(float(tilt_position))
+            self._child(tilt_position_metric, state).set(float(tilt_position))
 
     def _handle_light(self, state):
         metric = self._metric(
@@ -439,7 +598,7 @@ class PrometheusMetrics:
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
+            self._child(metric, state).set(value)
         except ValueError:
             pass
 
@@ -448,7 +607,7 @@ class PrometheusMetrics:
             "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_climate_temp(self, state, attr, metric_name, metric_description):
         if (temp := state.attributes.get(attr)) is not None:
@@ -461,7 +620,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 metric_description,
             )
-            metric.labels(**self._labels(state)).set(temp)
+            self._child(metric, state).set(temp)
 
     def _handle_climate(self, state):
         self._handle_climate_temp(
@@ -497,7 +656,7 @@ class PrometheusMetrics:
                 ["action"],
             )
             for action in HVACAction:
-                metric.labels(**dict(self._labels(state), action=action.value)).set(
+                self._child(metric, state, action.value).set(
                     float(action == current_action)
                 )
 
@@ -511,9 +670,7 @@ class PrometheusMetrics:
                 ["mode"],
             )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
-                    float(mode == current_mode)
-                )
+                self._child(metric, state, mode).set(float(mode == current_mode))
 
     def _handle_humidifier(self, state):
         humidifier_target_humidity_percent = state.attributes.get(ATTR_HUMIDITY)
@@ -523,7 +680,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Target Relative Humidity",
             )
-            metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
+            self._child(metric, state).set(humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
@@ -532,7 +689,7 @@ class PrometheusMetrics:
         )
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._child(metric, state).set(value)
         except ValueError:
             pass
 
@@ -546,9 +703,7 @@ class PrometheusMetrics:
                 ["mode"],
             )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
-                    float(mode == current_mode)
-                )
+                self._child(metric, state, mode).set(float(mode == current_mode))
 
     def _handle_sensor(self, state):
         unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
@@ -574,7 +729,7 @@ class PrometheusMetrics:
                     value = TemperatureConverter.convert(
                         value, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS
                     )
-                _metric.labels(**self._labels(state)).set(value)
+                self._child(_metric, state).set(value)
             except ValueError:
                 pass
 
@@ -644,7 +799,7 @@ class PrometheusMetrics:
 
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._child(metric, state).set(value)
         except ValueError:
             pass
 
@@ -660,7 +815,7 @@ class PrometheusMetrics:
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        self._child(metric, state).inc()
 
     def _handle_counter(self, state):
         metric = self._metric(
@@ -669,7 +824,7 @@ class PrometheusMetrics:
             "Value of counter entities",
         )
 
-        metric.labels(**self._labels(state)).set(self.state_as_number(state))
+        self._child(metric, state).set(self.state_as_number(state))
 
     def _handle_update(self, state):
         metric = self._metric(
@@ -678,7 +833,7 @@ class PrometheusMetrics:
             "Update state, indicating if an update is available (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
 
 class PrometheusView(HomeAssistantView):
@@ -687,16 +842,16 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli, requires_auth: bool) -> None:
+    def __init__(self, metrics: PrometheusMetrics, requires_auth: bool) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
-        self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
         return web.Response(
-            body=self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY),
+            body=self.metrics.generate_latest(),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
@@ -0,0 +1,109 @@
+"""Write pending states with multi-row inserts."""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Insert, insert
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm.session import Session
+
+from .db_schema import StateAttributes, States
+
+
+@lru_cache
+def _column_keys(mapped_class: type) -> tuple[str, ...]:
+    """Return the keys of the columns of a mapped class."""
+    return tuple(attr.key for attr in class_mapper(mapped_class).column_attrs)
+
+
+@lru_cache
+def _insert_returning_id(mapped_class: type, id_key: str) -> Insert:
+    """Return a multi-row insert statement returning the ids in order."""
+    return insert(mapped_class).returning(
+        getattr(mapped_class, id_key), sort_by_parameter_order=True
+    )
+
+
+def _row_params(obj: Any, column_keys: tuple[str, ...]) -> dict[str, Any]:
+    """Return the values set on a pending object by column key.
+
+    Columns that were never set are left out so their defaults apply.
+    """
+    values = obj.__dict__
+    return {key: values[key] for key in column_keys if key in values}
+
+
+def bulk_insert_state_attributes(
+    session: Session, state_attributes: list[StateAttributes]
+) -> None:
+    """Insert StateAttributes rows with multi-row inserts.
+
+    The attributes_id of each row is set on the passed objects.
+    """
+    if not state_attributes:
+        return
+    mapped_class = type(state_attributes[0])
+    column_keys = _column_keys(mapped_class)
+    attributes_ids = session.execute(
+        _insert_returning_id(mapped_class, "attributes_id"),
+        [
+            _row_params(dbstate_attributes, column_keys)
+            for dbstate_attributes in state_attributes
+        ],
+    ).scalars()
+    for dbstate_attributes, attributes_id in zip(state_attributes, attributes_ids):
+        dbstate_attributes.attributes_id = attributes_id
+
+
+def bulk_insert_states(session: Session, states: list[States]) -> None:
+    """Insert States rows with multi-row inserts.
+
+    The StateAttributes and StatesMeta the states are linked to must already
+    have their ids. A state can be linked to an old state that is part of the
+    same batch, so the rows are inserted in generations: every state is
+    inserted after its old state which makes the old_state_id known.
+
+    The state_id of each row is set on the passed objects.
+    """
+    if not states:
+        return
+    generation_by_state: dict[int, int] = {}
+    generations: list[list[States]] = []
+    for dbstate in states:
+        old_state = dbstate.__dict__.get("old_state")
+        generation = (
+            generation_by_state.get(id(old_state), -1) + 1
+            if old_state is not None
+            else 0
+        )
+        generation_by_state[id(dbstate)] = generation
+        if generation == len(generations):
+            generations.append([])
+        generations[generation].append(dbstate)
+
+    mapped_class = type(states[0])
+    column_keys = _column_keys(mapped_class)
+    stmt = _insert_returning_id(mapped_class, "state_id")
+    for generation_states in generations:
+        state_ids = session.execute(
+            stmt,
+            [_state_params(dbstate, column_keys) for dbstate in generation_states],
+        ).scalars()
+        for dbstate, state_id in zip(generation_states, state_ids):
+            dbstate.state_id = state_id
+
+
+def _state_params(dbstate: States, column_keys: tuple[str, ...]) -> dict[str, Any]:
+    """Return the insert parameters for a pending state."""
+    values = dbstate.__dict__
+    params = {key: values[key] for key in column_keys if key in values}
+    # The relationships are read from the instance dict as going through
+    # the attributes would try to load them.
+    if (old_state := values.get("old_state")) is not None:
+        params["old_state_id"] = old_state.state_id
+    if (state_attributes := values.get("state_attributes")) is not None:
+        params["attributes_id"] = state_attributes.attributes_id
+    if (states_meta := values.get("states_meta_rel")) is not None:
+        params["metadata_id"] = states_meta.metadata_id
+    return params
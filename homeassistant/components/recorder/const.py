@@ -40,9 +40,18 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_WORKER_PREFIX = "DbReadWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
+# How far back recorded states are kept in memory to answer history queries,
+# with some margin over the day history graphs show by default
+RECENT_STATES_WINDOW = 25 * 60 * 60
+# The maximum number of recorded states kept in memory
+RECENT_STATES_MAX_STATES = 250000
+# The maximum number of recorded states kept in memory for one entity
+RECENT_STATES_MAX_STATES_PER_ENTITY = 10000
+
 ATTR_KEEP_DAYS = "keep_days"
 ATTR_REPACK = "repack"
 ATTR_APPLY_FILTER = "apply_filter"
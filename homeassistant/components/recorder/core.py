@@ -39,10 +39,13 @@ from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
+from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
 from . import migration, statistics
+from .bulk_insert import bulk_insert_state_attributes, bulk_insert_states
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
@@ -78,13 +81,14 @@ from .db_schema import (
 )
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .pool import POOL_SIZE, MutexPool, RecorderPool, create_read_engine
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
 )
+from .recent_states import RecentStates
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -178,6 +182,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        db_read_workers: int,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -193,6 +198,7 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_workers = db_read_workers
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -203,6 +209,10 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        # A separate engine with a pool of connections only used for reading
+        # by the db read executor, None for in-memory databases or when
+        # there are no db read workers
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -215,6 +225,12 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # When the database supports multi-row inserts returning the new ids
+        # in order, states and their attributes are collected here and
+        # written in bulk at commit time instead of through the session.
+        self._bulk_insert_states = False
+        self._pending_bulk_state_attributes: list[StateAttributes] = []
+        self._pending_bulk_states: list[States] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -223,9 +239,12 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # The recently recorded states kept in memory for history queries
+        self.recent_states = RecentStates()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
@@ -233,6 +252,7 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: InterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -278,6 +298,19 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for reading.
+
+        Sessions for db read workers are bound to the read engine, all other
+        threads get a regular session.
+        """
+        if (
+            self._get_read_session is not None
+            and threading.current_thread().name.startswith(DB_READ_WORKER_PREFIX)
+        ):
+            return self._get_read_session()
+        return self.get_session()
+
     def queue_task(self, task: RecorderTask) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -294,6 +327,11 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self.db_read_workers:
+            self._db_read_executor = InterruptibleThreadPoolExecutor(
+                thread_name_prefix=DB_READ_WORKER_PREFIX,
+                max_workers=self.db_read_workers,
+            )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -368,8 +406,25 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job(
+        self, target: Callable[..., T], *args: Any
+    ) -> asyncio.Future[T]:
+        """Add a job that only reads from the database from within the event loop.
+
+        The job runs in the db read executor so long running queries do not
+        queue behind other database jobs. Falls back to the db executor when
+        there are no db read workers.
+        """
+        if self._db_read_executor is None:
+            return self.async_add_executor_job(target, *args)
+        return self.hass.loop.run_in_executor(self._db_read_executor, target, *args)
+
     def _stop_executor(self) -> None:
-        """Stop the executor."""
+        """Stop the executors."""
+        if self._db_read_executor is not None:
+            self._db_read_executor.shutdown()
+            self._db_read_executor = None
         if self._db_executor is None:
             return
         self._db_executor.shutdown()
@@ -1097,6 +1152,19 @@ class Recorder(threading.Thread):
         ):
             return
 
+        # History is only answered from memory with the current schema
+        recent_states = self.recent_states
+        if states_meta_manager.active and entity_removed:
+            recent_states.remove(entity_id)
+        elif states_meta_manager.active:
+            recent_states.add(
+                entity_id,
+                cast(str, dbstate.state),
+                cast(float, dbstate.last_updated_ts),
+                dbstate.last_changed_ts,
+                shared_attrs_bytes,
+            )
+
         assert self.event_session is not None
         session = self.event_session
         # Map the entity_id to the StatesMeta table
@@ -1138,10 +1206,17 @@ class Recorder(threading.Thread):
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
             state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
+            if self._bulk_insert_states:
+                self._pending_bulk_state_attributes.append(dbstate_attributes)
+            else:
+                self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self._bulk_insert_states:
+            self._event_session_has_pending_writes = True
+            self._pending_bulk_states.append(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1180,8 +1255,16 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._pending_bulk_states or self._pending_bulk_state_attributes:
+            # Flush the session first so the StatesMeta rows the
+            # pending states link to have their metadata_ids
+            session.flush()
+            bulk_insert_state_attributes(session, self._pending_bulk_state_attributes)
+            bulk_insert_states(session, self._pending_bulk_states)
         session.commit()
         self._event_session_has_pending_writes = False
+        self._pending_bulk_state_attributes.clear()
+        self._pending_bulk_states.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1218,6 +1301,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self._pending_bulk_state_attributes.clear()
+        self._pending_bulk_states.clear()
 
         if not self.event_session:
             return
@@ -1239,6 +1324,10 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        assert self.engine is not None
+        self._bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
 
     def _post_schema_migration(self, old_version: int, new_version: int) -> None:
         """Run post schema migration tasks."""
@@ -1407,8 +1496,37 @@ class Recorder(threading.Thread):
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
+        if self.db_read_workers and kwargs.get("poolclass") is not MutexPool:
+            self._setup_read_connection(kwargs)
+
+    def _setup_read_connection(self, kwargs: dict[str, Any]) -> None:
+        """Create the engine used by the db read workers."""
+        kwargs.pop("poolclass", None)
+        self.read_engine = create_read_engine(
+            self.db_url, self.db_read_workers, **kwargs
+        )
+        sqlalchemy_event.listen(
+            self.read_engine, "connect", self._setup_recorder_read_connection
+        )
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+
+    def _setup_recorder_read_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific read connection settings."""
+        assert self.read_engine is not None
+        setup_connection_for_dialect(
+            self, self.read_engine.dialect.name, dbapi_connection, False
+        )
+
     def _close_connection(self) -> None:
         """Close the connection."""
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
+        self._get_read_session = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
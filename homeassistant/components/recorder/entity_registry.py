@@ -61,6 +61,9 @@ def update_states_metadata(
         )
         return
 
+    # The history of the new entity_id includes the states of the old one
+    instance.recent_states.remove(entity_id)
+    instance.recent_states.remove(new_entity_id)
     with session_scope(session=instance.get_session()) as session:
         if not states_meta_manager.update_metadata(session, entity_id, new_entity_id):
             _LOGGER.warning(
@@ -1,13 +1,19 @@
 """A pool for sqlite connections."""
+from functools import partial
 import logging
+from pathlib import Path
+import sqlite3
 import threading
 import traceback
 from typing import Any
 
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import (
     ConnectionPoolEntry,
     NullPool,
+    QueuePool,
     SingletonThreadPool,
     StaticPool,
 )
@@ -15,7 +21,7 @@ from sqlalchemy.pool import (
 from homeassistant.helpers.frame import report
 from homeassistant.util.async_ import check_loop
 
-from .const import DB_WORKER_PREFIX
+from .const import DB_READ_WORKER_PREFIX, DB_WORKER_PREFIX, SQLITE_URL_PREFIX
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,7 +55,8 @@ class RecorderPool(SingletonThreadPool, NullPool):  # type: ignore[misc]
         """Check if the thread is a recorder or dbworker thread."""
         thread_name = threading.current_thread().name
         return bool(
-            thread_name == "Recorder" or thread_name.startswith(DB_WORKER_PREFIX)
+            thread_name == "Recorder"
+            or thread_name.startswith((DB_WORKER_PREFIX, DB_READ_WORKER_PREFIX))
         )
 
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
@@ -95,6 +102,40 @@ class RecorderPool(SingletonThreadPool, NullPool):  # type: ignore[misc]
         return NullPool._create_connection(self)
 
 
+class RecorderReadPool(QueuePool):
+    """A pool of read-only connections used by the db read executor.
+
+    Each db read worker checks out its own connection so reads can
+    run concurrently with each other and with the recorder thread.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        check_loop(super()._do_get, strict=True, advise_msg=ADVISE_MSG)
+        return super()._do_get()
+
+
+def create_read_engine(db_url: str, pool_size: int, **kwargs: Any) -> Engine:
+    """Create an engine with a pool of connections for the db read workers."""
+    if db_url.startswith(SQLITE_URL_PREFIX):
+        # Readers open the database in read-only mode, in WAL mode
+        # they do not block and are not blocked by the recorder thread
+        db_path = Path(db_url.removeprefix(SQLITE_URL_PREFIX)).resolve()
+        kwargs["creator"] = partial(
+            sqlite3.connect,
+            f"{db_path.as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+    return create_engine(
+        db_url,
+        poolclass=RecorderReadPool,
+        pool_size=pool_size,
+        max_overflow=0,
+        future=True,
+        **kwargs,
+    )
+
+
 class MutexPool(StaticPool):
     """A pool which prevents concurrent accesses from multiple threads.
 
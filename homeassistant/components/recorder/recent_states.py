@@ -0,0 +1,349 @@
+"""Keep the recently recorded states in memory to answer history queries."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+import threading
+import time
+from typing import Any
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.core import split_entity_id
+from homeassistant.util.json import json_loads_object
+
+from .const import (
+    RECENT_STATES_MAX_STATES,
+    RECENT_STATES_MAX_STATES_PER_ENTITY,
+    RECENT_STATES_WINDOW,
+)
+from .history.const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+
+EMPTY_JSON_OBJECT = b"{}"
+
+# Evicted states are only removed from the columns once there are
+# at least this many of them, and they are more than half of the column
+COMPACT_MIN_EVICTED = 64
+
+
+class _EntityStates:
+    """The recorded states of an entity stored as columns.
+
+    States are appended in the order of last_updated_ts and evicted from
+    the front. Evicted states stay in the columns until they are compacted.
+    """
+
+    __slots__ = (
+        "start",
+        "last_updated_ts",
+        "last_changed_ts",
+        "states",
+        "attributes",
+        "shared_attrs",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.start = 0
+        self.last_updated_ts = array("d")
+        self.last_changed_ts = array("d")
+        self.states: list[str] = []
+        self.attributes: list[dict[str, Any]] = []
+        # The serialized attributes of the last state, the decoded attributes
+        # of consecutive states with the same attributes are shared
+        self.shared_attrs: bytes | None = None
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return len(self.states) - self.start
+
+    def append(
+        self,
+        state: str,
+        last_updated_ts: float,
+        last_changed_ts: float,
+        shared_attrs: bytes,
+    ) -> None:
+        """Append a state."""
+        if shared_attrs != self.shared_attrs or not self.attributes:
+            self.shared_attrs = shared_attrs
+            attributes = (
+                {}
+                if shared_attrs == EMPTY_JSON_OBJECT
+                else json_loads_object(shared_attrs)
+            )
+        else:
+            attributes = self.attributes[-1]
+        self.states.append(state)
+        self.last_updated_ts.append(last_updated_ts)
+        self.last_changed_ts.append(last_changed_ts)
+        self.attributes.append(attributes)
+
+    def evict(self, count: int) -> None:
+        """Evict the oldest states."""
+        self.start = start = self.start + count
+        if start < COMPACT_MIN_EVICTED or start * 2 < len(self.states):
+            return
+        del self.states[:start]
+        del self.last_updated_ts[:start]
+        del self.last_changed_ts[:start]
+        del self.attributes[:start]
+        self.start = 0
+
+    def evict_before(self, timestamp: float) -> int:
+        """Evict the states replaced before timestamp and return the count.
+
+        The last state updated before timestamp is kept as it is the state
+        at timestamp.
+        """
+        start = self.start
+        keep = bisect_left(self.last_updated_ts, timestamp, start) - 1
+        if keep <= start:
+            return 0
+        self.evict(keep - start)
+        return keep - start
+
+
+class RecentStates:
+    """The states recorded in the recent past kept in memory.
+
+    States are added by the recorder thread as they are recorded, with
+    their attributes as they are stored in the database, and are read by
+    the db executors. The states of each entity are kept for
+    RECENT_STATES_WINDOW, bounded by RECENT_STATES_MAX_STATES_PER_ENTITY.
+    When there are more than RECENT_STATES_MAX_STATES states the oldest
+    states of the entities with the most states are evicted first.
+
+    History queries which start after the oldest state of all their
+    entities are answered from memory with the same results the database
+    would return.
+    """
+
+    def __init__(
+        self,
+        window: float = RECENT_STATES_WINDOW,
+        max_states: int = RECENT_STATES_MAX_STATES,
+        max_states_per_entity: int = RECENT_STATES_MAX_STATES_PER_ENTITY,
+    ) -> None:
+        """Initialize the recent states."""
+        self._window = window
+        self._max_states = max_states
+        self._max_states_per_entity = max_states_per_entity
+        self._lock = threading.Lock()
+        self._entities: dict[str, _EntityStates] = {}
+        self._size = 0
+        # States updated before the recorder started listening may not
+        # be the states at the start of the current recorder run
+        self._start_ts = time.time()
+
+    def __len__(self) -> int:
+        """Return the number of states kept in memory."""
+        return self._size
+
+    def add(
+        self,
+        entity_id: str,
+        state: str,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+        shared_attrs: bytes,
+    ) -> None:
+        """Add a recorded state.
+
+        Must be called from the recorder thread.
+        """
+        if last_updated_ts < self._start_ts:
+            return
+        with self._lock:
+            if (entity_states := self._entities.get(entity_id)) is None:
+                entity_states = self._entities[entity_id] = _EntityStates()
+            elif entity_states.last_updated_ts[-1] > last_updated_ts:
+                # The clock went backwards, start over as the states
+                # must be ordered by last_updated_ts
+                self._size -= len(entity_states)
+                entity_states = self._entities[entity_id] = _EntityStates()
+            entity_states.append(
+                state, last_updated_ts, last_changed_ts or last_updated_ts, shared_attrs
+            )
+            self._size += 1 - entity_states.evict_before(last_updated_ts - self._window)
+            if len(entity_states) > self._max_states_per_entity:
+                entity_states.evict(1)
+                self._size -= 1
+            if self._size > self._max_states:
+                self._evict_largest()
+
+    def _evict_largest(self) -> None:
+        """Evict the oldest states of the entities with the most states.
+
+        Evicts a tenth of the states so this is not done for every state added.
+        """
+        target = self._max_states * 9 // 10
+        for entity_states in sorted(self._entities.values(), key=len, reverse=True):
+            count = min(len(entity_states) - 1, self._size - target)
+            if count <= 0:
+                break
+            entity_states.evict(count)
+            self._size -= count
+
+    def remove(self, entity_id: str) -> None:
+        """Remove the states of an entity."""
+        with self._lock:
+            if entity_states := self._entities.pop(entity_id, None):
+                self._size -= len(entity_states)
+
+    def remove_matching(self, entity_filter: Callable[[str], bool]) -> None:
+        """Remove the states of the entities matching entity_filter."""
+        with self._lock:
+            for entity_id in [
+                entity_id for entity_id in self._entities if entity_filter(entity_id)
+            ]:
+                self._size -= len(self._entities.pop(entity_id))
+
+    def purge_before(self, timestamp: float) -> None:
+        """Remove the states updated before timestamp like the purge does.
+
+        Unlike the states evicted from the window, the last state updated
+        before timestamp is removed too as it is no longer in the database.
+        """
+        with self._lock:
+            for entity_id, entity_states in list(self._entities.items()):
+                count = (
+                    bisect_left(
+                        entity_states.last_updated_ts, timestamp, entity_states.start
+                    )
+                    - entity_states.start
+                )
+                if count == len(entity_states):
+                    del self._entities[entity_id]
+                elif count:
+                    entity_states.evict(count)
+                self._size -= count
+
+    def get_significant_states(
+        self,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        entity_ids: Iterable[str],
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> dict[str, list[dict[str, Any]]] | None:
+        """Return significant states in the compressed state format.
+
+        Returns the same results as history.get_significant_states with
+        compressed_state_format, or None if a state the query needs is
+        not in memory.
+        """
+        if start_time_ts <= self._start_ts:
+            return None
+        columns: dict[str, tuple[list[str], array, array, list[dict[str, Any]]]] = {}
+        with self._lock:
+            for entity_id in entity_ids:
+                # The state before the start time must be in memory as well
+                if (
+                    entity_states := self._entities.get(entity_id)
+                ) is None or start_time_ts <= entity_states.last_updated_ts[
+                    entity_states.start
+                ]:
+                    return None
+                last_updated_ts = entity_states.last_updated_ts
+                # A state updated exactly at the start time is neither
+                # the start time state nor a state in the period
+                first = bisect_right(
+                    last_updated_ts, start_time_ts, entity_states.start
+                )
+                end = (
+                    bisect_left(last_updated_ts, end_time_ts, first)
+                    if end_time_ts
+                    else len(last_updated_ts)
+                )
+                rows = slice(first, end)
+                if not include_start_time_state:
+                    columns[entity_id] = (
+                        entity_states.states[rows],
+                        last_updated_ts[rows],
+                        entity_states.last_changed_ts[rows],
+                        entity_states.attributes[rows],
+                    )
+                    continue
+                before = bisect_left(
+                    last_updated_ts, start_time_ts, entity_states.start
+                )
+                start = slice(before - 1, before)
+                columns[entity_id] = (
+                    entity_states.states[start] + entity_states.states[rows],
+                    array("d", (start_time_ts,)) + last_updated_ts[rows],
+                    array("d", (start_time_ts,)) + entity_states.last_changed_ts[rows],
+                    entity_states.attributes[start] + entity_states.attributes[rows],
+                )
+        result: dict[str, list[dict[str, Any]]] = {}
+        for entity_id, (
+            states,
+            last_updated,
+            last_changed,
+            attributes,
+        ) in columns.items():
+            if comp_states := _compressed_states(
+                split_entity_id(entity_id)[0],
+                states,
+                last_updated,
+                last_changed,
+                attributes,
+                not significant_changes_only,
+                include_start_time_state,
+                minimal_response,
+                no_attributes,
+            ):
+                result[entity_id] = comp_states
+        return result
+
+
+def _compressed_states(
+    domain: str,
+    states: list[str],
+    last_updated: array,
+    last_changed: array,
+    attributes: list[dict[str, Any]],
+    include_last_changed: bool,
+    include_start_time_state: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> list[dict[str, Any]]:
+    """Convert the states of an entity to compressed states."""
+    rows: Iterable[int] = range(len(states))
+    if not include_last_changed and domain not in SIGNIFICANT_DOMAINS:
+        # Only state changes are significant, the start time state is always kept
+        rows = [
+            idx
+            for idx in rows
+            if last_changed[idx] == last_updated[idx]
+            or (include_start_time_state and not idx)
+        ]
+    comp_states: list[dict[str, Any]] = []
+    for idx in rows:
+        if comp_states and minimal_response and domain not in NEED_ATTRIBUTE_DOMAINS:
+            # With a minimal response only the first state is a full state
+            if (state := states[idx]) != comp_states[-1][COMPRESSED_STATE_STATE]:
+                comp_states.append(
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated[idx],
+                    }
+                )
+            continue
+        comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: states[idx]}
+        if not no_attributes:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = attributes[idx]
+        elif not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = {}
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = last_updated[idx]
+        if include_last_changed and last_changed[idx] != last_updated[idx]:
+            comp_state[COMPRESSED_STATE_LAST_CHANGED] = last_changed[idx]
+        comp_states.append(comp_state)
+    return comp_states
@@ -11,6 +11,7 @@ from homeassistant.components.trace import (
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_collection
 
 from .const import DOMAIN
 
@@ -34,12 +35,14 @@ def trace_script(
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
     async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
-    try:
-        yield trace
-    except Exception as ex:
-        if item_id:
-            trace.set_error(ex)
-        raise ex
-    finally:
-        if item_id:
-            trace.finished()
+    # Condition traces are only collected when they can be stored
+    with trace_collection(trace_config[CONF_STORED_TRACES] > 0):
+        try:
+            yield trace
+        except Exception as ex:
+            if item_id:
+                trace.set_error(ex)
+            raise ex
+        finally:
+            if item_id:
+                trace.finished()
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
 import datetime
 import itertools
 import logging
 import math
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -24,6 +25,9 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
@@ -65,6 +69,9 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -78,8 +85,56 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
+@dataclass(slots=True)
+class _FloatColumns:
+    """Float states of an entity as columns.
+
+    The timestamps are the last_updated times in whole microseconds since the
+    epoch which keeps the time weighted average identical to the one computed
+    from datetimes.
+    """
+
+    values: list[float]
+    timestamps: list[int]
+    states: list[str]
+    attributes: list[Mapping[str, Any]]
+
+    def take(self, indices: Iterable[int], values: list[float]) -> _FloatColumns:
+        """Return the states at indices with new values."""
+        indices = list(indices)
+        return _FloatColumns(
+            values,
+            [self.timestamps[idx] for idx in indices],
+            [self.states[idx] for idx in indices],
+            [self.attributes[idx] for idx in indices],
+        )
+
+    def as_state(self, entity_id: str, idx: int) -> State:
+        """Return the state at idx as a State."""
+        last_updated = _EPOCH + datetime.timedelta(microseconds=self.timestamps[idx])
+        return State(
+            entity_id,
+            self.states[idx],
+            self.attributes[idx],
+            last_updated,
+            last_updated,
+            validate_entity_id=False,
+        )
+
+
+def _timestamp_to_microseconds(timestamp: float) -> int:
+    """Convert a timestamp to microseconds, rounding like utc_from_timestamp."""
+    fraction, whole = math.modf(timestamp)
+    return int(whole) * 1_000_000 + round(fraction * 1e6)
+
+
+def _datetime_to_microseconds(value: datetime.datetime) -> int:
+    """Convert an aware datetime to microseconds since the epoch."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    columns: _FloatColumns, start: datetime.datetime, end: datetime.datetime
 ) -> float:
     """Calculate a time weighted average.
 
@@ -87,33 +142,24 @@ def _time_weighted_average(
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    start_us = _datetime_to_microseconds(start)
+    end_us = _datetime_to_microseconds(end)
+    values = columns.values
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_times = [max(start_us, timestamp) for timestamp in columns.timestamps]
+    # Adjust start time, if there was no last known state
+    start_us = start_times[0]
     accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    period_seconds = (end - start).total_seconds()
+    # Accumulate the values, weighted by duration until next state change
+    for value, state_start, next_state_start in zip(
+        values, start_times, itertools.islice(start_times, 1, None)
+    ):
+        accumulated += value * ((next_state_start - state_start) / 1_000_000)
+    # Accumulate the last value, weighted by duration until end of the period
+    accumulated += values[-1] * ((end_us - start_times[-1]) / 1_000_000)
+
+    period_seconds = (end_us - start_us) / 1_000_000
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -125,9 +171,11 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
-def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
+def _get_units(columns: _FloatColumns) -> set[str | None]:
     """Return a set of all units."""
-    return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
+    return {
+        attributes.get(ATTR_UNIT_OF_MEASUREMENT) for attributes in columns.attributes
+    }
 
 
 def _equivalent_units(units: set[str | None]) -> bool:
@@ -156,27 +204,77 @@ def _float_or_none(state: str) -> float | None:
         return None
 
 
-def _entity_history_to_float_and_state(
-    entity_history: Iterable[State],
-) -> list[tuple[float, State]]:
-    """Return a list of (float, state) tuples for the given entity."""
-    return [
-        (fstate, state)
-        for state in entity_history
-        if (fstate := _float_or_none(state.state)) is not None
-    ]
+def _entity_history_to_float_columns(
+    entity_history: Iterable[dict[str, Any]],
+) -> _FloatColumns | None:
+    """Return the float states of compressed states as columns."""
+    columns = _FloatColumns([], [], [], [])
+    for compressed_state in entity_history:
+        state = compressed_state[COMPRESSED_STATE_STATE]
+        if (fstate := _float_or_none(state)) is None:
+            continue
+        columns.values.append(fstate)
+        columns.timestamps.append(
+            _timestamp_to_microseconds(compressed_state[COMPRESSED_STATE_LAST_UPDATED])
+        )
+        columns.states.append(state)
+        columns.attributes.append(compressed_state[COMPRESSED_STATE_ATTRIBUTES])
+    return columns if columns.values else None
+
+
+def _state_to_float_columns(state: State) -> _FloatColumns | None:
+    """Return the float state of a state machine state as columns."""
+    if (fstate := _float_or_none(state.state)) is None:
+        return None
+    return _FloatColumns(
+        [fstate],
+        [_datetime_to_microseconds(state.last_updated)],
+        [state.state],
+        [state.attributes],
+    )
+
+
+def _get_float_columns(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entity_ids: list[str],
+    significant_changes_only: bool,
+) -> dict[str, _FloatColumns | None]:
+    """Fetch the float states of entities between start and end as columns.
+
+    The states are fetched in the compressed format which skips creating
+    State objects for the rows. Entities which have history but no float
+    states map to None.
+    """
+    history_list = history.get_significant_states_with_session(
+        hass,
+        session,
+        start - datetime.timedelta.resolution,
+        end,
+        entity_ids=entity_ids,
+        significant_changes_only=significant_changes_only,
+        compressed_state_format=True,
+    )
+    return {
+        entity_id: _entity_history_to_float_columns(
+            cast(list[dict[str, Any]], entity_history)
+        )
+        for entity_id, entity_history in history_list.items()
+    }
 
 
 def _normalize_states(
     hass: HomeAssistant,
     old_metadatas: dict[str, tuple[int, StatisticMetaData]],
-    fstates: list[tuple[float, State]],
+    columns: _FloatColumns,
     entity_id: str,
-) -> tuple[str | None, list[tuple[float, State]]]:
+) -> tuple[str | None, _FloatColumns | None]:
     """Normalize units."""
     state_unit: str | None = None
     statistics_unit: str | None
-    state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    state_unit = columns.attributes[0].get(ATTR_UNIT_OF_MEASUREMENT)
     old_metadata = old_metadatas[entity_id][1] if entity_id in old_metadatas else None
     if not old_metadata:
         # We've not seen this sensor before, the first valid state determines the unit
@@ -189,7 +287,7 @@ def _normalize_states(
     if statistics_unit not in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER:
         # The unit used by this sensor doesn't support unit conversion
 
-        all_units = _get_units(fstates)
+        all_units = _get_units(columns)
         if not _equivalent_units(all_units):
             if WARN_UNSTABLE_UNIT not in hass.data:
                 hass.data[WARN_UNSTABLE_UNIT] = set()
@@ -212,17 +310,17 @@ def _normalize_states(
                     extra,
                     LINK_DEV_STATISTICS,
                 )
-            return None, []
-        state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-        return state_unit, fstates
+            return None, None
+        return state_unit, columns
 
     converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
-    valid_fstates: list[tuple[float, State]] = []
+    valid_indices: list[int] = []
+    valid_values: list[float] = []
     convert: Callable[[float], float]
     last_unit: str | None | object = object()
 
-    for fstate, state in fstates:
-        state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    for idx, (fstate, attributes) in enumerate(zip(columns.values, columns.attributes)):
+        state_unit = attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         # Exclude states with unsupported unit from statistics
         if state_unit not in converter.VALID_UNITS:
             if WARN_UNSUPPORTED_UNIT not in hass.data:
@@ -249,9 +347,12 @@ def _normalize_states(
             convert = converter.converter_factory(state_unit, statistics_unit)
             last_unit = state_unit
 
-        valid_fstates.append((convert(fstate), state))
+        valid_indices.append(idx)
+        valid_values.append(convert(fstate))
 
-    return statistics_unit, valid_fstates
+    if not valid_values:
+        return statistics_unit, None
+    return statistics_unit, columns.take(valid_indices, valid_values)
 
 
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
@@ -388,15 +489,10 @@ def compile_statistics(  # noqa: C901
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: MutableMapping[str, list[State]] = {}
+    history_columns: dict[str, _FloatColumns | None] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_columns = _get_float_columns(
+            hass, session, start, end, entities_full_history, False
         )
     entities_significant_history = [
         i.entity_id
@@ -404,25 +500,21 @@ def compile_statistics(  # noqa: C901
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        history_columns |= _get_float_columns(
+            hass, session, start, end, entities_significant_history, True
         )
-        history_list = {**history_list, **_history_list}
 
-    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    entities_with_float_states: dict[str, _FloatColumns] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
-            continue
-        if not (float_states := _entity_history_to_float_and_state(entity_history)):
-            continue
-        entities_with_float_states[entity_id] = float_states
+        if entity_id in history_columns:
+            float_columns = history_columns[entity_id]
+        else:
+            float_columns = _state_to_float_columns(_state)
+        if float_columns is not None:
+            entities_with_float_states[entity_id] = float_columns
 
     # Only lookup metadata for entities that have valid float states
     # since it will result in cache misses for statistic_ids
@@ -431,7 +523,7 @@ def compile_statistics(  # noqa: C901
     old_metadatas = statistics.get_metadata_with_session(
         get_instance(hass), session, statistic_ids=set(entities_with_float_states)
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[tuple[str, str | None, str, _FloatColumns]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
@@ -443,7 +535,7 @@ def compile_statistics(  # noqa: C901
             maybe_float_states,
             entity_id,
         )
-        if not valid_float_states:
+        if valid_float_states is None:
             continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
         to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
@@ -497,19 +589,9 @@ def compile_statistics(  # noqa: C901
         # Make calculations
         stat: StatisticData = {"start": start}
         if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
-                )
-            )
+            stat["max"] = max(valid_float_states.values)
         if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
-                )
-            )
+            stat["min"] = min(valid_float_states.values)
 
         if "mean" in wanted_statistics[entity_id]:
             stat["mean"] = _time_weighted_average(valid_float_states, start, end)
@@ -530,13 +612,15 @@ def compile_statistics(  # noqa: C901
                 new_state = old_state = last_stat.get("state")
                 _sum = last_stat.get("sum") or 0.0
 
-            for fstate, state in valid_float_states:
+            for idx, (fstate, attributes) in enumerate(
+                zip(valid_float_states.values, valid_float_states.attributes)
+            ):
                 reset = False
                 if (
                     state_class != SensorStateClass.TOTAL_INCREASING
                     and (
                         last_reset := _last_reset_as_utc_isoformat(
-                            state.attributes.get("last_reset"), entity_id
+                            attributes.get("last_reset"), entity_id
                         )
                     )
                     != old_last_reset
@@ -571,8 +655,18 @@ def compile_statistics(  # noqa: C901
                     )
                 elif state_class == SensorStateClass.TOTAL_INCREASING:
                     try:
-                        if old_state is None or reset_detected(
-                            hass, entity_id, fstate, new_state, state
+                        # Only a decreasing or negative value can be a reset,
+                        # skip creating a State for reset_detected otherwise
+                        if old_state is None or (
+                            new_state is not None
+                            and (fstate < new_state or fstate < 0)
+                            and reset_detected(
+                                hass,
+                                entity_id,
+                                fstate,
+                                new_state,
+                                valid_float_states.as_state(entity_id, idx),
+                            )
                         ):
                             reset = True
                             _LOGGER.info(
@@ -584,7 +678,9 @@ def compile_statistics(  # noqa: C901
                                 entity_id,
                                 new_state,
                                 fstate,
-                                state.last_updated.isoformat(),
+                                valid_float_states.as_state(
+                                    entity_id, idx
+                                ).last_updated.isoformat(),
                             )
                     except HomeAssistantError:
                         continue
@@ -0,0 +1,317 @@
+"""Rolling window of samples with incrementally maintained aggregates."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+# Number of samples a bucket of the sorted samples is split and merged around
+_BUCKET_SIZE = 256
+
+
+class _SortedSamples:
+    """Samples in sorted order for the order statistics.
+
+    A plain sorted list shifts up to all samples on every insert and
+    removal, which is O(n) per update of a window. The samples are kept in
+    sorted buckets of _BUCKET_SIZE / 2 to 2 * _BUCKET_SIZE samples instead,
+    with the largest sample of each bucket to bisect for the bucket of a
+    value and a Fenwick tree of the bucket sizes to find the sample at a
+    position. Adding, removing and indexing a sample is O(log n), plus a
+    shift within one bucket of bounded size. Splitting or merging a bucket
+    rebuilds the tree, which happens once per _BUCKET_SIZE / 2 updates at
+    the most.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the samples."""
+        self._buckets: list[list[float | bool]] = []
+        self._maxes: list[float | bool] = []
+        # A Fenwick tree of the bucket sizes, the first item is unused
+        self._tree: list[int] = [0]
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self._len
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._buckets.clear()
+        self._maxes.clear()
+        self._tree = [0]
+        self._len = 0
+
+    def _build_tree(self) -> None:
+        """Rebuild the Fenwick tree after buckets were added or removed."""
+        tree = [0, *map(len, self._buckets)]
+        size = len(tree)
+        for idx in range(1, size):
+            if (parent := idx + (idx & -idx)) < size:
+                tree[parent] += tree[idx]
+        self._tree = tree
+
+    def _update_tree(self, bucket_idx: int, delta: int) -> None:
+        """Change the size of a bucket in the Fenwick tree."""
+        tree = self._tree
+        size = len(tree)
+        idx = bucket_idx + 1
+        while idx < size:
+            tree[idx] += delta
+            idx += idx & -idx
+
+    def _split(self, bucket_idx: int) -> None:
+        """Split a bucket which is too large in two."""
+        bucket = self._buckets[bucket_idx]
+        self._buckets.insert(bucket_idx + 1, bucket[_BUCKET_SIZE:])
+        del bucket[_BUCKET_SIZE:]
+        self._maxes.insert(bucket_idx, bucket[-1])
+        self._build_tree()
+
+    def add(self, value: float | bool) -> None:
+        """Add a sample."""
+        self._len += 1
+        buckets = self._buckets
+        maxes = self._maxes
+        if not buckets:
+            buckets.append([value])
+            maxes.append(value)
+            self._build_tree()
+            return
+        if (bucket_idx := bisect_left(maxes, value)) == len(maxes):
+            bucket_idx -= 1
+            bucket = buckets[bucket_idx]
+            bucket.append(value)
+            maxes[bucket_idx] = value
+        else:
+            bucket = buckets[bucket_idx]
+            insort(bucket, value)
+        if len(bucket) > 2 * _BUCKET_SIZE:
+            self._split(bucket_idx)
+        else:
+            self._update_tree(bucket_idx, 1)
+
+    def remove(self, value: float | bool) -> None:
+        """Remove a sample which was added."""
+        self._len -= 1
+        buckets = self._buckets
+        maxes = self._maxes
+        bucket_idx = bisect_left(maxes, value)
+        bucket = buckets[bucket_idx]
+        del bucket[bisect_left(bucket, value)]
+        if len(buckets) == 1 and not bucket:
+            self.clear()
+            return
+        if len(buckets) == 1 or (bucket and len(bucket) >= _BUCKET_SIZE // 2):
+            maxes[bucket_idx] = bucket[-1]
+            self._update_tree(bucket_idx, -1)
+            return
+        # Merge the small bucket into a neighbour, which is split again
+        # when the merged bucket is too large
+        if bucket_idx:
+            bucket_idx -= 1
+        bucket = buckets[bucket_idx]
+        bucket.extend(buckets.pop(bucket_idx + 1))
+        del maxes[bucket_idx + 1]
+        maxes[bucket_idx] = bucket[-1]
+        if len(bucket) > 2 * _BUCKET_SIZE:
+            self._split(bucket_idx)
+        else:
+            self._build_tree()
+
+    def __getitem__(self, position: int) -> float | bool:
+        """Return the sample at a position from 0 to the number of samples - 1."""
+        tree = self._tree
+        size = len(tree)
+        bucket_idx = 0
+        step = 1 << (size - 1).bit_length()
+        while step:
+            if (idx := bucket_idx + step) < size and tree[idx] <= position:
+                bucket_idx = idx
+                position -= tree[idx]
+            step >>= 1
+        return self._buckets[bucket_idx][position]
+
+    @property
+    def first(self) -> float | bool:
+        """Return the smallest sample."""
+        return self._buckets[0][0]
+
+    @property
+    def last(self) -> float | bool:
+        """Return the largest sample."""
+        return self._maxes[-1]
+
+
+class RollingWindow:
+    """Samples of a statistics sensor and their running aggregates.
+
+    Adding or removing a sample updates the aggregates in place instead of
+    recomputing them over the whole window: running sums, Welford's mean
+    and variance, the areas below the linear and step interpolated curve
+    and the sums of the differences between consecutive samples. A sorted
+    copy of the samples in buckets serves the order statistics (median,
+    percentiles, min and max) in O(log n) when it is enabled.
+
+    The running float sums are rebuilt from the samples once as many
+    samples were removed as the window holds, which bounds the rounding
+    error they accumulate at an amortized O(1) cost.
+    """
+
+    def __init__(self, max_size: int | None, order_statistics: bool) -> None:
+        """Initialize the window."""
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self._max_size = max_size
+        self._order_statistics = order_statistics
+        self._sorted = _SortedSamples()
+        self._removals_since_rebuild = 0
+        self._reset_aggregates()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def _reset_aggregates(self) -> None:
+        """Reset the running aggregates to an empty window."""
+        self.sum: float = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sin_sum = 0.0
+        self._cos_sum = 0.0
+        self.area_linear = 0.0
+        self.area_step = 0.0
+        self.sum_differences: float = 0
+        self.sum_differences_nonnegative: float = 0
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add the newest sample, dropping the oldest one if the window is full."""
+        if self._max_size is not None and len(self.states) >= self._max_size:
+            self.popleft()
+        if self.states:
+            self._update_pair(
+                self.states[-1], value, (age - self.ages[-1]).total_seconds(), 1
+            )
+        self.states.append(value)
+        self.ages.append(age)
+        self._update_value(value, 1)
+        if self._order_statistics:
+            self._sorted.add(value)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        if not self.states:
+            self._sorted.clear()
+            self._removals_since_rebuild = 0
+            self._reset_aggregates()
+            return
+        self._update_pair(
+            value, self.states[0], (self.ages[0] - age).total_seconds(), -1
+        )
+        self._update_value(value, -1)
+        if self._order_statistics:
+            self._sorted.remove(value)
+        self._removals_since_rebuild += 1
+        if self._removals_since_rebuild >= len(self.states):
+            self._rebuild()
+
+    def _update_value(self, value: float | bool, sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) a sample from the value aggregates."""
+        self.sum += sign * value
+        radians = math.radians(value)
+        self._sin_sum += sign * math.sin(radians)
+        self._cos_sum += sign * math.cos(radians)
+        # Welford's algorithm, len(self.states) already includes the
+        # added sample and excludes the removed one.
+        count = len(self.states)
+        old_mean = self._mean
+        if sign == 1:
+            self._mean += (value - old_mean) / count
+            self._m2 += (value - old_mean) * (value - self._mean)
+        else:
+            self._mean = (old_mean * (count + 1) - value) / count
+            self._m2 = max(self._m2 - (value - old_mean) * (value - self._mean), 0.0)
+
+    def _update_pair(
+        self, first: float | bool, second: float | bool, seconds: float, sign: int
+    ) -> None:
+        """Add (sign 1) or remove (sign -1) two consecutive samples from the pair aggregates."""
+        self.area_linear += sign * 0.5 * (first + second) * seconds
+        self.area_step += sign * first * seconds
+        self.sum_differences += sign * abs(second - first)
+        self.sum_differences_nonnegative += sign * (
+            second - first if second >= first else second
+        )
+
+    def _rebuild(self) -> None:
+        """Recompute the running aggregates from the samples."""
+        states = self.states
+        ages = self.ages
+        self._reset_aggregates()
+        self._removals_since_rebuild = 0
+        for idx, value in enumerate(states):
+            if idx:
+                self._update_pair(
+                    states[idx - 1],
+                    value,
+                    (ages[idx] - ages[idx - 1]).total_seconds(),
+                    1,
+                )
+            count = idx + 1
+            self.sum += value
+            radians = math.radians(value)
+            self._sin_sum += math.sin(radians)
+            self._cos_sum += math.cos(radians)
+            old_mean = self._mean
+            self._mean += (value - old_mean) / count
+            self._m2 += (value - old_mean) * (value - self._mean)
+
+    @property
+    def age_range_seconds(self) -> float:
+        """Return the seconds between the oldest and the newest sample."""
+        return (self.ages[-1] - self.ages[0]).total_seconds()
+
+    @property
+    def mean_circular(self) -> float:
+        """Return the circular mean of the samples in degrees."""
+        return (math.degrees(math.atan2(self._sin_sum, self._cos_sum)) + 360) % 360
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return self._m2 / (len(self.states) - 1)
+
+    @property
+    def value_max(self) -> float | bool:
+        """Return the largest sample."""
+        return self._sorted.last
+
+    @property
+    def value_min(self) -> float | bool:
+        """Return the smallest sample."""
+        return self._sorted.first
+
+    @property
+    def median(self) -> float:
+        """Return the median of the samples."""
+        data = self._sorted
+        count = len(data)
+        middle = count // 2
+        if count % 2:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile of at least two samples.
+
+        Matches statistics.quantiles(n=100, method="exclusive").
+        """
+        data = self._sorted
+        count = len(data)
+        rescaled = percentile * (count + 1)
+        idx = min(max(rescaled // 100, 1), count - 1)
+        delta = rescaled - idx * 100
+        return (data[idx - 1] * (100 - delta) + data[idx] * delta) / 100
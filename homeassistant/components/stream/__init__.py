@@ -17,7 +17,7 @@ to always keep workers active.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 import copy
 import logging
 import secrets
@@ -85,6 +85,7 @@ __all__ = [
     "RTSP_TRANSPORTS",
     "SOURCE_TIMEOUT",
     "Stream",
+    "async_get_images",
     "create_stream",
     "Orientation",
 ]
@@ -556,6 +557,32 @@ class Stream:
         return self._diagnostics.as_dict()
 
 
+async def async_get_images(
+    hass: HomeAssistant,
+    requests: Iterable[tuple[Stream, int | None, int | None]],
+) -> list[bytes | None]:
+    """Fetch images from many Streams in a single executor job.
+
+    Returns a jpeg in bytes, or None, for each (stream, width, height) request.
+    Like Stream.async_get_image, this should only be called from the main loop.
+    """
+    requests = list(requests)
+    for stream, _, _ in requests:
+        stream.add_provider(HLS_PROVIDER)
+        await stream.start()
+    return await KeyFrameConverter.async_get_images(
+        hass,
+        [
+            (
+                stream._keyframe_converter,  # pylint: disable=protected-access
+                width,
+                height,
+            )
+            for stream, width, height in requests
+        ],
+    )
+
+
 def _should_retry() -> bool:
     """Return true if worker failures should be retried, for disabling during tests."""
     return True
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
-from collections.abc import Callable, Coroutine, Iterable
+from collections import OrderedDict, deque
+from collections.abc import Callable, Coroutine, Iterable, Sequence
+from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
 import datetime
 from enum import IntEnum
@@ -21,12 +22,13 @@ from homeassistant.util.decorator import Registry
 from .const import (
     ATTR_STREAMS,
     DOMAIN,
+    KEYFRAME_IMAGE_CACHE_SIZE,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -76,8 +78,9 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view into the segment data once the
+    # segment is complete
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -101,6 +104,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Contiguous data of all parts, set when the segment is complete
+    _data: memoryview | None = None
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -120,6 +125,8 @@ class Segment:
     @property
     def data_size(self) -> int:
         """Return the size of all part data without init in bytes."""
+        if self._data is not None:
+            return len(self._data)
         return sum(len(part.data) for part in self.parts)
 
     @callback
@@ -127,18 +134,40 @@ class Segment:
         self,
         part: Part,
         duration: float,
+        data: memoryview | None = None,
     ) -> None:
         """Add a part to the Segment.
 
-        Duration is non zero only for the last part.
+        Duration is non zero only for the last part. The last part may come
+        with the data of all the parts in a single buffer, the parts then
+        become views into this buffer.
         """
         self.parts.append(part)
+        if data is not None:
+            self._set_data(data)
         self.duration = duration
         for output in self._stream_outputs:
             output.part_put()
 
-    def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
+    def _set_data(self, data: memoryview) -> None:
+        """Share the contiguous data of all parts with the parts."""
+        if len(data) != self.data_size:
+            _LOGGER.debug("Segment data does not match its parts, not sharing it")
+            return
+        offset = 0
+        for part in self.parts:
+            part_size = len(part.data)
+            part.data = data[offset : offset + part_size]
+            offset += part_size
+        self._data = data
+
+    def get_data(self) -> bytes | memoryview:
+        """Return reconstructed data for all parts, without init.
+
+        The data of a complete segment is returned without copying.
+        """
+        if self._data is not None:
+            return self._data
         return b"".join([part.data for part in self.parts])
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
@@ -422,10 +451,14 @@ class KeyFrameConverter:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
         get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
+        _generate_image will try to decode a frame from the packet
         _generate_image will clear the packet, so there will only be one attempt per packet
+        _generate_image encodes the decoded frame at the requested size
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+
+    The decoded frame is kept until the next keyframe is decoded, together with
+    the images encoded from it for the most recently requested sizes.
     """
 
     def __init__(
@@ -445,6 +478,11 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        # Images encoded from the frame by width, height and orientation
+        self._images: OrderedDict[
+            tuple[int | None, int | None, int], bytes
+        ] = OrderedDict()
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
@@ -483,15 +521,9 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
-        """Generate the keyframe image.
-
-        This is run in an executor thread, but since it is called within an
-        the asyncio lock from the main thread, there will only be one entry
-        at a time per instance.
-        """
-
-        if not (self._turbojpeg and self._packet and self._codec_context):
+    def _decode_keyframe(self) -> None:
+        """Decode the stashed keyframe packet, if any."""
+        if not (self._packet and self._codec_context):
             return
         packet = self._packet
         self._packet = None
@@ -512,17 +544,39 @@ class KeyFrameConverter:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            self._frame = frames[0]
+            self._images.clear()
+
+    def _generate_image(self, width: int | None, height: int | None) -> None:
+        """Generate the keyframe image.
+
+        This is run in an executor thread, but since it is called within an
+        the asyncio lock from the main thread, there will only be one entry
+        at a time per instance.
+        """
+
+        if not self._turbojpeg:
+            return
+        self._decode_keyframe()
+        if (frame := self._frame) is None:
+            return
+        orientation = self._dynamic_stream_settings.orientation
+        if not (width and height):
+            width = height = None
+        key = (width, height, orientation)
+        if (image := self._images.get(key)) is not None:
+            self._images.move_to_end(key)
+            self._image = image
+            return
+        if width and height:
+            if orientation >= 5:
+                frame = frame.reformat(width=height, height=width)
+            else:
+                frame = frame.reformat(width=width, height=height)
+        bgr_array = self.transform_image(frame.to_ndarray(format="bgr24"), orientation)
+        self._image = self._images[key] = bytes(self._turbojpeg.encode(bgr_array))
+        if len(self._images) > KEYFRAME_IMAGE_CACHE_SIZE:
+            self._images.popitem(last=False)
 
     async def async_get_image(
         self,
@@ -539,3 +593,37 @@ class KeyFrameConverter:
         async with self._lock:
             await self._hass.async_add_executor_job(self._generate_image, width, height)
         return self._image
+
+    @staticmethod
+    def _generate_images(
+        requests: Sequence[tuple[KeyFrameConverter, int | None, int | None]]
+    ) -> list[bytes | None]:
+        """Generate the images of many converters."""
+        images = []
+        for converter, width, height in requests:
+            converter._generate_image(width, height)  # pylint: disable=protected-access
+            images.append(converter._image)  # pylint: disable=protected-access
+        return images
+
+    @staticmethod
+    async def async_get_images(
+        hass: HomeAssistant,
+        requests: Sequence[tuple[KeyFrameConverter, int | None, int | None]],
+    ) -> list[bytes | None]:
+        """Fetch images of many converters in a single executor job.
+
+        Returns a jpeg in bytes, or None, for each (converter, width, height)
+        request.
+        """
+        async with AsyncExitStack() as stack:
+            # Lock the converters in a fixed order to avoid deadlocks
+            for converter in sorted(
+                {converter for converter, _, _ in requests}, key=id
+            ):
+                await stack.enter_async_context(
+                    converter._lock  # pylint: disable=protected-access
+                )
+            images = await hass.async_add_executor_job(
+                KeyFrameConverter._generate_images, requests
+            )
+        return images
@@ -349,7 +349,19 @@ class StreamMuxer:
         if not self._stream_settings.ll_hls:
             adjusted_dts = packet.dts
         assert self._segment
-        self._memory_file.seek(self._memory_file_pos)
+        segment_data: memoryview | None = None
+        part_data: bytes | memoryview
+        if last_part:
+            # The memory_file holds the init followed by the data of all the
+            # parts. Hand it over to the segment in one piece so the segment
+            # and its parts can be served without copying.
+            segment_data = memoryview(self._memory_file.getvalue())[
+                len(self._segment.init) :
+            ]
+            part_data = segment_data[self._memory_file_pos - len(self._segment.init) :]
+        else:
+            self._memory_file.seek(self._memory_file_pos)
+            part_data = self._memory_file.read()
         self._hass.loop.call_soon_threadsafe(
             self._segment.async_add_part,
             Part(
@@ -357,7 +369,7 @@ class StreamMuxer:
                     (adjusted_dts - self._part_start_dts) * packet.time_base
                 ),
                 has_keyframe=self._part_has_keyframe,
-                data=self._memory_file.read(),
+                data=part_data,
             ),
             (
                 segment_duration := float(
@@ -366,6 +378,7 @@ class StreamMuxer:
             )
             if last_part
             else 0,
+            segment_data,
         )
         if last_part:
             # If we've written the last part, we can close the memory_file.
@@ -14,7 +14,7 @@ from homeassistant.const import __version__
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.util.json import JsonValueType
 
-from .connection import ActiveConnection
+from .connection import ActiveConnection, WaitPendingMessages
 from .error import Disconnect
 
 if TYPE_CHECKING:
@@ -58,12 +58,14 @@ class AuthPhase:
         logger: WebSocketAdapter,
         hass: HomeAssistant,
         send_message: Callable[[str | dict[str, Any]], None],
+        wait_pending_messages: WaitPendingMessages,
         cancel_ws: CALLBACK_TYPE,
         request: Request,
     ) -> None:
         """Initialize the authentiated connection."""
         self._hass = hass
         self._send_message = send_message
+        self._wait_pending_messages = wait_pending_messages
         self._cancel_ws = cancel_ws
         self._logger = logger
         self._request = request
@@ -106,5 +108,10 @@ class AuthPhase:
         await process_success_login(self._request)
         self._send_message(auth_ok_message())
         return ActiveConnection(
-            self._logger, self._hass, self._send_message, user, refresh_token
+            self._logger,
+            self._hass,
+            self._send_message,
+            user,
+            refresh_token,
+            self._wait_pending_messages,
         )
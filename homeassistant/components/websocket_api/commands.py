@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 import datetime as dt
 from functools import lru_cache, partial
 import json
@@ -18,7 +19,14 @@ from homeassistant.const import (
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
-from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -57,6 +65,7 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_CHANGES_FAN_OUT = "websocket_api_entity_changes_fan_out"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -346,26 +355,89 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+@dataclass(slots=True, eq=False)
+class _EntityChangesSubscriber:
+    """A subscribe_entities subscription of a connection."""
+
+    send_message: Callable[[str | dict[str, Any]], None]
+    user: User
+    msg_id: int
+
+
+class _EntityChangesFanOut:
+    """Forward state changed events to all subscribe_entities subscriptions.
+
+    A single state changed listener is shared by all connections. The
+    state diff of an event is serialized once and only the subscriptions
+    interested in the changed entity are visited.
+    """
+
+    __slots__ = ("_hass", "_all_entities", "_by_entity_id", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fan out."""
+        self._hass = hass
+        self._all_entities: dict[_EntityChangesSubscriber, None] = {}
+        self._by_entity_id: dict[str, dict[_EntityChangesSubscriber, None]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        send_message: Callable[[str | dict[str, Any]], None],
+        entity_ids: set[str],
+        user: User,
+        msg_id: int,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes of entity_ids or all entities if empty."""
+        subscriber = _EntityChangesSubscriber(send_message, user, msg_id)
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[subscriber] = None
+        else:
+            self._all_entities[subscriber] = None
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward, run_immediately=True
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the subscription."""
+            if not entity_ids:
+                del self._all_entities[subscriber]
+            for entity_id in entity_ids:
+                entity_subscribers = self._by_entity_id[entity_id]
+                del entity_subscribers[subscriber]
+                if not entity_subscribers:
+                    del self._by_entity_id[entity_id]
+            if not self._all_entities and not self._by_entity_id and self._unsub:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_forward(self, event: Event) -> None:
+        """Forward a state changed event to the interested subscriptions."""
+        entity_id: str = event.data["entity_id"]
+        subscribers = self._all_entities
+        if entity_subscribers := self._by_entity_id.get(entity_id):
+            subscribers = subscribers | entity_subscribers
+        elif not subscribers:
+            return
+        partial_message: str | None = None
+        for subscriber in list(subscribers):
+            # We have to lookup the permissions again because the user might have
+            # changed since the subscription was created.
+            permissions = subscriber.user.permissions
+            if not permissions.access_all_entities(
+                POLICY_READ
+            ) and not permissions.check_entity(entity_id, POLICY_READ):
+                continue
+            if partial_message is None:
+                partial_message = messages.cached_state_diff_partial_message(event)
+            subscriber.send_message(f'{partial_message},"id":{subscriber.msg_id}}}')
 
 
 @callback
@@ -384,16 +456,10 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            msg["id"],
-        ),
-        run_immediately=True,
+    if (fan_out := hass.data.get(ENTITY_CHANGES_FAN_OUT)) is None:
+        fan_out = hass.data[ENTITY_CHANGES_FAN_OUT] = _EntityChangesFanOut(hass)
+    connection.subscriptions[msg["id"]] = fan_out.async_subscribe(
+        connection.send_message, entity_ids, connection.user, msg["id"]
     )
     connection.send_result(msg["id"])
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
@@ -28,6 +28,7 @@ current_connection = ContextVar["ActiveConnection | None"](
 
 MessageHandler = Callable[[HomeAssistant, "ActiveConnection", dict[str, Any]], None]
 BinaryHandler = Callable[[HomeAssistant, "ActiveConnection", bytes], None]
+WaitPendingMessages = Callable[[int], Coroutine[Any, Any, bool]]
 
 
 class ActiveConnection:
@@ -37,6 +38,7 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "_wait_pending_messages",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -54,11 +56,13 @@ class ActiveConnection:
         send_message: Callable[[str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_pending_messages: WaitPendingMessages | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self._wait_pending_messages = wait_pending_messages
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -80,6 +84,17 @@ class ActiveConnection:
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
 
+    async def async_wait_pending_messages(self, max_pending: int) -> bool:
+        """Wait until fewer than max_pending messages wait to be sent.
+
+        Lets commands which send a lot of messages wait for a slow client
+        instead of queueing all of them. Returns False if the connection
+        is closed.
+        """
+        if self._wait_pending_messages is None:
+            return True
+        return await self._wait_pending_messages(max_pending)
+
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
         description = self.user.name or ""
@@ -75,6 +75,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_drain_future",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -96,6 +97,8 @@ class WebSocketHandler:
         # an asyncio.Queue.
         self._message_queue: deque[str | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # Resolved when the writer has sent the messages it took from the queue
+        self._drain_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -129,6 +132,9 @@ class WebSocketHandler:
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
+                if (drain_future := self._drain_future) and not drain_future.done():
+                    drain_future.set_result(None)
+
                 if (messages_remaining := len(message_queue)) == 0:
                     self._ready_future = loop.create_future()
                     await self._ready_future
@@ -170,9 +176,29 @@ class WebSocketHandler:
             debug("%s: Unexpected error in writer: %s", self.description, ex)
         finally:
             debug("%s: Writer done", self.description)
+            # Release the senders waiting for the queue to drain
+            if (drain_future := self._drain_future) and not drain_future.done():
+                drain_future.set_result(None)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    async def _async_wait_pending_messages(self, max_pending: int) -> bool:
+        """Wait until fewer than max_pending messages wait to be sent.
+
+        Returns False if the connection is closed.
+        """
+        while (
+            not self._closing
+            and (writer_task := self._writer_task) is not None
+            and not writer_task.done()
+        ):
+            if len(self._message_queue) < max_pending:
+                return True
+            if (drain_future := self._drain_future) is None or drain_future.done():
+                drain_future = self._drain_future = self._hass.loop.create_future()
+            await drain_future
+        return False
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -291,7 +317,14 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(logger, hass, self._send_message, self._cancel, request)
+        auth = AuthPhase(
+            logger,
+            hass,
+            self._send_message,
+            self._async_wait_pending_messages,
+            self._cancel,
+            request,
+        )
         connection = None
         disconnect_warn = None
 
@@ -460,5 +493,6 @@ class WebSocketHandler:
                     self._handle_task = None
                     self._writer_task = None
                     self._ready_future = None
+                    self._drain_future = None
 
         return wsock
@@ -1,7 +1,6 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
-from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, Final, cast
 
@@ -39,6 +38,10 @@ ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
 
+# Names of the JSON encodings of events cached by Event.cached_json
+EVENT_MESSAGE_SHAPE = "websocket_api_event_message"
+STATE_DIFF_MESSAGE_SHAPE = "websocket_api_state_diff_message"
+
 BASE_ERROR_MESSAGE = {
     "type": const.TYPE_RESULT,
     "success": False,
@@ -108,13 +111,17 @@ def cached_event_message(iden: int, event: Event) -> str:
     return f'{_partial_cached_event_message(event)[:-1]},"id":{iden}}}'
 
 
-@lru_cache(maxsize=128)
 def _partial_cached_event_message(event: Event) -> str:
-    """Cache and serialize the event to json.
+    """Serialize the event to json once.
 
     The message is constructed without the id which appended
     in cached_event_message.
     """
+    return event.cached_json(EVENT_MESSAGE_SHAPE, _event_message_json)
+
+
+def _event_message_json(event: Event) -> str:
+    """Serialize an event message without the id."""
     return (
         _message_to_json_or_none({"type": "event", "event": event.as_dict()})
         or INVALID_JSON_PARTIAL_MESSAGE
@@ -133,13 +140,26 @@ def cached_state_diff_message(iden: int, event: Event) -> str:
     return f'{_partial_cached_state_diff_message(event)[:-1]},"id":{iden}}}'
 
 
-@lru_cache(maxsize=128)
+def cached_state_diff_partial_message(event: Event) -> str:
+    """Return an event message without the id and the closing brace.
+
+    The caller appends the id of each subscription which lets the
+    event be serialized once for all of them.
+    """
+    return _partial_cached_state_diff_message(event)[:-1]
+
+
 def _partial_cached_state_diff_message(event: Event) -> str:
-    """Cache and serialize the event to json.
+    """Serialize the state diff of the event to json once.
 
     The message is constructed without the id which
     will be appended in cached_state_diff_message
     """
+    return event.cached_json(STATE_DIFF_MESSAGE_SHAPE, _state_diff_message_json)
+
+
+def _state_diff_message_json(event: Event) -> str:
+    """Serialize a state diff event message without the id."""
     return (
         _message_to_json_or_none({"type": "event", "event": _state_diff_event(event)})
         or INVALID_JSON_PARTIAL_MESSAGE
@@ -21,6 +21,7 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_RADIUS,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_HOME,
     STATE_NOT_HOME,
@@ -41,6 +42,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .index import ZoneIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,7 +99,8 @@ STORAGE_VERSION = 1
 
 ENTITY_ID_SORTER = attrgetter("entity_id")
 
-ZONE_ENTITY_IDS = "zone_entity_ids"
+ZONE_ENTITY_ID_PREFIX = f"{DOMAIN}."
+ZONE_INDEX = "zone_index"
 
 
 @bind_hass
@@ -112,8 +115,11 @@ def async_active_zone(
     min_dist = None
     closest = None
     # This can be called before async_setup by device tracker
-    zone_entity_ids: list[str] = hass.data.get(ZONE_ENTITY_IDS, [])
-    for entity_id in zone_entity_ids:
+    zone_index: ZoneIndex | None = hass.data.get(ZONE_INDEX)
+    if zone_index is None:
+        return None
+    # Only the zones near the location are tested
+    for entity_id in zone_index.async_candidates(latitude, longitude, radius):
         zone = hass.states.get(entity_id)
         if (
             not zone
@@ -148,28 +154,34 @@ def async_active_zone(
 
 
 @callback
-def async_setup_track_zone_entity_ids(hass: HomeAssistant) -> None:
-    """Set up track of entity IDs for zones."""
-    zone_entity_ids: list[str] = hass.states.async_entity_ids(DOMAIN)
-    hass.data[ZONE_ENTITY_IDS] = zone_entity_ids
+def async_setup_zone_index(hass: HomeAssistant) -> None:
+    """Set up the spatial index of the zones."""
+    zone_index = hass.data[ZONE_INDEX] = ZoneIndex()
+    for state in hass.states.async_all(DOMAIN):
+        zone_index.async_update(state.entity_id, state)
 
     @callback
-    def _async_add_zone_entity_id(
+    def _async_zone_state_filter(
         event_: EventType[event.EventStateChangedData],
-    ) -> None:
-        """Add zone entity ID."""
-        zone_entity_ids.append(event_.data["entity_id"])
-        zone_entity_ids.sort()
+    ) -> bool:
+        """Filter state changes of zones."""
+        return event_.data["entity_id"].startswith(ZONE_ENTITY_ID_PREFIX)
 
     @callback
-    def _async_remove_zone_entity_id(
+    def _async_update_zone_index(
         event_: EventType[event.EventStateChangedData],
     ) -> None:
-        """Remove zone entity ID."""
-        zone_entity_ids.remove(event_.data["entity_id"])
-
-    event.async_track_state_added_domain(hass, DOMAIN, _async_add_zone_entity_id)
-    event.async_track_state_removed_domain(hass, DOMAIN, _async_remove_zone_entity_id)
+        """Update the zone in the index."""
+        zone_index.async_update(event_.data["entity_id"], event_.data["new_state"])
+
+    # The index is updated as soon as a zone changes so lookups
+    # never see the old location of a zone
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        _async_update_zone_index,  # type: ignore[arg-type]
+        event_filter=_async_zone_state_filter,  # type: ignore[arg-type]
+        run_immediately=True,
+    )
 
 
 def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -> bool:
@@ -215,7 +227,7 @@ class ZoneStorageCollection(collection.DictStorageCollection):
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up configured zones as well as Home Assistant zone if necessary."""
-    async_setup_track_zone_entity_ids(hass)
+    async_setup_zone_index(hass)
 
     component = entity_component.EntityComponent[Zone](_LOGGER, DOMAIN, hass)
     id_manager = collection.IDManager()
@@ -0,0 +1,129 @@
+"""Spatial index of the zones used to find the zones near a location."""
+from __future__ import annotations
+
+from bisect import insort
+from collections import defaultdict
+from collections.abc import Iterable
+import math
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import State, callback
+
+from .const import ATTR_RADIUS
+
+# Size of a grid cell in degrees, about 11km in latitude
+CELL_SIZE = 0.1
+LONGITUDE_CELLS = round(360 / CELL_SIZE)
+# Zones and lookups covering more cells are not put in the grid
+MAX_CELLS = 64
+
+# Lower bounds for the meters per degree of latitude and of longitude at
+# the equator on the WGS-84 ellipsoid, rounded down so the bounding boxes
+# always cover the zone
+MIN_METERS_PER_DEGREE_LATITUDE = 110_000
+MIN_METERS_PER_DEGREE_LONGITUDE = 111_000
+# Margin for the difference between the spherical approximation used for
+# the bounding boxes and the distances on the ellipsoid
+DISTANCE_MARGIN = 1.01
+# Longitude degrees get too small close to the poles to bound the longitude
+MAX_BOUNDED_LATITUDE = 89.0
+
+
+def _cells(latitude: float, longitude: float, radius: float) -> list[int] | None:
+    """Return the grid cells covering a circle.
+
+    Returns None if the circle covers too many cells to put in the grid.
+    """
+    radius = max(radius, 0) * DISTANCE_MARGIN + 1
+    latitude_delta = radius / MIN_METERS_PER_DEGREE_LATITUDE
+    min_latitude = max(latitude - latitude_delta, -90.0)
+    max_latitude = min(latitude + latitude_delta, 90.0)
+    max_abs_latitude = max(abs(min_latitude), abs(max_latitude))
+    if max_abs_latitude >= MAX_BOUNDED_LATITUDE:
+        return None
+    longitude_delta = radius / (
+        MIN_METERS_PER_DEGREE_LONGITUDE * math.cos(math.radians(max_abs_latitude))
+    )
+    if longitude_delta >= 180:
+        return None
+    min_row = math.floor(min_latitude / CELL_SIZE)
+    max_row = math.floor(max_latitude / CELL_SIZE)
+    min_column = math.floor((longitude - longitude_delta) / CELL_SIZE)
+    max_column = math.floor((longitude + longitude_delta) / CELL_SIZE)
+    if (max_row - min_row + 1) * (max_column - min_column + 1) > MAX_CELLS:
+        return None
+    return [
+        row * LONGITUDE_CELLS + column % LONGITUDE_CELLS
+        for row in range(min_row, max_row + 1)
+        for column in range(min_column, max_column + 1)
+    ]
+
+
+class ZoneIndex:
+    """Grid over the bounding boxes of the zones.
+
+    Each zone is added to the cells its circle overlaps. Zones which cover
+    too many cells or have no valid location are candidates for every lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self.entity_ids: list[str] = []
+        self._grid: defaultdict[int, set[str]] = defaultdict(set)
+        self._zone_cells: dict[str, list[int]] = {}
+        self._unbounded: set[str] = set()
+
+    @callback
+    def async_update(self, entity_id: str, state: State | None) -> None:
+        """Add, move or remove a zone."""
+        if entity_id in self._zone_cells or entity_id in self._unbounded:
+            self._remove(entity_id)
+        else:
+            if state is None:
+                return
+            insort(self.entity_ids, entity_id)
+        if state is None:
+            self.entity_ids.remove(entity_id)
+            return
+        attributes = state.attributes
+        try:
+            cells = _cells(
+                float(attributes[ATTR_LATITUDE]),
+                float(attributes[ATTR_LONGITUDE]),
+                float(attributes[ATTR_RADIUS]),
+            )
+        except (KeyError, TypeError, ValueError):
+            cells = None
+        if cells is None:
+            self._unbounded.add(entity_id)
+            return
+        self._zone_cells[entity_id] = cells
+        for cell in cells:
+            self._grid[cell].add(entity_id)
+
+    def _remove(self, entity_id: str) -> None:
+        """Remove a zone from the grid."""
+        self._unbounded.discard(entity_id)
+        for cell in self._zone_cells.pop(entity_id, ()):
+            zones = self._grid[cell]
+            zones.discard(entity_id)
+            if not zones:
+                del self._grid[cell]
+
+    @callback
+    def async_candidates(
+        self, latitude: float, longitude: float, radius: float
+    ) -> Iterable[str]:
+        """Return the sorted entity ids of the zones which may contain a location.
+
+        A zone contains the location if the circles around the zone and
+        around the location overlap.
+        """
+        if (cells := _cells(latitude, longitude, radius)) is None:
+            return self.entity_ids
+        candidates = set(self._unbounded)
+        grid = self._grid
+        for cell in cells:
+            if cell in grid:
+                candidates.update(grid[cell])
+        return sorted(candidates)
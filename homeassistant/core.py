@@ -967,7 +967,15 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ("event_type", "data", "origin", "time_fired", "context", "_as_dict")
+    __slots__ = (
+        "event_type",
+        "data",
+        "origin",
+        "time_fired",
+        "context",
+        "_as_dict",
+        "_json_cache",
+    )
 
     def __init__(
         self,
@@ -988,6 +996,7 @@ class Event:
             )
         self.context = context
         self._as_dict: ReadOnlyDict[str, Any] | None = None
+        self._json_cache: dict[str, str] | None = None
         if not context.origin_event:
             context.origin_event = self
 
@@ -1008,6 +1017,20 @@ class Event:
             )
         return self._as_dict
 
+    def cached_json(self, shape: str, encoder: Callable[[Event], str]) -> str:
+        """Return the event encoded as JSON, encoding it only once per shape.
+
+        Consumers which send the same shape of an event to many receivers
+        share the encoding by passing the same shape name and encoder.
+
+        Async friendly.
+        """
+        if (json_cache := self._json_cache) is None:
+            json_cache = self._json_cache = {}
+        if (encoded := json_cache.get(shape)) is None:
+            encoded = json_cache[shape] = encoder(self)
+        return encoded
+
     def __repr__(self) -> str:
         """Return the representation."""
         if self.data:
@@ -1025,17 +1048,36 @@ _FilterableJobType = tuple[
     bool,  # run_immediately
 ]
 
+_KeyedListenersType = dict[
+    str | tuple[str, ...],  # data key
+    dict[Any, list[_FilterableJobType]],  # listeners by data value
+]
+
+
+def _keyed_data_value(data: Mapping[str, Any], data_key: str | tuple[str, ...]) -> Any:
+    """Return the value of a data key of an event.
+
+    A tuple of data keys returns the value of the first key in the data.
+    """
+    if isinstance(data_key, str):
+        return data.get(data_key)
+    for key in data_key:
+        if key in data:
+            return data[key]
+    return None
+
 
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = ("_listeners", "_match_all_listeners", "_keyed_listeners", "_hass")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._keyed_listeners: dict[str, _KeyedListenersType] = {}
         self._hass = hass
 
     @callback
@@ -1044,7 +1086,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs)
+                for jobs_by_value in keyed_listeners.values()
+                for jobs in jobs_by_value.values()
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1083,19 +1132,34 @@ class EventBus:
 
         listeners = self._listeners.get(event_type, [])
         match_all_listeners = self._match_all_listeners
+        keyed_listeners = self._keyed_listeners.get(event_type)
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners and not match_all_listeners:
+        if not listeners and not match_all_listeners and keyed_listeners is None:
             return
 
         # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
         if event_type != EVENT_HOMEASSISTANT_CLOSE:
             listeners = match_all_listeners + listeners
 
+        if keyed_listeners is not None:
+            # Keyed listeners are looked up by the value of their data key
+            # so only the matching ones are run.
+            keyed_jobs: list[_FilterableJobType] = []
+            for data_key, jobs_by_value in keyed_listeners.items():
+                try:
+                    jobs = jobs_by_value.get(_keyed_data_value(event.data, data_key))
+                except TypeError:  # unhashable data value
+                    continue
+                if jobs:
+                    keyed_jobs.extend(jobs)
+            if keyed_jobs:
+                listeners = listeners + keyed_jobs
+
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -1180,6 +1244,59 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        data_key: str | tuple[str, ...],
+        data_values: Iterable[Any],
+        listener: Callable[[Event], Coroutine[Any, Any, None] | None],
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with specific data values.
+
+        The listener only runs when the value of data_key in the event
+        data is one of data_values. When data_key is a tuple of keys, the
+        value of the first key which is in the event data is used.
+
+        Unlike an event_filter, the listeners are looked up by the data
+        value so the cost of firing an event does not grow with the number
+        of keyed listeners.
+
+        If run_immediately is passed, the callback will be run
+        right away instead of using call_soon. Only use this if
+        the callback results in scheduling another task.
+
+        This method must be run in the event loop.
+        """
+        job_type: HassJobType | None = None
+        if run_immediately:
+            if not is_callback_check_partial(listener):
+                raise HomeAssistantError(f"Event listener {listener} is not a callback")
+            job_type = HassJobType.Callback
+        data_values = list(data_values)
+        filterable_job: _FilterableJobType = (
+            HassJob(
+                listener,
+                f"listen {event_type} {data_key} {data_values}",
+                job_type=job_type,
+            ),
+            None,
+            run_immediately,
+        )
+        jobs_by_value = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        )
+        for data_value in data_values:
+            jobs_by_value.setdefault(data_value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener,
+            event_type,
+            data_key,
+            data_values,
+            filterable_job,
+        )
+
     def listen_once(
         self,
         event_type: str,
@@ -1272,6 +1389,37 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: str,
+        data_key: str | tuple[str, ...],
+        data_values: list[Any],
+        filterable_job: _FilterableJobType,
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            jobs_by_value = keyed_listeners[data_key]
+            for data_value in data_values:
+                jobs = jobs_by_value[data_value]
+                jobs.remove(filterable_job)
+                if not jobs:
+                    del jobs_by_value[data_value]
+            if not jobs_by_value:
+                del keyed_listeners[data_key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+        except (KeyError, ValueError):
+            # KeyError is key event_type, data_key or data_value did not exist
+            # ValueError if listener did not exist within data_value
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -1317,6 +1465,7 @@ class State:
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._json_cache: dict[str, str] | None = None
 
     @property
     def name(self) -> str:
@@ -1391,6 +1540,22 @@ class State:
         """
         return json_dumps({self.entity_id: self.as_compressed_state})[1:-1]
 
+    def cached_json(self, shape: str, encoder: Callable[[State], str]) -> str:
+        """Return the state encoded as JSON, encoding it only once per shape.
+
+        This is for shapes other than as_dict_json and
+        as_compressed_state_json. Consumers which send the same shape of a
+        state to many receivers share the encoding by passing the same
+        shape name and encoder.
+
+        Async friendly.
+        """
+        if (json_cache := self._json_cache) is None:
+            json_cache = self._json_cache = {}
+        if (encoded := json_cache.get(shape)) is None:
+            encoded = json_cache[shape] = encoder(self)
+        return encoded
+
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
         """Initialize a state from a dict.
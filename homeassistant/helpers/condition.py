@@ -63,6 +63,7 @@ from .template import Template, attach as template_attach, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_enabled_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -126,6 +127,9 @@ def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceEleme
 
 def condition_trace_set_result(result: bool, **kwargs: Any) -> None:
     """Set the result of TraceElement at the top of the stack."""
+    if not trace_enabled_cv.get():
+        return
+
     node = trace_stack_top(trace_stack_cv)
 
     # The condition function may be called directly, in which case tracing
@@ -138,6 +142,9 @@ def condition_trace_set_result(result: bool, **kwargs: Any) -> None:
 
 def condition_trace_update_result(**kwargs: Any) -> None:
     """Update the result of TraceElement at the top of the stack."""
+    if not trace_enabled_cv.get():
+        return
+
     node = trace_stack_top(trace_stack_cv)
 
     # The condition function may be called directly, in which case tracing
@@ -175,6 +182,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if not trace_enabled_cv.get():
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -183,6 +192,25 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     return wrapper
 
 
+def _trace_paths(key: str, count: int) -> list[list[str]]:
+    """Return the trace paths of the items of a config list."""
+    return [[key, str(index)] for index in range(count)]
+
+
+def _check_with_trace_path(
+    tracing: bool,
+    path: list[str],
+    check: ConditionCheckerType,
+    hass: HomeAssistant,
+    variables: TemplateVarsType,
+) -> bool | None:
+    """Run a condition check, tracking the trace path only while tracing."""
+    if not tracing:
+        return check(hass, variables)
+    with trace_path(path):
+        return check(hass, variables)
+
+
 async def _async_get_condition_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionProtocol | None:
@@ -252,6 +280,7 @@ async def async_and_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    paths = _trace_paths("conditions", len(checks))
 
     @trace_condition_function
     def if_and_condition(
@@ -259,11 +288,16 @@ async def async_and_from_config(
     ) -> bool:
         """Test and condition."""
         errors = []
+        tracing = trace_enabled_cv.get()
         for index, check in enumerate(checks):
             try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is False:
-                        return False
+                if (
+                    _check_with_trace_path(
+                        tracing, paths[index], check, hass, variables
+                    )
+                    is False
+                ):
+                    return False
             except ConditionError as ex:
                 errors.append(
                     ConditionErrorIndex("and", index=index, total=len(checks), error=ex)
@@ -283,6 +317,7 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    paths = _trace_paths("conditions", len(checks))
 
     @trace_condition_function
     def if_or_condition(
@@ -290,11 +325,16 @@ async def async_or_from_config(
     ) -> bool:
         """Test or condition."""
         errors = []
+        tracing = trace_enabled_cv.get()
         for index, check in enumerate(checks):
             try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables) is True:
-                        return True
+                if (
+                    _check_with_trace_path(
+                        tracing, paths[index], check, hass, variables
+                    )
+                    is True
+                ):
+                    return True
             except ConditionError as ex:
                 errors.append(
                     ConditionErrorIndex("or", index=index, total=len(checks), error=ex)
@@ -314,6 +354,7 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    paths = _trace_paths("conditions", len(checks))
 
     @trace_condition_function
     def if_not_condition(
@@ -321,11 +362,13 @@ async def async_not_from_config(
     ) -> bool:
         """Test not condition."""
         errors = []
+        tracing = trace_enabled_cv.get()
         for index, check in enumerate(checks):
             try:
-                with trace_path(["conditions", str(index)]):
-                    if check(hass, variables):
-                        return False
+                if _check_with_trace_path(
+                    tracing, paths[index], check, hass, variables
+                ):
+                    return False
             except ConditionError as ex:
                 errors.append(
                     ConditionErrorIndex("not", index=index, total=len(checks), error=ex)
@@ -494,6 +537,7 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     below = config.get(CONF_BELOW)
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
+    paths = _trace_paths(CONF_ENTITY_ID, len(entity_ids))
 
     @trace_condition_function
     def if_numeric_state(
@@ -504,9 +548,22 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
             value_template.hass = hass
 
         errors = []
+        tracing = trace_enabled_cv.get()
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
+                if not tracing:
+                    if not async_numeric_state(
+                        hass,
+                        entity_id,
+                        below,
+                        above,
+                        value_template,
+                        variables,
+                        attribute,
+                    ):
+                        return False
+                    continue
+                with trace_path(paths[index]), trace_condition(variables):
                     if not async_numeric_state(
                         hass,
                         entity_id,
@@ -545,6 +602,39 @@ def state(
 
     Async friendly.
     """
+    if not isinstance(req_state, list):
+        req_state = [req_state]
+
+    return _state(
+        hass,
+        entity,
+        _compile_wanted_states(req_state),
+        for_period,
+        attribute,
+        variables,
+    )
+
+
+def _compile_wanted_states(req_states: list[Any]) -> list[tuple[Any, bool]]:
+    """Resolve which wanted states refer to the state of an input entity."""
+    return [
+        (
+            req_state,
+            isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state) is not None,
+        )
+        for req_state in req_states
+    ]
+
+
+def _state(
+    hass: HomeAssistant,
+    entity: None | str | State,
+    wanted_states: list[tuple[Any, bool]],
+    for_period: Any,
+    attribute: str | None,
+    variables: TemplateVarsType,
+) -> bool:
+    """Test if state matches the wanted states resolved by _compile_wanted_states."""
     if entity is None:
         raise ConditionErrorMessage("state", "no entity specified")
 
@@ -570,16 +660,10 @@ def state(
     else:
         value = entity.attributes.get(attribute)
 
-    if not isinstance(req_state, list):
-        req_state = [req_state]
-
     is_state = False
-    for req_state_value in req_state:
+    for req_state_value, is_input_entity in wanted_states:
         state_value = req_state_value
-        if (
-            isinstance(req_state_value, str)
-            and INPUT_ENTITY_ID.match(req_state_value) is not None
-        ):
+        if is_input_entity:
             if not (state_entity := hass.states.get(req_state_value)):
                 raise ConditionErrorMessage(
                     "state", f"the 'state' entity {req_state_value} is unavailable"
@@ -593,12 +677,13 @@ def state(
         condition_trace_set_result(is_state, state=value, wanted_state=state_value)
         return is_state
 
-    try:
-        for_period = cv.positive_time_period(render_complex(for_period, variables))
-    except TemplateError as ex:
-        raise ConditionErrorMessage("state", f"template error: {ex}") from ex
-    except vol.Invalid as ex:
-        raise ConditionErrorMessage("state", f"schema error: {ex}") from ex
+    if not isinstance(for_period, timedelta):
+        try:
+            for_period = cv.positive_time_period(render_complex(for_period, variables))
+        except TemplateError as ex:
+            raise ConditionErrorMessage("state", f"template error: {ex}") from ex
+        except vol.Invalid as ex:
+            raise ConditionErrorMessage("state", f"schema error: {ex}") from ex
 
     duration = dt_util.utcnow() - cast(timedelta, for_period)
     duration_ok = duration > entity.last_changed
@@ -617,20 +702,36 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
     if not isinstance(req_states, list):
         req_states = [req_states]
 
+    wanted_states = _compile_wanted_states(req_states)
+    # A static period does not need to be rendered on every test
+    for_template = None if isinstance(for_period, timedelta) else for_period
+    match_all = match == ENTITY_MATCH_ALL
+    paths = _trace_paths(CONF_ENTITY_ID, len(entity_ids))
+
     @trace_condition_function
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
-        template_attach(hass, for_period)
+        if for_template is not None:
+            template_attach(hass, for_template)
         errors = []
         result: bool = match != ENTITY_MATCH_ANY
+        tracing = trace_enabled_cv.get()
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
-                    if state(
-                        hass, entity_id, req_states, for_period, attribute, variables
+                if not tracing:
+                    if _state(
+                        hass, entity_id, wanted_states, for_period, attribute, variables
+                    ):
+                        result = True
+                    elif match_all:
+                        return False
+                    continue
+                with trace_path(paths[index]), trace_condition(variables):
+                    if _state(
+                        hass, entity_id, wanted_states, for_period, attribute, variables
                     ):
                         result = True
-                    elif match == ENTITY_MATCH_ALL:
+                    elif match_all:
                         return False
             except ConditionError as ex:
                 errors.append(
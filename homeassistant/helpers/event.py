@@ -28,6 +28,7 @@ from homeassistant.core import (
     HomeAssistant,
     State,
     callback,
+    is_callback_check_partial,
     split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
@@ -57,12 +58,6 @@ TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 TRACK_STATE_REMOVED_DOMAIN_CALLBACKS = "track_state_removed_domain_callbacks"
 TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 
-TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
-TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
-
-TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
-TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
-
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -412,41 +407,27 @@ def _async_track_event(
 
 
 @callback
-def _async_dispatch_old_entity_id_or_entity_id_event(
+def _async_listen_registry_updated_event(
     hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventEntityRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventEntityRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data.get("old_entity_id", event.data["entity_id"]),
-                job,
-            )
+    event_type: str,
+    data_key: str | tuple[str, ...],
+    keys: str | Iterable[str],
+    action: Callable[[EventType[Any]], Any],
+) -> CALLBACK_TYPE:
+    """Listen for registry updated events keyed by data_key."""
+    if not keys:
+        return _remove_empty_listener
 
+    if isinstance(keys, str):
+        keys = [keys]
 
-@callback
-def _async_entity_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventEntityRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventEntityRegistryUpdatedData],
-) -> bool:
-    """Filter entity registry updates by entity_id."""
-    return event.data.get("old_entity_id", event.data["entity_id"]) in callbacks
+    return hass.bus.async_listen_keyed(
+        event_type,
+        data_key,
+        keys,
+        action,  # type: ignore[arg-type]
+        run_immediately=is_callback_check_partial(action),
+    )
 
 
 @bind_hass
@@ -462,52 +443,15 @@ def async_track_entity_registry_updated_event(
 
     Similar to async_track_state_change_event.
     """
-    return _async_track_event(
+    return _async_listen_registry_updated_event(
         hass,
-        entity_ids,
-        TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS,
-        TRACK_ENTITY_REGISTRY_UPDATED_LISTENER,
         EVENT_ENTITY_REGISTRY_UPDATED,
-        _async_dispatch_old_entity_id_or_entity_id_event,
-        _async_entity_registry_updated_filter,
+        ("old_entity_id", "entity_id"),
+        entity_ids,
         action,
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventDeviceRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventDeviceRegistryUpdatedData],
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event.data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[
-        str, list[HassJob[[EventType[EventDeviceRegistryUpdatedData]], Any]]
-    ],
-    event: EventType[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
-
-
 @callback
 def async_track_device_registry_updated_event(
     hass: HomeAssistant,
@@ -518,15 +462,8 @@ def async_track_device_registry_updated_event(
 
     Similar to async_track_entity_registry_updated_event.
     """
-    return _async_track_event(
-        hass,
-        device_ids,
-        TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS,
-        TRACK_DEVICE_REGISTRY_UPDATED_LISTENER,
-        EVENT_DEVICE_REGISTRY_UPDATED,
-        _async_dispatch_device_id_event,
-        _async_device_registry_updated_filter,
-        action,
+    return _async_listen_registry_updated_event(
+        hass, EVENT_DEVICE_REGISTRY_UPDATED, "device_id", device_ids, action
     )
 
 
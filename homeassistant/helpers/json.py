@@ -141,6 +141,9 @@ def json_dumps_sorted(data: Any) -> str:
 
 JSON_DUMP: Final = json_dumps
 
+json_fragment = orjson.Fragment
+"""Wrap pre-encoded JSON to embed it when dumping json."""
+
 
 def _orjson_default_encoder(data: Any) -> str:
     """JSON encoder that uses orjson with hass defaults."""
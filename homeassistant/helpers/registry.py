@@ -0,0 +1,65 @@
+"""Provide a base implementation for registries."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import UserDict, defaultdict
+from collections.abc import ValuesView
+from typing import Literal, TypeVar
+
+_DataT = TypeVar("_DataT")
+
+# Maps an indexed value to the keys of the entries having that value,
+# a dict is used as an ordered set to keep the insertion order of the entries
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+class BaseRegistryItems(UserDict[str, _DataT], ABC):
+    """Base class for registry items."""
+
+    def values(self) -> ValuesView[_DataT]:
+        """Return the underlying values to avoid __iter__ overhead."""
+        return self.data.values()
+
+    @abstractmethod
+    def _index_entry(self, key: str, entry: _DataT) -> None:
+        """Index an entry."""
+
+    @abstractmethod
+    def _unindex_entry(self, key: str) -> None:
+        """Unindex an entry."""
+
+    def __setitem__(self, key: str, entry: _DataT) -> None:
+        """Add an item."""
+        data = self.data
+        if key in data:
+            self._unindex_entry(key)
+        data[key] = entry
+        self._index_entry(key, entry)
+
+    def _unindex_entry_value(
+        self, key: str, value: str, index: RegistryIndexType
+    ) -> None:
+        """Unindex an entry value.
+
+        key is the entry key
+        value is the value to unindex such as config_entry_id or device_id.
+        index is the index to unindex from.
+        """
+        entries = index[value]
+        del entries[key]
+        if not entries:
+            del index[value]
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._unindex_entry(key)
+        super().__delitem__(key)
+
+    def _entries_for_index_value(
+        self, index: RegistryIndexType, value: str
+    ) -> list[_DataT]:
+        """Return the entries with a value in an index."""
+        if not (keys := index.get(value)):
+            return []
+        data = self.data
+        return [data[key] for key in keys]
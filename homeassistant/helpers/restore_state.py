@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
+import orjson
+
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
@@ -15,7 +18,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes
 from .storage import Store
 
 DATA_RESTORE_STATE = "restore_state"
@@ -93,6 +96,17 @@ class StoredState:
         )
 
 
+class _EncodedState:
+    """The JSON of the state of an entity which is reused until it changes."""
+
+    __slots__ = ("state", "state_json")
+
+    def __init__(self, state: State) -> None:
+        """Initialize the encoded state."""
+        self.state = state
+        self.state_json = orjson.Fragment(state.as_dict_json)
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     restore_state = RestoreStateData(hass)
@@ -137,6 +151,8 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The states encoded by the last dump by entity id
+        self._encoded_states: dict[str, _EncodedState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -176,6 +192,19 @@ class RestoreStateData:
         entities on this run, and have not expired.
         """
         now = dt_util.utcnow()
+        return [
+            StoredState(state, extra_data, last_seen or now)
+            for state, extra_data, last_seen in self._async_iter_stored_states(now)
+        ]
+
+    @callback
+    def _async_iter_stored_states(
+        self, now: datetime
+    ) -> Iterator[tuple[State, ExtraStoredData | None, datetime | None]]:
+        """Iterate over the states which should be stored.
+
+        The last seen time is None for the states of registered entities.
+        """
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
         current_entity_ids = {
@@ -185,15 +214,15 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                state, self.entities[state.entity_id].extra_restore_state_data, now
-            )
-            for state in all_states
-            if state.entity_id in self.entities and
-            # Ignore all states that are entity registry placeholders
-            not state.attributes.get(ATTR_RESTORED)
-        ]
+        for state in all_states:
+            if (
+                entity := self.entities.get(state.entity_id)
+            ) is not None and not state.attributes.get(
+                # Ignore all states that are entity registry placeholders
+                ATTR_RESTORED
+            ):
+                yield state, entity.extra_restore_state_data, None
+
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
@@ -207,20 +236,51 @@ class RestoreStateData:
             if stored_state.last_seen < expiration_time:
                 continue
 
-            stored_states.append(stored_state)
+            yield stored_state.state, stored_state.extra_data, stored_state.last_seen
+
+    @callback
+    def _async_get_encoded_stored_states(self) -> list[dict[str, Any]]:
+        """Get the states which should be stored with their JSON.
 
+        Only the states which changed since the last dump are encoded on
+        the event loop, the JSON of the whole file is assembled from the
+        encoded states when it is written.
+        """
+        now = dt_util.utcnow()
+        previous_encoded_states = self._encoded_states
+        encoded_states: dict[str, _EncodedState] = {}
+        self._encoded_states = encoded_states
+        stored_states: list[dict[str, Any]] = []
+        for state, extra_data, last_seen in self._async_iter_stored_states(now):
+            entity_id = state.entity_id
+            try:
+                if (
+                    encoded_state := previous_encoded_states.get(entity_id)
+                ) is None or encoded_state.state is not state:
+                    encoded_state = _EncodedState(state)
+                # Extra data is usually small and may be changed in place,
+                # it is encoded every time
+                extra_data_json = orjson.Fragment(
+                    json_bytes(extra_data.as_dict() if extra_data else None)
+                )
+            except TypeError as err:
+                _LOGGER.error("Unable to save the state of %s: %s", entity_id, err)
+                continue
+            encoded_states[entity_id] = encoded_state
+            stored_states.append(
+                {
+                    "state": encoded_state.state_json,
+                    "extra_data": extra_data_json,
+                    "last_seen": last_seen or now,
+                }
+            )
         return stored_states
 
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(self._async_get_encoded_stored_states())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -9,6 +9,7 @@ import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
+import threading
 from typing import Any, Generic, TypeVar
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
@@ -27,6 +28,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 
 from . import json as json_helper
+from .storage_database import STORAGE_DATABASE, StorageDatabase
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -35,6 +37,9 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+DATA_STORAGE_DATABASE = "storage_database"
+
+_STORAGE_DATABASE_LOCK = threading.Lock()
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -79,6 +84,20 @@ async def async_migrator(
     return config
 
 
+def _get_storage_database(hass: HomeAssistant) -> StorageDatabase | None:
+    """Return the database which keeps the data of the stores if there is one.
+
+    Must be called from the executor.
+    """
+    with _STORAGE_DATABASE_LOCK:
+        if DATA_STORAGE_DATABASE not in hass.data:
+            path = hass.config.path(STORAGE_DIR, STORAGE_DATABASE)
+            hass.data[DATA_STORAGE_DATABASE] = (
+                StorageDatabase(path) if os.path.exists(path) else None
+            )
+        return hass.data[DATA_STORAGE_DATABASE]
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -158,9 +177,7 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -353,11 +370,24 @@ class Store(Generic[_T]):
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self) -> Any:
+        """Load the data from the storage database or the JSON file."""
+        if (database := _get_storage_database(self.hass)) is not None and (
+            data := database.load(self.key)
+        ) is not None:
+            return data
+        return json_util.load_json(self.path)
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
+        if (database := _get_storage_database(self.hass)) is not None:
+            _LOGGER.debug("Writing data for %s to %s", self.key, database.path)
+            database.write(self.key, data, self._encoder)
+            return
+
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
@@ -378,5 +408,11 @@ class Store(Generic[_T]):
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
 
+        await self.hass.async_add_executor_job(self._remove_data)
+
+    def _remove_data(self) -> None:
+        """Remove the data from the storage database and the JSON file."""
+        if (database := _get_storage_database(self.hass)) is not None:
+            database.remove(self.key)
         with suppress(FileNotFoundError):
-            await self.hass.async_add_executor_job(os.unlink, self.path)
+            os.unlink(self.path)
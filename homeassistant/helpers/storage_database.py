@@ -0,0 +1,367 @@
+"""Keep the data of stores in a SQLite database instead of JSON files.
+
+When the database exists in the storage directory the stores keep their
+data in it. Lists of records with a unique id at the top level of the data
+of a store, like the entries of the registries, are kept as one row per
+record so a save only writes the records which changed.
+
+The database is created by migrating the JSON files to it, and the data
+can be migrated back to JSON files with the storage script.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, cast
+
+from homeassistant.util.file import WriteError
+from homeassistant.util.json import SerializationError, json_loads
+
+from .json import JSONEncoder, json_bytes, save_json
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_DATABASE = "storage.db"
+# Files next to the database which are part of it
+STORAGE_DATABASE_SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
+
+_SCHEMA = (
+    # The data of the stores without the lists which are kept as records
+    """
+    CREATE TABLE IF NOT EXISTS stores (
+        key TEXT PRIMARY KEY,
+        version INTEGER NOT NULL,
+        minor_version INTEGER NOT NULL,
+        data BLOB NOT NULL
+    ) WITHOUT ROWID
+    """,
+    # The ids of the records of a list in the order of the list
+    """
+    CREATE TABLE IF NOT EXISTS lists (
+        key TEXT NOT NULL,
+        name TEXT NOT NULL,
+        ids BLOB NOT NULL,
+        PRIMARY KEY (key, name)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS records (
+        key TEXT NOT NULL,
+        name TEXT NOT NULL,
+        id TEXT NOT NULL,
+        data BLOB NOT NULL,
+        PRIMARY KEY (key, name, id)
+    ) WITHOUT ROWID
+    """,
+)
+
+# Rows are only written when their data changed, which keeps the pages
+# of unchanged records out of the write ahead log
+_UPSERT_STORE = """
+    INSERT INTO stores (key, version, minor_version, data) VALUES (?, ?, ?, ?)
+    ON CONFLICT (key) DO UPDATE SET
+        version = excluded.version,
+        minor_version = excluded.minor_version,
+        data = excluded.data
+    WHERE version != excluded.version
+        OR minor_version != excluded.minor_version
+        OR data != excluded.data
+"""
+_UPSERT_LIST = """
+    INSERT INTO lists (key, name, ids) VALUES (?, ?, ?)
+    ON CONFLICT (key, name) DO UPDATE SET ids = excluded.ids
+    WHERE ids != excluded.ids
+"""
+_UPSERT_RECORD = """
+    INSERT INTO records (key, name, id, data) VALUES (?, ?, ?, ?)
+    ON CONFLICT (key, name, id) DO UPDATE SET data = excluded.data
+    WHERE data != excluded.data
+"""
+
+
+def _record_ids(value: Any) -> list[str] | None:
+    """Return the ids of a list of records with a unique id."""
+    if not isinstance(value, list) or not value:
+        return None
+    try:
+        ids = [record["id"] for record in value]
+    except (KeyError, TypeError):
+        return None
+    if set(map(type, ids)) != {str} or len(set(ids)) != len(ids):
+        return None
+    return ids
+
+
+def _load_ids(ids: bytes) -> list[str]:
+    """Load the ids of the records of a list."""
+    return cast(list[str], json_loads(ids))
+
+
+def _get_encoder(
+    encoder: type[json.JSONEncoder] | None,
+) -> Callable[[Any], bytes]:
+    """Return a function which encodes data like save_json does.
+
+    Home Assistant's JSONEncoder is the default encoder, which is
+    encoded with orjson.
+    """
+    if encoder and encoder is not JSONEncoder:
+        return lambda data: json.dumps(data, cls=encoder).encode()
+    return json_bytes
+
+
+class StorageDatabase:
+    """A SQLite database which keeps the data of stores.
+
+    The database can be used from any thread, the writes are serialized.
+    Every commit is synced to disk, as durable as the atomic writes of the
+    JSON files, since the database also keeps the auth and registry data.
+    The encoded records of the stores which were loaded or written are
+    kept in memory to find the records which changed without reading them.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open the database and create the tables."""
+        self.path = path
+        exists = os.path.exists(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        if not exists:
+            # The database contains the data of private stores
+            os.chmod(path, 0o600)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+        # The encoded records by list name of the stores by key
+        self._records: dict[str, dict[str, dict[str, bytes]]] = {}
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+            self._records.clear()
+
+    def keys(self) -> list[str]:
+        """Return the keys of the stores in the database."""
+        with self._lock:
+            return [
+                key
+                for (key,) in self._connection.execute(
+                    "SELECT key FROM stores ORDER BY key"
+                )
+            ]
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Load the data of a store as it would be loaded from its JSON file."""
+        with self._lock:
+            connection = self._connection
+            if (
+                row := connection.execute(
+                    "SELECT version, minor_version, data FROM stores WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            ) is None:
+                return None
+            version, minor_version, data = row
+            lists = connection.execute(
+                "SELECT name, ids FROM lists WHERE key = ?", (key,)
+            ).fetchall()
+            rows: dict[str, dict[str, bytes]] = {name: {} for name, _ in lists}
+            for name, record_id, record in connection.execute(
+                "SELECT name, id, data FROM records WHERE key = ?", (key,)
+            ):
+                rows[name][record_id] = record
+            records = self._records[key] = {
+                name: {record_id: rows[name][record_id] for record_id in _load_ids(ids)}
+                for name, ids in lists
+            }
+
+        store_data: Any = json_loads(data)
+        for name, list_records in records.items():
+            store_data[name] = [json_loads(record) for record in list_records.values()]
+        return {
+            "version": version,
+            "minor_version": minor_version,
+            "key": key,
+            "data": store_data,
+        }
+
+    def write(
+        self,
+        key: str,
+        data: dict[str, Any],
+        encoder: type[json.JSONEncoder] | None = None,
+    ) -> None:
+        """Write the data of a store in a single transaction.
+
+        Only the rows of the records which changed are written.
+        """
+        encode = _get_encoder(encoder)
+        store_data = data["data"]
+        lists: dict[str, tuple[list[str], list[dict[str, Any]]]] = {}
+        if isinstance(store_data, dict):
+            for name, value in store_data.items():
+                if (ids := _record_ids(value)) is not None:
+                    lists[name] = (ids, value)
+            if lists:
+                store_data = {
+                    name: value
+                    for name, value in store_data.items()
+                    if name not in lists
+                }
+        try:
+            encoded_data = encode(store_data)
+            records = {
+                name: dict(zip(ids, map(encode, value)))
+                for name, (ids, value) in lists.items()
+            }
+        except TypeError as err:
+            raise SerializationError(
+                f"Failed to serialize to JSON: {key}. Bad data: {err}"
+            ) from err
+
+        with self._lock:
+            connection = self._connection
+            try:
+                connection.execute("BEGIN")
+                if (previous := self._records.pop(key, None)) is None:
+                    # Without the previous records in memory every record is
+                    # written, the database skips the rows which did not change
+                    previous = {
+                        name: dict.fromkeys(_load_ids(ids), b"")
+                        for name, ids in connection.execute(
+                            "SELECT name, ids FROM lists WHERE key = ?", (key,)
+                        )
+                    }
+                connection.execute(
+                    _UPSERT_STORE,
+                    (key, data["version"], data.get("minor_version", 1), encoded_data),
+                )
+                for name, list_records in records.items():
+                    previous_records = previous.pop(name, {})
+                    if list(previous_records) != list(list_records):
+                        connection.execute(
+                            _UPSERT_LIST, (key, name, json_bytes(list(list_records)))
+                        )
+                    connection.executemany(
+                        _UPSERT_RECORD,
+                        [
+                            (key, name, record_id, record)
+                            for record_id, record in list_records.items()
+                            if previous_records.get(record_id) != record
+                        ],
+                    )
+                    connection.executemany(
+                        "DELETE FROM records WHERE key = ? AND name = ? AND id = ?",
+                        [
+                            (key, name, record_id)
+                            for record_id in previous_records.keys()
+                            - list_records.keys()
+                        ],
+                    )
+                # Lists which are no longer kept as records
+                for name in previous:
+                    connection.execute(
+                        "DELETE FROM lists WHERE key = ? AND name = ?", (key, name)
+                    )
+                    connection.execute(
+                        "DELETE FROM records WHERE key = ? AND name = ?", (key, name)
+                    )
+                connection.execute("COMMIT")
+            except sqlite3.Error as err:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise WriteError(f"Error writing {key} to {self.path}: {err}") from err
+            self._records[key] = records
+
+    def remove(self, key: str) -> None:
+        """Remove the data of a store."""
+        with self._lock:
+            self._records.pop(key, None)
+            connection = self._connection
+            connection.execute("BEGIN")
+            connection.execute("DELETE FROM stores WHERE key = ?", (key,))
+            connection.execute("DELETE FROM lists WHERE key = ?", (key,))
+            connection.execute("DELETE FROM records WHERE key = ?", (key,))
+            connection.execute("COMMIT")
+
+
+def _remove_database(path: str) -> None:
+    """Remove a database and the files next to it."""
+    os.unlink(path)
+    for suffix in STORAGE_DATABASE_SIDECAR_SUFFIXES:
+        with suppress(FileNotFoundError):
+            os.unlink(f"{path}{suffix}")
+
+
+def _storage_files(storage_dir: str) -> Iterable[tuple[str, dict[str, Any]]]:
+    """Return the keys and data of the JSON files of stores."""
+    for key in sorted(os.listdir(storage_dir)):
+        path = os.path.join(storage_dir, key)
+        if key.startswith(STORAGE_DATABASE) or not os.path.isfile(path):
+            continue
+        try:
+            with open(path, "rb") as file:
+                data = json_loads(file.read())
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Skipping %s which can not be read: %s", path, err)
+            continue
+        if (
+            not isinstance(data, dict)
+            or data.get("key") != key
+            or not isinstance(data.get("version"), int)
+            or "data" not in data
+        ):
+            _LOGGER.warning("Skipping %s which is not the data of a store", path)
+            continue
+        yield key, data
+
+
+def migrate_to_database(storage_dir: str) -> list[str]:
+    """Move the data of the stores from JSON files to the database.
+
+    The JSON files are removed once the data is in the database. Must not
+    be used while Home Assistant is running.
+    """
+    database = StorageDatabase(os.path.join(storage_dir, STORAGE_DATABASE))
+    try:
+        migrated = []
+        for key, data in _storage_files(storage_dir):
+            database.write(key, data)
+            migrated.append(key)
+    finally:
+        database.close()
+    for key in migrated:
+        os.unlink(os.path.join(storage_dir, key))
+    return migrated
+
+
+def migrate_to_json(storage_dir: str) -> list[str]:
+    """Move the data of the stores from the database to JSON files.
+
+    The database is removed once the data is in the JSON files. Must not
+    be used while Home Assistant is running.
+    """
+    path = os.path.join(storage_dir, STORAGE_DATABASE)
+    database = StorageDatabase(path)
+    try:
+        keys = database.keys()
+        for key in keys:
+            if (data := database.load(key)) is None:
+                continue
+            # The database does not know which stores are private
+            save_json(
+                os.path.join(storage_dir, key), data, private=True, atomic_writes=True
+            )
+    finally:
+        database.close()
+    _remove_database(path)
+    return keys
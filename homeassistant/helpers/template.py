@@ -10,8 +10,10 @@ from contextlib import AbstractContextManager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
+import importlib.util
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -34,6 +36,7 @@ from typing import (
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
+from atomicwrites import AtomicWriter
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
@@ -50,14 +53,18 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -80,6 +87,7 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -92,6 +100,10 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE = "template.bytecode_cache"
+
+BYTECODE_CACHE_FILE = "core.template_bytecode"
+BYTECODE_CACHE_SIZE = 8192
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -2295,6 +2307,95 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+class TemplateBytecodeCache:
+    """Compiled template code which is kept across restarts.
+
+    The code is written with marshal to a file under .storage and looked up
+    by the kind of template environment and the template source, since the
+    limited environment compiles some filters and functions differently. A
+    file written by another version of Home Assistant, Jinja or Python is
+    ignored. Only the templates compiled since the start are written, so
+    templates which are no longer used drop out.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self._loaded: dict[tuple[str, str], CodeType] = {}
+        self._codes: MutableMapping[tuple[str, str], CodeType] = LRU(
+            BYTECODE_CACHE_SIZE
+        )
+        self._dirty = False
+
+    def get(self, kind: str, source: str) -> CodeType | None:
+        """Return the compiled code of a template source in a kind of environment."""
+        key = (kind, source)
+        if (code := self._codes.get(key)) is None and (
+            code := self._loaded.get(key)
+        ) is not None:
+            self._codes[key] = code
+            self._dirty = True
+        return code
+
+    def set(self, kind: str, source: str, code: CodeType) -> None:
+        """Add the compiled code of a template source in a kind of environment."""
+        self._codes[(kind, source)] = code
+        self._dirty = True
+
+    def load(self) -> None:
+        """Load the cache file.
+
+        This method must be run in the executor.
+        """
+        try:
+            with open(self.path, "rb") as fdesc:
+                version, codes = marshal.load(fdesc)
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.warning("Ignoring template bytecode cache %s: %s", self.path, err)
+            return
+        if version == _bytecode_cache_version() and isinstance(codes, dict):
+            self._loaded = codes
+
+    def save(self) -> None:
+        """Write the cache file if it changed.
+
+        This method must be run in the executor.
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+        data = marshal.dumps((_bytecode_cache_version(), dict(self._codes.items())))
+        try:
+            with AtomicWriter(self.path, mode="wb", overwrite=True).open() as fdesc:
+                fdesc.write(data)
+        except OSError as err:
+            _LOGGER.error("Saving template bytecode cache failed: %s", err)
+
+
+@cache
+def _bytecode_cache_version() -> tuple[str, str, bytes]:
+    """Return the versions which must match to use a template bytecode cache."""
+    return (__version__, jinja2.__version__, importlib.util.MAGIC_NUMBER)
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the template bytecode cache and save it after start and on shutdown."""
+    bytecode_cache = TemplateBytecodeCache(
+        hass.config.path(STORAGE_DIR, BYTECODE_CACHE_FILE)
+    )
+    await hass.async_add_executor_job(bytecode_cache.load)
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+    async def _async_save(_: Event) -> None:
+        """Save the template bytecode cache."""
+        await hass.async_add_executor_job(bytecode_cache.save)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save)
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2362,6 +2463,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # The kind of environment the compiled code is kept for across restarts
+        self.bytecode_cache_kind = (
+            "limited" if limited else "strict" if strict else "default"
+        )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
@@ -2656,7 +2761,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+            bytecode_cache: TemplateBytecodeCache | None = None
+            if self.hass is not None:
+                bytecode_cache = self.hass.data.get(_BYTECODE_CACHE)
+            if bytecode_cache is None or not isinstance(source, str):
+                cached = super().compile(source)
+            elif (
+                cached := bytecode_cache.get(self.bytecode_cache_kind, source)
+            ) is None:
+                cached = super().compile(source)
+                bytecode_cache.set(self.bytecode_cache_kind, source, cached)
+            self.template_cache[source] = cached
 
         return cached
 
@@ -103,6 +103,8 @@ trace_stack_cv: ContextVar[list[TraceElement] | None] = ContextVar(
 trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
     "trace_path_stack_cv", default=None
 )
+# Whether condition trace elements are collected
+trace_enabled_cv: ContextVar[bool] = ContextVar("trace_enabled_cv", default=True)
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
 # (domain.item_id, Run ID)
@@ -125,6 +127,16 @@ def trace_id_get() -> tuple[str, str] | None:
     return trace_id_cv.get()
 
 
+@contextmanager
+def trace_collection(enabled: bool) -> Generator[None, None, None]:
+    """Enable or disable collecting condition trace elements."""
+    token = trace_enabled_cv.set(enabled)
+    try:
+        yield
+    finally:
+        trace_enabled_cv.reset(token)
+
+
 def trace_stack_push(trace_stack_var: ContextVar, node: Any) -> None:
     """Push an element to the top of a trace stack."""
     if (trace_stack := trace_stack_var.get()) is None:
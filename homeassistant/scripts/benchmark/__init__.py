@@ -6,19 +6,26 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+import math
+import os
+import statistics
+from tempfile import TemporaryDirectory
+import time
 from timeit import default_timer as timer
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -314,6 +321,834 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_write_states(hass):
+    """Write 100k states to SQLite with and without multi-row inserts."""
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.bulk_insert import (
+        bulk_insert_state_attributes,
+        bulk_insert_states,
+    )
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    entity_count = 1000
+    commits = 50
+    changes_per_commit = 2
+
+    def _write_states(bulk: bool) -> float:
+        """Write the states and return the time spent writing them."""
+        with TemporaryDirectory() as tmpdir:
+            engine = create_engine(f"sqlite:///{tmpdir}/benchmark.db")
+            Base.metadata.create_all(engine)
+            session = Session(engine, expire_on_commit=False)
+            states_meta = [
+                StatesMeta(entity_id=f"sensor.benchmark_{idx}")
+                for idx in range(entity_count)
+            ]
+            session.add_all(states_meta)
+            session.commit()
+            last_state_ids: dict[int, int] = {}
+            runtime = 0.0
+            for commit in range(commits):
+                state_attributes: list[StateAttributes] = []
+                states: list[States] = []
+                for change in range(changes_per_commit):
+                    for idx, meta in enumerate(states_meta):
+                        dbstate = States(
+                            state=str(commit * changes_per_commit + change),
+                            last_updated_ts=time.time(),
+                            metadata_id=meta.metadata_id,
+                        )
+                        if change:
+                            dbstate.old_state = states[-entity_count]
+                        else:
+                            dbstate.old_state_id = last_state_ids.get(idx)
+                        if idx % 10 == 0:
+                            attributes = StateAttributes(
+                                shared_attrs=f'{{"commit":{commit},"idx":{idx}}}',
+                                hash=commit * entity_count + idx,
+                            )
+                            state_attributes.append(attributes)
+                            dbstate.state_attributes = attributes
+                        states.append(dbstate)
+                start = timer()
+                if bulk:
+                    session.flush()
+                    bulk_insert_state_attributes(session, state_attributes)
+                    bulk_insert_states(session, states)
+                else:
+                    session.add_all(state_attributes)
+                    session.add_all(states)
+                session.commit()
+                runtime += timer() - start
+                for idx, dbstate in enumerate(states[-entity_count:]):
+                    last_state_ids[idx] = dbstate.state_id
+            session.close()
+            engine.dispose()
+        return runtime
+
+    rows = entity_count * commits * changes_per_commit
+    session_runtime = await hass.async_add_executor_job(_write_states, False)
+    bulk_runtime = await hass.async_add_executor_job(_write_states, True)
+    print(f"Session unit of work: {rows / session_runtime:.0f} rows/sec")
+    print(f"Multi-row inserts: {rows / bulk_runtime:.0f} rows/sec")
+    return bulk_runtime
+
+
+@benchmark
+async def subscribe_entities_fan_out(hass):
+    """Send 10k state changes to 15 subscribe_entities websocket clients."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.commands import _EntityChangesFanOut
+
+    clients = 15
+    entity_count = 1000
+    changes = 10**4
+    sent = 0
+
+    def send_message(message):
+        """Count the messages sent to the clients."""
+        nonlocal sent
+        sent += 1
+
+    fan_out = _EntityChangesFanOut(hass)
+    for msg_id in range(clients):
+        user = User(name=f"client {msg_id}", perm_lookup=None, is_owner=True)
+        fan_out.async_subscribe(send_message, set(), user, msg_id)
+
+    start = timer()
+    for idx in range(changes):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx % entity_count}", idx, {"unit": "W"}
+        )
+    runtime = timer() - start
+
+    assert sent == changes * clients
+    print(f"{clients} clients: {changes / runtime:.0f} changes/sec")
+    return runtime
+
+
+@benchmark
+async def statistics_rolling_window(hass):
+    """Update a 5000 sample statistics window 10k times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.rolling_window import RollingWindow
+
+    sampling_size = 5000
+    updates = 10**4
+    window = RollingWindow(sampling_size, order_statistics=True)
+    age = dt_util.utcnow()
+    for idx in range(sampling_size):
+        window.append(float(idx % 97), age + timedelta(seconds=idx))
+
+    start = timer()
+    for idx in range(sampling_size, sampling_size + updates // 10):
+        window.append(float(idx % 97), age + timedelta(seconds=idx))
+        samples = window.states
+        statistics.mean(samples)
+        statistics.median(samples)
+        statistics.stdev(samples)
+        statistics.quantiles(samples, n=100, method="exclusive")
+    # Only a tenth of the updates are run for the slow path
+    recompute_runtime = (timer() - start) * 10
+
+    start = timer()
+    for idx in range(sampling_size, sampling_size + updates):
+        window.append(float(idx % 97), age + timedelta(seconds=idx))
+        _ = window.sum / len(window)
+        _ = window.median
+        _ = math.sqrt(window.variance)
+        _ = window.percentile(95)
+    runtime = timer() - start
+
+    print(f"Recompute: {updates / recompute_runtime:.0f} updates/sec")
+    print(f"Incremental: {updates / runtime:.0f} updates/sec")
+    return runtime
+
+
+@benchmark
+async def history_stats_sliding_window(hass):
+    """Update 200 history stats sensors with a 24 hour sliding window."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.history_stats.data import HistoryState, HistoryWindow
+
+    sensors = 200
+    window_size = 24 * 60 * 60
+    # Every sensor changes state once a minute
+    changes_per_window = window_size // 60
+    updates = 60
+    age = dt_util.utcnow().timestamp()
+    history = [
+        HistoryState("on" if idx % 3 else "off", age + idx * 60)
+        for idx in range(changes_per_window + updates)
+    ]
+    entity_states = {"on"}
+
+    start = timer()
+    for idx in range(changes_per_window, changes_per_window + updates):
+        now = age + idx * 60
+        for _ in range(sensors):
+            # The states of the period were loaded from the database
+            window = HistoryWindow(entity_states)
+            window.reset(now - window_size, history[idx - changes_per_window : idx + 1])
+            window.compute_seconds_and_changes(now, now)
+    recompute_runtime = timer() - start
+
+    windows = []
+    for _ in range(sensors):
+        window = HistoryWindow(entity_states)
+        window.reset(age, history[:changes_per_window])
+        windows.append(window)
+    start = timer()
+    for idx in range(changes_per_window, changes_per_window + updates):
+        now = age + idx * 60
+        for window in windows:
+            window.append(history[idx])
+            window.move_start(now - window_size)
+            window.compute_seconds_and_changes(now, now)
+    runtime = timer() - start
+
+    print(
+        f"Recompute: {sensors * updates / recompute_runtime:.0f} updates/sec"
+        " without the database queries"
+    )
+    print(f"Sliding window: {sensors * updates / runtime:.0f} updates/sec")
+    return runtime
+
+
+@benchmark
+async def template_compile_startup(hass):
+    """Compile 2500 templates at startup with and without the bytecode cache."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    sources = [
+        f"{{{{ states('sensor.sensor_{idx}') | float(0) * {idx} | round(2) }}}}"
+        f"{{% if is_state('light.light_{idx}', 'on') %}} on{{% else %}} off"
+        "{% endif %}"
+        for idx in range(2500)
+    ]
+
+    async def _compile_all():
+        hass.data.pop(template._ENVIRONMENT, None)  # pylint: disable=protected-access
+        await template.async_load_bytecode_cache(hass)
+        start = timer()
+        for source in sources:
+            template.Template(source, hass).ensure_valid()
+        return timer() - start
+
+    with TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        os.mkdir(os.path.join(tmpdir, ".storage"))
+        uncached_runtime = await _compile_all()
+        await hass.async_add_executor_job(
+            hass.data[template._BYTECODE_CACHE].save  # pylint: disable=protected-access
+        )
+        runtime = await _compile_all()
+
+    print(f"Without cache: {uncached_runtime:.3f}s")
+    print(f"With cache: {runtime:.3f}s")
+    return runtime
+
+
+@benchmark
+async def recorder_concurrent_reads(hass):
+    """Run history queries while the db executor is busy with maintenance."""
+    # pylint: disable-next=import-outside-toplevel
+    import sqlite3
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import Engine, create_engine, text
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.core import MAX_DB_EXECUTOR_WORKERS
+    from homeassistant.components.recorder.db_schema import Base
+    from homeassistant.components.recorder.pool import create_read_engine
+    from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+
+    entity_count = 100
+    states_per_entity = 2000
+    maintenance_jobs = MAX_DB_EXECUTOR_WORKERS
+    history_queries = 100
+    read_workers = 4
+
+    def _populate(db_path: str) -> None:
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(engine)
+        engine.dispose()
+        connection = sqlite3.connect(db_path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executemany(
+            "INSERT INTO states (metadata_id, state, last_updated_ts) VALUES (?, ?, ?)",
+            (
+                (metadata_id, str(idx), idx * 60.0)
+                for idx in range(states_per_entity)
+                for metadata_id in range(entity_count)
+            ),
+        )
+        connection.commit()
+        connection.close()
+
+    def _maintenance(engine: Engine) -> None:
+        with Session(engine) as session:
+            for _ in range(3):
+                session.execute(
+                    text(
+                        "SELECT metadata_id, count(*), max(state), min(state) "
+                        "FROM states GROUP BY metadata_id"
+                    )
+                ).all()
+
+    def _history(engine: Engine, metadata_id: int) -> None:
+        with Session(engine) as session:
+            session.execute(
+                text(
+                    "SELECT state, last_updated_ts FROM states "
+                    "WHERE metadata_id = :metadata_id AND last_updated_ts > :start "
+                    "ORDER BY last_updated_ts"
+                ),
+                {"metadata_id": metadata_id, "start": 0.0},
+            ).all()
+
+    async def _run(
+        db_executor: InterruptibleThreadPoolExecutor,
+        read_executor: InterruptibleThreadPoolExecutor,
+        engine: Engine,
+        read_engine: Engine,
+    ) -> float:
+        loop = hass.loop
+        maintenance = [
+            loop.run_in_executor(db_executor, _maintenance, engine)
+            for _ in range(maintenance_jobs)
+        ]
+        start = timer()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    read_executor, _history, read_engine, idx % entity_count
+                )
+                for idx in range(history_queries)
+            )
+        )
+        runtime = timer() - start
+        await asyncio.gather(*maintenance)
+        return runtime
+
+    with TemporaryDirectory() as tmpdir:
+        db_path = f"{tmpdir}/benchmark.db"
+        await hass.async_add_executor_job(_populate, db_path)
+        engine = create_engine(
+            f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+        )
+        read_engine = create_read_engine(f"sqlite:///{db_path}", read_workers)
+        db_executor = InterruptibleThreadPoolExecutor(
+            max_workers=MAX_DB_EXECUTOR_WORKERS
+        )
+        read_executor = InterruptibleThreadPoolExecutor(max_workers=read_workers)
+        shared_runtime = await _run(db_executor, db_executor, engine, engine)
+        runtime = await _run(db_executor, read_executor, engine, read_engine)
+        db_executor.shutdown()
+        read_executor.shutdown()
+        engine.dispose()
+        read_engine.dispose()
+
+    print(f"Shared db executor: {history_queries / shared_runtime:.0f} queries/sec")
+    print(f"Db read executor: {history_queries / runtime:.0f} queries/sec")
+    return runtime
+
+
+@benchmark
+async def area_targeted_service_calls(hass):
+    """Resolve area targeted service calls as the registries grow."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+    )
+    from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+    devices_per_area = 4
+    entities_per_device = 8
+    calls = 1000
+
+    runtime = 0.0
+    for device_count in (150, 400, 1200):
+        area_count = device_count // devices_per_area
+        area_reg = ar.AreaRegistry(hass)
+        area_reg.areas = {
+            f"area_{idx}": ar.AreaEntry(
+                aliases=set(),
+                id=f"area_{idx}",
+                name=f"Area {idx}",
+                normalized_name=f"area {idx}",
+                picture=None,
+            )
+            for idx in range(area_count)
+        }
+        dev_reg = dr.DeviceRegistry(hass)
+        dev_reg.devices = dr.ActiveDeviceRegistryItems()
+        dev_reg.deleted_devices = dr.DeviceRegistryItems()
+        ent_reg = er.EntityRegistry(hass)
+        ent_reg.entities = er.EntityRegistryItems()
+        for idx in range(device_count):
+            device_id = f"device_{idx}"
+            dev_reg.devices[device_id] = dr.DeviceEntry(
+                id=device_id, area_id=f"area_{idx % area_count}"
+            )
+            for entity_idx in range(entities_per_device):
+                entity_id = f"light.light_{idx}_{entity_idx}"
+                ent_reg.entities[entity_id] = er.RegistryEntry(
+                    entity_id, entity_id, "benchmark", device_id=device_id
+                )
+        hass.data[ar.DATA_REGISTRY] = area_reg
+        hass.data[dr.DATA_REGISTRY] = dev_reg
+        hass.data[er.DATA_REGISTRY] = ent_reg
+
+        service_calls = [
+            core.ServiceCall(
+                "light", "turn_on", {"area_id": [f"area_{idx % area_count}"]}
+            )
+            for idx in range(calls)
+        ]
+        start = timer()
+        for service_call in service_calls:
+            async_extract_referenced_entity_ids(hass, service_call, False)
+        runtime = timer() - start
+        print(
+            f"{device_count} devices, {device_count * entities_per_device} entities: "
+            f"{calls / runtime:.0f} calls/sec"
+        )
+
+    return runtime
+
+
+@benchmark
+async def zone_active_zone_lookup(hass):
+    """Find the active zone of trackers as the number of zones grows."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import zone
+
+    lookups = 10000
+    zone.async_setup_zone_index(hass)
+
+    runtime = 0.0
+    zone_count = 0
+    for target_count in (50, 200, 1000):
+        # Zones every 5km, 40 zones from south to north
+        for idx in range(zone_count, target_count):
+            hass.states.async_set(
+                f"zone.zone_{idx}",
+                "0",
+                {
+                    "latitude": 52.0 + (idx % 40) * 0.05,
+                    "longitude": 4.0 + (idx // 40) * 0.05,
+                    "radius": 100 + idx % 5 * 100,
+                },
+            )
+        zone_count = target_count
+        # Trackers spread over the same area as the zones so the number of
+        # zones near each tracker stays the same
+        columns = zone_count / 40
+        locations = [
+            (52.0 + (idx % 97) / 97 * 2, 4.0 + (idx % 89) / 89 * columns * 0.05)
+            for idx in range(lookups)
+        ]
+        start = timer()
+        for latitude, longitude in locations:
+            zone.async_active_zone(hass, latitude, longitude, 50)
+        runtime = timer() - start
+        print(f"{zone_count} zones: {lookups / runtime:.0f} lookups/sec")
+
+    return runtime
+
+
+@benchmark
+async def prometheus_state_changes(hass):
+    """Export state changes and scrape the Prometheus metrics."""
+    # pylint: disable-next=import-outside-toplevel
+    import prometheus_client
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import prometheus
+    from homeassistant.helpers import entityfilter
+
+    entity_count = 6000
+    updates = 30000
+    scrapes = 10
+    metrics = prometheus.PrometheusMetrics(
+        prometheus_client,
+        entityfilter.FILTER_SCHEMA({}),
+        "homeassistant",
+        hass.config.units.temperature_unit,
+        prometheus.EntityValues({}, {}, {}),
+        None,
+        None,
+    )
+    hass.bus.async_listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
+    attributes = {
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "friendly_name": "Power",
+    }
+    entity_ids = [f"sensor.power_{idx}" for idx in range(entity_count)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0", attributes)
+    await hass.async_block_till_done()
+
+    start = timer()
+    for idx in range(updates):
+        hass.states.async_set(entity_ids[idx % entity_count], str(idx), attributes)
+    await hass.async_block_till_done()
+    update_runtime = timer() - start
+
+    start = timer()
+    for idx in range(scrapes):
+        hass.states.async_set(entity_ids[idx], "1", attributes)
+        await hass.async_block_till_done()
+        metrics.generate_latest()
+    scrape_runtime = timer() - start
+
+    print(f"{updates / update_runtime:.0f} state changes/sec")
+    print(f"{scrape_runtime / scrapes * 1000:.1f} ms/scrape")
+    return update_runtime + scrape_runtime
+
+
+@benchmark
+async def condition_evaluation(hass):
+    """Evaluate representative condition trees with and without tracing."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import condition, config_validation as cv, trace
+
+    evaluations = 20000
+    hass.states.async_set("sensor.temperature", 21.5, {"humidity": 40})
+    hass.states.async_set("sensor.outside", 12)
+    hass.states.async_set("binary_sensor.door", "off")
+    hass.states.async_set("binary_sensor.window", "off")
+    hass.states.async_set("input_number.comfort", 19)
+    trees = {
+        "state": {
+            "condition": "state",
+            "entity_id": ["binary_sensor.door", "binary_sensor.window"],
+            "state": ["off", "unavailable"],
+        },
+        "numeric_state": {
+            "condition": "numeric_state",
+            "entity_id": "sensor.temperature",
+            "attribute": "humidity",
+            "above": 30,
+            "below": 60,
+        },
+        "nested": {
+            "condition": "or",
+            "conditions": [
+                {
+                    "condition": "and",
+                    "conditions": [
+                        {
+                            "condition": "numeric_state",
+                            "entity_id": ["sensor.temperature", "sensor.outside"],
+                            "above": "input_number.comfort",
+                        },
+                        {
+                            "condition": "state",
+                            "entity_id": "binary_sensor.door",
+                            "state": "on",
+                        },
+                    ],
+                },
+                {
+                    "condition": "not",
+                    "conditions": [
+                        {
+                            "condition": "state",
+                            "entity_id": "binary_sensor.window",
+                            "state": "on",
+                            "for": {"minutes": 5},
+                        }
+                    ],
+                },
+            ],
+        },
+    }
+
+    runtime = 0.0
+    for name, config in trees.items():
+        check = await condition.async_from_config(hass, cv.CONDITION_SCHEMA(config))
+        for tracing in (True, False):
+            trace.trace_clear()
+            with trace.trace_collection(tracing):
+                start = timer()
+                for _ in range(evaluations):
+                    check(hass, None)
+                runtime = timer() - start
+            mode = "traced" if tracing else "untraced"
+            print(f"{name} {mode}: {evaluations / runtime:.0f} evaluations/sec")
+
+    return runtime
+
+
+@benchmark
+async def state_trigger_dispatch(hass):
+    """Attach state triggers of many automations and dispatch state changes."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.homeassistant.triggers import (
+        numeric_state as numeric_state_trigger,
+        state as state_trigger,
+    )
+
+    automations = 1200
+    entities = 20
+    options = 12
+    events = 5000
+    fired = 0
+
+    @core.callback
+    def action(run_variables, context=None):
+        nonlocal fired
+        fired += 1
+
+    for idx in range(entities):
+        hass.states.async_set(f"input_select.mode_{idx}", "option_0")
+        hass.states.async_set(f"sensor.power_{idx}", 0)
+
+    # Each entity is watched by 60 automations, most of them only
+    # interested in a specific new state
+    configs = []
+    for idx in range(automations):
+        entity = idx % entities
+        option = f"option_{idx // entities % options}"
+        kind = idx // entities % 10
+        if kind < 6:
+            config = {
+                "platform": "state",
+                "entity_id": f"input_select.mode_{entity}",
+                "to": option,
+            }
+        elif kind < 8:
+            config = {
+                "platform": "state",
+                "entity_id": f"input_select.mode_{entity}",
+                "from": option,
+            }
+        elif kind < 9:
+            config = {
+                "platform": "state",
+                "entity_id": f"input_select.mode_{entity}",
+                "attribute": "options",
+            }
+        else:
+            config = {
+                "platform": "numeric_state",
+                "entity_id": f"sensor.power_{entity}",
+                "above": 100,
+            }
+        configs.append(config)
+
+    start = timer()
+    for idx, config in enumerate(configs):
+        if "attribute" in config:
+            platform = state_trigger
+            config = state_trigger.TRIGGER_ATTRIBUTE_SCHEMA(config)
+        elif config["platform"] == "state":
+            platform = state_trigger
+            config = state_trigger.TRIGGER_STATE_SCHEMA(config)
+        else:
+            platform = numeric_state_trigger
+            config = numeric_state_trigger._TRIGGER_SCHEMA(config)  # noqa: SLF001
+        await platform.async_attach_trigger(
+            hass,
+            config,
+            action,
+            {
+                "domain": "automation",
+                "name": f"automation {idx}",
+                "home_assistant_start": False,
+                "variables": None,
+                "trigger_data": {"id": "0", "idx": "0", "alias": None},
+            },
+        )
+    runtime = timer() - start
+    print(f"Attached {automations} triggers in {runtime * 1000:.0f} ms")
+
+    start = timer()
+    for idx in range(events):
+        entity = idx % entities
+        hass.states.async_set(
+            f"input_select.mode_{entity}", f"option_{idx // entities % options}"
+        )
+        hass.states.async_set(f"sensor.power_{entity}", idx % 200)
+    await hass.async_block_till_done()
+    runtime = timer() - start
+    print(f"Dispatched {events * 2} state changes in {runtime * 1000:.0f} ms")
+    print(f"Fired {fired} triggers")
+
+    return runtime
+
+
+@benchmark
+async def http_auth_middleware(hass):
+    """Authenticate API requests made with many long-lived access tokens."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohttp import hdrs, web
+    from aiohttp.test_utils import make_mocked_request
+
+    from homeassistant.auth import auth_manager_from_config, models
+    from homeassistant.components.http.auth import async_setup_auth
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    users = 50
+    tokens_per_user = 10
+    requests = 50000
+
+    tmpdir = TemporaryDirectory()
+    hass.config.config_dir = tmpdir.name
+    # Stored auth data is written when Home Assistant stops
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, core.callback(lambda _: tmpdir.cleanup())
+    )
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    hass.auth = await auth_manager_from_config(hass, [], [])
+    app = web.Application()
+    await async_setup_auth(hass, app)
+    auth_middleware = app.middlewares[-1]
+
+    refresh_tokens = []
+    authenticated_requests = []
+    for idx in range(users):
+        user = await hass.auth.async_create_user(f"User {idx}")
+        for token_idx in range(tokens_per_user):
+            refresh_token = await hass.auth.async_create_refresh_token(
+                user,
+                client_name=f"Scraper {token_idx}",
+                token_type=models.TOKEN_TYPE_LONG_LIVED_ACCESS_TOKEN,
+            )
+            refresh_tokens.append(refresh_token)
+            access_token = hass.auth.async_create_access_token(refresh_token)
+            authenticated_requests.append(
+                make_mocked_request(
+                    "GET",
+                    "/api/states",
+                    headers={hdrs.AUTHORIZATION: f"Bearer {access_token}"},
+                )
+            )
+
+    async def handler(request):
+        return request
+
+    start = timer()
+    for refresh_token in refresh_tokens:
+        await hass.auth.async_get_refresh_token_by_token(refresh_token.token)
+    lookup_runtime = timer() - start
+
+    start = timer()
+    for idx in range(requests):
+        request = authenticated_requests[idx % len(authenticated_requests)]
+        await auth_middleware(request, handler)
+    runtime = timer() - start
+
+    print(
+        f"{len(refresh_tokens) / lookup_runtime:.0f} refresh token lookups/sec"
+        f" with {len(refresh_tokens)} tokens"
+    )
+    print(f"{requests / runtime:.0f} authenticated requests/sec")
+    return runtime
+
+
+@benchmark
+async def storage_save_large_registry(hass):
+    """Save a large registry after changing one entry with JSON files and SQLite."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import storage
+    from homeassistant.helpers.storage_database import StorageDatabase
+
+    entries = 20000
+    saves = 50
+
+    def _bytes_written() -> int | None:
+        """Return the bytes written by the process if the platform reports it."""
+        with suppress(OSError), open("/proc/self/io", encoding="ascii") as file:
+            for line in file:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+        return None
+
+    data = {
+        "entities": [
+            {
+                "id": f"{idx:032x}",
+                "entity_id": f"sensor.benchmark_{idx}",
+                "platform": "benchmark",
+                "unique_id": f"unique_{idx}",
+                "device_id": f"{idx // 10:032x}",
+                "name": None,
+                "original_name": f"Benchmark {idx}",
+                "options": {"sensor": {"suggested_display_precision": 1}},
+                "disabled_by": None,
+            }
+            for idx in range(entries)
+        ],
+        "deleted_entities": [],
+    }
+
+    async def _save(
+        database: StorageDatabase | None, name: str
+    ) -> tuple[float, int | None]:
+        """Save the registry and return the time and bytes per save."""
+        hass.data[storage.DATA_STORAGE_DATABASE] = database
+        store: storage.Store[dict[str, Any]] = storage.Store(
+            hass, 1, "core.entity_registry"
+        )
+        await store.async_save(data)
+        entities = data["entities"]
+        bytes_before = _bytes_written()
+        runtime = 0.0
+        for idx in range(saves):
+            entities[idx] = {**entities[idx], "name": f"{name} {idx}"}
+            start = timer()
+            await store.async_save(data)
+            runtime += timer() - start
+        bytes_after = _bytes_written()
+        if bytes_before is None or bytes_after is None:
+            return runtime / saves, None
+        return runtime / saves, (bytes_after - bytes_before) // saves
+
+    with TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        os.makedirs(hass.config.path(storage.STORAGE_DIR))
+        json_runtime, json_bytes = await _save(None, "JSON")
+        database = StorageDatabase(
+            hass.config.path(storage.STORAGE_DIR, "benchmark.db")
+        )
+        sqlite_runtime, sqlite_bytes = await _save(database, "SQLite")
+        database.close()
+        hass.data.pop(storage.DATA_STORAGE_DATABASE)
+
+    for backend, runtime, written in (
+        ("JSON file", json_runtime, json_bytes),
+        ("SQLite", sqlite_runtime, sqlite_bytes),
+    ):
+        print(
+            f"{backend}: {runtime * 1000:.1f} ms per save",
+            f"{written} bytes written per save" if written is not None else "",
+        )
+    return sqlite_runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -0,0 +1,66 @@
+"""Script to move the data of the stores between JSON files and a database."""
+import argparse
+import os
+
+from homeassistant.config import get_default_config_dir
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.storage_database import (
+    STORAGE_DATABASE,
+    migrate_to_database,
+    migrate_to_json,
+)
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+
+def run(args):
+    """Handle Home Assistant storage script."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Move the data in the storage directory between JSON files and a "
+            "SQLite database. Home Assistant must not be running."
+        )
+    )
+    parser.add_argument("--script", choices=["storage"])
+    parser.add_argument(
+        "-c",
+        "--config",
+        default=get_default_config_dir(),
+        help="Directory that contains the Home Assistant configuration",
+    )
+
+    subparsers = parser.add_subparsers(dest="func")
+    subparsers.required = True
+    subparsers.add_parser(
+        "to_sqlite", help="Move the data from the JSON files to the database"
+    ).set_defaults(func=to_sqlite)
+    subparsers.add_parser(
+        "to_json", help="Move the data from the database to JSON files"
+    ).set_defaults(func=to_json)
+
+    args = parser.parse_args(args)
+    storage_dir = os.path.join(os.getcwd(), args.config, STORAGE_DIR)
+    if not os.path.isdir(storage_dir):
+        print("Storage directory not found:", storage_dir)
+        return 1
+    return args.func(storage_dir)
+
+
+def to_sqlite(storage_dir):
+    """Move the data from the JSON files to the database."""
+    if os.path.exists(os.path.join(storage_dir, STORAGE_DATABASE)):
+        print("The data is already in the database")
+        return 1
+    keys = migrate_to_database(storage_dir)
+    print(f"Moved {len(keys)} stores to the database")
+    return 0
+
+
+def to_json(storage_dir):
+    """Move the data from the database to JSON files."""
+    if not os.path.exists(os.path.join(storage_dir, STORAGE_DATABASE)):
+        print("There is no database to move the data from")
+        return 1
+    keys = migrate_to_json(storage_dir)
+    print(f"Moved {len(keys)} stores to JSON files")
+    return 0
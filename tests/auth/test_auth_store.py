@@ -258,3 +258,48 @@ async def test_loading_race_condition(hass: HomeAssistant) -> None:
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_refresh_token_lookups(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test refresh tokens are found by id and by token."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Paulus")
+    other_user = await store.async_create_user("Other")
+    refresh_token = await store.async_create_refresh_token(user, "client-id")
+    other_refresh_token = await store.async_create_refresh_token(
+        other_user, "client-id"
+    )
+
+    assert await store.async_get_refresh_token(refresh_token.id) is refresh_token
+    assert (
+        await store.async_get_refresh_token_by_token(other_refresh_token.token)
+        is other_refresh_token
+    )
+    assert await store.async_get_refresh_token("unknown") is None
+    assert await store.async_get_refresh_token_by_token("unknown") is None
+
+    # Refresh tokens are found after loading them
+    hass_storage[auth_store.STORAGE_KEY] = {
+        "version": auth_store.STORAGE_VERSION,
+        "data": store._data_to_save(),
+    }
+    loaded_store = auth_store.AuthStore(hass)
+    loaded_token = await loaded_store.async_get_refresh_token_by_token(
+        refresh_token.token
+    )
+    assert loaded_token is not None
+    assert loaded_token.id == refresh_token.id
+    assert await loaded_store.async_get_refresh_token(refresh_token.id) is loaded_token
+
+    await store.async_remove_refresh_token(refresh_token)
+    assert await store.async_get_refresh_token(refresh_token.id) is None
+    assert await store.async_get_refresh_token_by_token(refresh_token.token) is None
+    assert refresh_token.id not in user.refresh_tokens
+
+    await store.async_remove_user(other_user)
+    assert await store.async_get_refresh_token(other_refresh_token.id) is None
+    assert (
+        await store.async_get_refresh_token_by_token(other_refresh_token.token) is None
+    )
@@ -577,6 +577,54 @@ async def test_remove_refresh_token(mock_hass) -> None:
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_verified_access_tokens_are_cached(mock_hass) -> None:
+    """Test verified access tokens are not verified again until revoked."""
+    now = dt_util.utcnow()
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    other_refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    other_access_token = manager.async_create_access_token(other_refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=auth.jwt_wrapper.verify_and_decode,
+    ) as verify_mock:
+        for _ in range(3):
+            assert await manager.async_validate_access_token(access_token) is (
+                refresh_token
+            )
+            assert await manager.async_validate_access_token(other_access_token) is (
+                other_refresh_token
+            )
+        assert verify_mock.call_count == 2
+
+        # Deactivated users are checked for cached tokens
+        user.is_active = False
+        assert await manager.async_validate_access_token(access_token) is None
+        user.is_active = True
+        assert verify_mock.call_count == 2
+
+        # Cached tokens are verified again after a while
+        with freeze_time(
+            now + timedelta(seconds=auth_const.ACCESS_TOKEN_CACHE_TIME + 1)
+        ):
+            assert await manager.async_validate_access_token(access_token) is (
+                refresh_token
+            )
+        assert verify_mock.call_count == 3
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+    assert await manager.async_validate_access_token(other_access_token) is (
+        other_refresh_token
+    )
+
+    await manager.async_remove_user(user)
+    assert await manager.async_validate_access_token(other_access_token) is None
+
+
 async def test_register_revoke_token_callback(mock_hass) -> None:
     """Test that a registered revoke token callback is called."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -37,7 +37,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import condition, device_registry as dr
 from homeassistant.helpers.script import (
     SCRIPT_MODE_CHOICES,
     SCRIPT_MODE_PARALLEL,
@@ -305,6 +305,50 @@ async def test_two_conditions_with_and(hass: HomeAssistant, calls) -> None:
     assert len(calls) == 1
 
 
+@pytest.mark.parametrize(("stored_traces", "traced"), [(0, False), (5, True)])
+async def test_conditions_traced_when_traces_stored(
+    hass: HomeAssistant, calls, stored_traces: int, traced: bool
+) -> None:
+    """Test conditions are only traced when traces are stored."""
+    entity_id = "test.entity"
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "id": "conditions",
+                "trace": {"stored_traces": stored_traces},
+                "trigger": [{"platform": "event", "event_type": "test_event"}],
+                "condition": [
+                    {"condition": "state", "entity_id": entity_id, "state": "100"},
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": entity_id,
+                        "below": 150,
+                    },
+                ],
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    with patch(
+        "homeassistant.helpers.condition.condition_trace_append",
+        wraps=condition.condition_trace_append,
+    ) as mock_trace_append:
+        hass.states.async_set(entity_id, 100)
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        assert len(calls) == 1
+
+        hass.states.async_set(entity_id, 101)
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        assert len(calls) == 1
+
+    assert mock_trace_append.called is traced
+
+
 async def test_shorthand_conditions_template(hass: HomeAssistant, calls) -> None:
     """Test shorthand nation form in conditions."""
     assert await async_setup_component(
@@ -2,66 +2,102 @@
 from __future__ import annotations
 
 from pathlib import Path
+import sqlite3
+import tarfile
+import tempfile
+from typing import Any, BinaryIO
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-from homeassistant.components.backup import BackupManager
-from homeassistant.components.backup.manager import BackupPlatformProtocol
+from homeassistant.components.backup import (
+    BackupManager,
+    manager as manager_module,
+    util as util_module,
+)
+from homeassistant.components.backup.manager import Backup, BackupPlatformProtocol
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
+from homeassistant.util.json import json_loads_object
 
 from .common import TEST_BACKUP
 
 from tests.common import MockPlatform, mock_platform
 
 
-async def _mock_backup_generation(manager: BackupManager):
-    """Mock backup generator."""
+@pytest.fixture
+def config_dir(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Return a config directory with a few files to back up."""
+    hass.config.config_dir = tmp_path.as_posix()
+    (tmp_path / "test.txt").write_text("test")
+    (tmp_path / ".DS_Store").write_text("excluded")
+    (tmp_path / ".storage").mkdir()
+    (tmp_path / ".storage" / "core.config").write_text("{}")
+    connection = sqlite3.connect(tmp_path / "test.db")
+    with connection:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE test (value INTEGER)")
+        connection.executemany(
+            "INSERT INTO test VALUES (?)", [(value,) for value in range(1000)]
+        )
+    connection.close()
+    return tmp_path
 
-    def _mock_iterdir(path: Path) -> list[Path]:
-        if not path.name.endswith("testing_config"):
-            return []
-        return [
-            Path("test.txt"),
-            Path(".DS_Store"),
-            Path(".storage"),
-        ]
 
-    with patch("tarfile.open", MagicMock()) as mocked_tarfile, patch(
-        "pathlib.Path.iterdir", _mock_iterdir
-    ), patch("pathlib.Path.stat", MagicMock(st_size=123)), patch(
-        "pathlib.Path.is_file", lambda x: x.name != ".storage"
-    ), patch(
-        "pathlib.Path.is_dir",
-        lambda x: x.name == ".storage",
-    ), patch(
-        "pathlib.Path.exists",
-        lambda x: x != manager.backup_dir,
-    ), patch(
-        "pathlib.Path.is_symlink",
-        lambda _: False,
-    ), patch(
-        "pathlib.Path.mkdir",
-        MagicMock(),
-    ), patch(
-        "homeassistant.components.backup.manager.save_json"
-    ) as mocked_save_json, patch(
+async def _mock_backup_generation(manager: BackupManager) -> Backup:
+    """Generate a backup and check its contents."""
+    with patch(
         "homeassistant.components.backup.manager.HAVERSION",
         "2025.1.0",
     ):
-        await manager.generate_backup()
-
-        assert mocked_save_json.call_count == 1
-        assert mocked_save_json.call_args[0][1]["homeassistant"] == {
-            "version": "2025.1.0"
-        }
-
-        assert (
-            manager.backup_dir.as_posix()
-            in mocked_tarfile.call_args_list[0].kwargs["name"]
+        backup = await manager.generate_backup()
+
+    assert backup.path.parent == manager.backup_dir
+    with tarfile.open(backup.path, "r:") as tar_file:
+        assert tar_file.getnames() == [
+            ".",
+            "./backup.json",
+            "./homeassistant.tar.gz",
+        ]
+        backup_json = json_loads_object(
+            tar_file.extractfile("./backup.json").read()  # type: ignore[union-attr]
         )
+        assert backup_json["slug"] == backup.slug
+        assert backup_json["homeassistant"] == {"version": "2025.1.0"}
+        # The archive of the config directory can be read as a stream
+        with tarfile.open(
+            fileobj=tar_file.extractfile("./homeassistant.tar.gz"), mode="r|gz"
+        ) as core_tar:
+            contents = {
+                member.name: core_tar.extractfile(member).read()  # type: ignore[union-attr]
+                if member.isfile()
+                else None
+                for member in core_tar
+            }
+    assert contents.keys() == {
+        "data",
+        "data/test.txt",
+        "data/.storage",
+        "data/.storage/core.config",
+        "data/test.db",
+        "data/backups",
+    }
+    assert contents["data/test.txt"] == b"test"
+    assert _restored_values(manager, contents["data/test.db"]) == list(range(1000))
+    assert not [path for path in manager.backup_dir.iterdir() if path != backup.path]
+    return backup
+
+
+def _restored_values(manager: BackupManager, database: bytes) -> list[int]:
+    """Return the values in the test table of a backed up database."""
+    restored_path = manager.backup_dir.parent / "restored.db"
+    restored_path.write_bytes(database)
+    connection = sqlite3.connect(restored_path)
+    values = [value for (value,) in connection.execute("SELECT value FROM test")]
+    connection.close()
+    restored_path.unlink()
+    return values
 
 
 async def _setup_mock_domain(
@@ -168,14 +204,24 @@ async def test_generate_backup_when_backing_up(hass: HomeAssistant) -> None:
 
 async def test_generate_backup(
     hass: HomeAssistant,
+    config_dir: Path,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test generate backup."""
     manager = BackupManager(hass)
     manager.loaded_backups = True
 
-    await _mock_backup_generation(manager)
-
+    backup = await _mock_backup_generation(manager)
+
+    assert backup.stats is not None
+    assert backup.stats.contents_size > 0
+    assert backup.stats.throughput > 0
+    assert backup.as_dict()["stats"] == {
+        "duration": backup.stats.duration,
+        "contents_size": backup.stats.contents_size,
+        "throughput": backup.stats.throughput,
+    }
+    assert await manager.get_backup(backup.slug) == backup
     assert "Generated new backup with slug " in caplog.text
     assert "Creating backup directory" in caplog.text
     assert "Loaded 0 platforms" in caplog.text
@@ -229,7 +275,91 @@ async def test_not_loading_bad_platforms(
     )
 
 
-async def test_exception_plaform_pre(hass: HomeAssistant) -> None:
+async def test_generate_backup_while_database_is_written(
+    hass: HomeAssistant, config_dir: Path
+) -> None:
+    """Test the snapshot of a database is consistent while it is written."""
+    manager = BackupManager(hass)
+    connection = sqlite3.connect(config_dir / "test.db", check_same_thread=False)
+    snapshot_sqlite_database = manager_module.snapshot_sqlite_database
+
+    def _write_while_snapshot(path: Path, staging_dir: Path) -> tuple[BinaryIO, int]:
+        with connection:
+            connection.execute("INSERT INTO test VALUES (1000)")
+        snapshot = snapshot_sqlite_database(path, staging_dir)
+        with connection:
+            connection.execute("INSERT INTO test VALUES (1001)")
+        return snapshot
+
+    with patch.object(
+        manager_module, "snapshot_sqlite_database", _write_while_snapshot
+    ), patch.object(manager_module, "HAVERSION", "2025.1.0"):
+        backup = await manager.generate_backup()
+    connection.close()
+
+    with tarfile.open(backup.path, "r:") as tar_file, tarfile.open(
+        fileobj=tar_file.extractfile("./homeassistant.tar.gz"), mode="r|gz"
+    ) as core_tar:
+        for member in core_tar:
+            if member.name == "data/test.db":
+                database = core_tar.extractfile(member).read()  # type: ignore[union-attr]
+                break
+    # The pages in the write ahead log are part of the snapshot
+    assert _restored_values(manager, database) == list(range(1001))
+
+
+async def test_generate_backup_snapshot_failure(
+    hass: HomeAssistant, config_dir: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a database is added as is when a snapshot can not be taken."""
+    manager = BackupManager(hass)
+    with patch.object(
+        manager_module,
+        "snapshot_sqlite_database",
+        side_effect=sqlite3.OperationalError("database is locked"),
+    ):
+        await _mock_backup_generation(manager)
+    assert "Unable to take a snapshot of" in caplog.text
+
+
+async def test_generate_backup_staged_snapshot(
+    hass: HomeAssistant, config_dir: Path
+) -> None:
+    """Test a large database is staged in a temporary file for its snapshot."""
+    manager = BackupManager(hass)
+    temp_dirs: list[Path] = []
+    temporary_directory = tempfile.TemporaryDirectory
+
+    def _temporary_directory(**kwargs: Any) -> tempfile.TemporaryDirectory:
+        temp_dir = temporary_directory(**kwargs)
+        temp_dirs.append(Path(temp_dir.name))
+        return temp_dir
+
+    with patch.object(util_module, "SQLITE_MEMORY_SNAPSHOT_SIZE", 0), patch.object(
+        util_module.tempfile, "TemporaryDirectory", _temporary_directory
+    ):
+        await _mock_backup_generation(manager)
+    assert len(temp_dirs) == 1
+    assert temp_dirs[0].parent == manager.backup_dir
+    assert not temp_dirs[0].exists()
+
+
+async def test_generate_backup_no_room_to_stage_snapshot(
+    hass: HomeAssistant, config_dir: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a database is added as is when there is no room to stage its snapshot."""
+    manager = BackupManager(hass)
+    with patch.object(util_module, "SQLITE_MEMORY_SNAPSHOT_SIZE", 0), patch.object(
+        util_module.shutil,
+        "disk_usage",
+        return_value=Mock(free=0),
+    ):
+        await _mock_backup_generation(manager)
+    assert "Unable to take a snapshot of" in caplog.text
+    assert "needs more than the 0 bytes free" in caplog.text
+
+
+async def test_exception_plaform_pre(hass: HomeAssistant, config_dir: Path) -> None:
     """Test exception in pre step."""
     manager = BackupManager(hass)
     manager.loaded_backups = True
@@ -249,7 +379,7 @@ async def test_exception_plaform_pre(hass: HomeAssistant) -> None:
         await _mock_backup_generation(manager)
 
 
-async def test_exception_plaform_post(hass: HomeAssistant) -> None:
+async def test_exception_plaform_post(hass: HomeAssistant, config_dir: Path) -> None:
     """Test exception in post step."""
     manager = BackupManager(hass)
     manager.loaded_backups = True
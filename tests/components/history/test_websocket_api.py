@@ -3,6 +3,7 @@ import asyncio
 from datetime import timedelta
 from unittest.mock import patch
 
+from aiohttp import web
 from freezegun import freeze_time
 import pytest
 
@@ -171,6 +172,245 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends the history in chunks."""
+    start = dt_util.utcnow() - timedelta(days=3)
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for offset, entity_id, state in (
+        (timedelta(hours=1), "sensor.one", "1"),
+        (timedelta(hours=2), "sensor.two", "2"),
+        (timedelta(hours=3), "sensor.one", "3"),
+        (websocket_api.HISTORY_CHUNK_TIME_SPAN, "sensor.one", "4"),
+        (timedelta(days=2), "sensor.one", "5"),
+    ):
+        with freeze_time(start + offset):
+            hass.states.async_set(entity_id, state, attributes={"any": "attr"})
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/history_during_period",
+        "start_time": start.isoformat(),
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "include_start_time_state": True,
+        "significant_changes_only": False,
+        "no_attributes": True,
+    }
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    full_history = response["result"]
+
+    await client.send_json({"id": 2, "chunked": True, **request})
+    chunks = []
+    while (response := await client.receive_json())["type"] == "event":
+        assert response["id"] == 2
+        chunks.append(response["event"]["states"])
+    assert response["success"]
+    assert response["result"] == {}
+
+    assert [list(chunk) for chunk in chunks] == [
+        ["sensor.one"],
+        ["sensor.one"],
+        ["sensor.one"],
+        ["sensor.two"],
+    ]
+    assert [[state["s"] for state in chunk["sensor.one"]] for chunk in chunks[:3]] == [
+        ["1", "3"],
+        ["4"],
+        ["5"],
+    ]
+    merged_history: dict[str, list[dict]] = {}
+    for chunk in chunks:
+        for entity_id, states in chunk.items():
+            merged_history.setdefault(entity_id, []).extend(states)
+    assert merged_history == full_history
+
+
+async def test_history_during_period_chunked_minimal_response(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a minimal response does not repeat a state at the start of a chunk."""
+    start = dt_util.utcnow() - timedelta(days=3)
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for offset, state, attributes in (
+        (timedelta(hours=1), "1", {"any": "attr"}),
+        (websocket_api.HISTORY_CHUNK_TIME_SPAN, "1", {"any": "changed"}),
+        (timedelta(days=1, hours=1), "1", {"any": "again"}),
+        (timedelta(days=1, hours=2), "2", {"any": "again"}),
+    ):
+        with freeze_time(start + offset):
+            hass.states.async_set("sensor.one", state, attributes=attributes)
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/history_during_period",
+        "start_time": start.isoformat(),
+        "entity_ids": ["sensor.one"],
+        "significant_changes_only": False,
+        "minimal_response": True,
+    }
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.one"]] == ["1", "2"]
+
+    await client.send_json({"id": 2, "chunked": True, **request})
+    chunks = []
+    while (response := await client.receive_json())["type"] == "event":
+        chunks.append(response["event"]["states"])
+    assert response["success"]
+    assert [[state["s"] for state in chunk["sensor.one"]] for chunk in chunks] == [
+        ["1"],
+        ["2"],
+    ]
+
+
+async def test_history_during_period_chunked_slow_client(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the next chunk is only fetched once a slow client reads the chunks."""
+    start = dt_util.utcnow() - timedelta(days=3)
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for chunk in range(6):
+        with freeze_time(
+            start + websocket_api.HISTORY_CHUNK_TIME_SPAN * chunk + timedelta(hours=1)
+        ):
+            hass.states.async_set("sensor.one", str(chunk))
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client_reads = asyncio.Event()
+    client_reads.set()
+    send_str = web.WebSocketResponse.send_str
+
+    async def _slow_send_str(
+        self: web.WebSocketResponse, data: str, compress: int | None = None
+    ) -> None:
+        await client_reads.wait()
+        await send_str(self, data, compress)
+
+    with patch.object(web.WebSocketResponse, "send_str", _slow_send_str), patch.object(
+        websocket_api,
+        "_ws_get_significant_states_chunk",
+        wraps=websocket_api._ws_get_significant_states_chunk,
+    ) as get_chunk:
+        client = await hass_ws_client()
+        client_reads.clear()
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(days=3)).isoformat(),
+                "entity_ids": ["sensor.one"],
+                "chunked": True,
+            }
+        )
+        async with asyncio.timeout(5):
+            while get_chunk.call_count < 3:
+                await asyncio.sleep(0.01)
+        # One chunk is being sent and MAX_PENDING_HISTORY_CHUNKS wait to be sent
+        await asyncio.sleep(0.1)
+        assert get_chunk.call_count == 3
+
+        client_reads.set()
+        chunks = []
+        while (response := await client.receive_json())["type"] == "event":
+            chunks.append(response["event"]["states"])
+        assert response["success"]
+        assert get_chunk.call_count == 6
+    assert [[state["s"] for state in chunk["sensor.one"]] for chunk in chunks] == [
+        [str(chunk)] for chunk in range(6)
+    ]
+
+
+async def test_history_during_period_from_recent_states(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period and stream use the states kept in memory."""
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+    start_time = dt_util.utcnow()
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(
+        websocket_api.history,
+        "get_significant_states",
+        wraps=websocket_api.history.get_significant_states,
+    ) as mock_get_significant_states:
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": start_time.isoformat(),
+                "entity_ids": ["sensor.test"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        states = response["result"]["sensor.test"]
+        assert [(state["s"], state["a"]) for state in states] == [
+            ("on", {"any": "attr"}),
+            ("off", {"any": "attr"}),
+        ]
+        assert states[0]["lu"] == start_time.timestamp()
+
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "history/stream",
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "significant_changes_only": False,
+                "no_attributes": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert [state["s"] for state in response["event"]["states"]["sensor.test"]] == [
+            "on",
+            "off",
+            "off",
+        ]
+        assert mock_get_significant_states.call_count == 0
+
+        # States from before the recorder started are fetched from the database
+        await client.send_json(
+            {
+                "id": 3,
+                "type": "history/history_during_period",
+                "start_time": (start_time - timedelta(hours=1)).isoformat(),
+                "entity_ids": ["sensor.test"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert len(response["result"]["sensor.test"]) == 2
+        assert mock_get_significant_states.call_count == 1
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
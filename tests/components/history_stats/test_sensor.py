@@ -1,6 +1,6 @@
 """The test for the History Statistics sensor platform."""
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -1230,6 +1230,80 @@ async def test_measure_sliding_window(
     assert hass.states.get("sensor.sensor4").state == "41.7"
 
 
+async def test_sliding_window_follows_state_changes(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a sliding window is updated from state changes without the database."""
+    start_time = dt_util.utcnow().replace(microsecond=0)
+    fake_states = Mock(
+        return_value={
+            "binary_sensor.test_id": [
+                ha.State(
+                    "binary_sensor.test_id",
+                    "off",
+                    last_changed=start_time - timedelta(hours=1),
+                )
+            ]
+        }
+    )
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        fake_states,
+    ), freeze_time(start_time) as freezer:
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "start": "{{ as_timestamp(now()) - 3600 }}",
+                        "end": "{{ now() }}",
+                        "type": "time",
+                    },
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor2",
+                        "state": "on",
+                        "start": "{{ as_timestamp(now()) - 3600 }}",
+                        "end": "{{ now() }}",
+                        "type": "count",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+        # Start     +10min    +40min    +70min    +100min
+        # |---off---|---on----|---off---|---------|
+        for minutes, state, expected in (
+            (10, "on", ("0.0", "1")),
+            (40, "off", ("0.5", "1")),
+            (70, None, ("0.5", "1")),
+            (85, None, ("0.25", "1")),
+            (100, None, ("0.0", "0")),
+        ):
+            freezer.move_to(start_time + timedelta(minutes=minutes))
+            if state:
+                hass.states.async_set("binary_sensor.test_id", state)
+            else:
+                async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+            assert (
+                hass.states.get("sensor.sensor1").state,
+                hass.states.get("sensor.sensor2").state,
+            ) == expected
+
+    # The history is only loaded from the database when the sensors are added
+    assert fake_states.call_count == 2
+
+
 async def test_measure_from_end_going_backwards(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -0,0 +1,126 @@
+"""The tests for the state trigger index."""
+from homeassistant.components.homeassistant.triggers.state_index import (
+    StateTriggerListener,
+    async_get_state_trigger_index,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
+
+
+async def test_dispatch_by_new_value(hass: HomeAssistant) -> None:
+    """Test listeners are called for the wanted values in attach order."""
+    index = async_get_state_trigger_index(hass)
+    calls = []
+
+    def listener(name, **kwargs):
+        """Return a listener recording its calls."""
+        return StateTriggerListener(
+            lambda event, old, new: calls.append((name, old, new)), **kwargs
+        )
+
+    index.async_add(["light.kitchen"], None, None, listener("any"))
+    index.async_add(["light.kitchen"], None, ["on"], listener("to_on"))
+    index.async_add(
+        ["light.kitchen", "light.hall"], None, ["on", "off"], listener("to_on_off")
+    )
+    index.async_add(
+        ["light.kitchen"],
+        None,
+        None,
+        listener("from_off", match_from=lambda value: value == "off"),
+    )
+    index.async_add(
+        ["light.kitchen"], "brightness", None, listener("brightness", changed_only=True)
+    )
+
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert calls == [("any", None, "off"), ("to_on_off", None, "off")]
+
+    calls.clear()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    assert calls == [
+        ("any", "off", "on"),
+        ("to_on", "off", "on"),
+        ("to_on_off", "off", "on"),
+        ("from_off", "off", "on"),
+        ("brightness", None, 100),
+    ]
+
+    calls.clear()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "other": 1})
+    await hass.async_block_till_done()
+    assert calls == [
+        ("any", "on", "on"),
+        ("to_on", "on", "on"),
+        ("to_on_off", "on", "on"),
+    ]
+
+    calls.clear()
+    hass.states.async_set("light.hall", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    assert calls == [("to_on_off", None, "on")]
+
+
+async def test_unhashable_values(hass: HomeAssistant) -> None:
+    """Test unhashable attribute values are matched by the unindexed listeners."""
+    index = async_get_state_trigger_index(hass)
+    calls = []
+    index.async_add(
+        ["light.kitchen"],
+        "effect_list",
+        ["colorloop"],
+        StateTriggerListener(lambda event, old, new: calls.append("indexed")),
+    )
+    index.async_add(
+        ["light.kitchen"],
+        "effect_list",
+        None,
+        StateTriggerListener(lambda event, old, new: calls.append("any")),
+    )
+
+    hass.states.async_set("light.kitchen", "on", {"effect_list": ["colorloop"]})
+    await hass.async_block_till_done()
+    assert calls == ["any"]
+
+
+async def test_remove_listeners(hass: HomeAssistant) -> None:
+    """Test entities are no longer tracked when their listeners are removed."""
+    index = async_get_state_trigger_index(hass)
+    calls = []
+    remove_on = index.async_add(
+        ["light.kitchen", "light.hall"],
+        None,
+        ["on", "on"],
+        StateTriggerListener(lambda event, old, new: calls.append("on")),
+    )
+    remove_any = index.async_add(
+        ["light.kitchen"],
+        "brightness",
+        None,
+        StateTriggerListener(lambda event, old, new: calls.append("any")),
+    )
+    assert set(hass.data[TRACK_STATE_CHANGE_CALLBACKS]) == {
+        "light.kitchen",
+        "light.hall",
+    }
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert calls == ["on", "any"]
+
+    remove_on()
+    assert set(hass.data[TRACK_STATE_CHANGE_CALLBACKS]) == {"light.kitchen"}
+    calls.clear()
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert calls == ["any", "any"]
+
+    remove_any()
+    assert not hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+    calls.clear()
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert calls == []
@@ -1,7 +1,11 @@
 """The tests for the InfluxDB component."""
+from collections.abc import Generator
 from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
@@ -10,6 +14,8 @@ import homeassistant.components.influxdb as influxdb
 from homeassistant.components.influxdb.const import DEFAULT_BUCKET
 from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.setup import async_setup_component
 
 INFLUX_PATH = "homeassistant.components.influxdb"
@@ -1676,3 +1682,129 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+class _InfluxWriteHandler(BaseHTTPRequestHandler):
+    """Stand-in for the write endpoint of InfluxDB."""
+
+    def do_POST(self) -> None:
+        """Record a write and wait until writes are released."""
+        server = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        server.writes.append(body)
+        server.writing.release()
+        server.release.wait(10)
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.end_headers()
+
+    def log_message(self, *args: Any) -> None:
+        """Do not log the requests."""
+
+
+@pytest.fixture(name="influx_server")
+def influx_server_fixture(
+    socket_enabled: None,
+) -> Generator[ThreadingHTTPServer, None, None]:
+    """Run a local HTTP stand-in for InfluxDB."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _InfluxWriteHandler)
+    server.writes = []
+    server.writing = threading.Semaphore(0)
+    server.release = threading.Event()
+    server.release.set()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.release.set()
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+async def test_export_pipeline_http(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    influx_server: ThreadingHTTPServer,
+) -> None:
+    """Test the export against a local InfluxDB HTTP endpoint."""
+    sensors = {
+        key: entity_registry.async_get_or_create(
+            "sensor", influxdb.DOMAIN, f"influxdb_export_{key}"
+        ).entity_id
+        for key in ("queue_depth", "dropped_points", "write_latency")
+    }
+    config = {
+        "influxdb": {
+            "host": "127.0.0.1",
+            "port": influx_server.server_port,
+            "coalesce": True,
+            "max_queue_size": 3,
+            "exclude": {"domains": ["sensor"]},
+        }
+    }
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    assert influx_server.writing.acquire(timeout=0)
+    instance = hass.data[influxdb.DOMAIN]
+
+    # The writer is blocked while the next batch queues up
+    influx_server.release.clear()
+    hass.states.async_set("fake.first", 0)
+    await hass.async_block_till_done()
+    assert await hass.async_add_executor_job(influx_server.writing.acquire, True, 10)
+    for entity_id, value in (
+        ("fake.a", 1),
+        ("fake.b", 5),
+        ("fake.a", 2),
+        ("fake.a", 3),
+    ):
+        hass.states.async_set(entity_id, value)
+    await hass.async_block_till_done()
+
+    await async_update_entity(hass, sensors["queue_depth"])
+    await async_update_entity(hass, sensors["dropped_points"])
+    assert hass.states.get(sensors["queue_depth"]).state == "3"
+    assert hass.states.get(sensors["dropped_points"]).state == "1"
+
+    influx_server.release.set()
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    # The updates of fake.a are coalesced to the last one which was queued
+    lines = influx_server.writes[-1].splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith("fake.b,domain=fake,entity_id=b value=5.0 ")
+    assert lines[1].startswith("fake.a,domain=fake,entity_id=a value=2.0 ")
+
+    await async_update_entity(hass, sensors["queue_depth"])
+    await async_update_entity(hass, sensors["write_latency"])
+    assert hass.states.get(sensors["queue_depth"]).state == "0"
+    assert float(hass.states.get(sensors["write_latency"]).state) > 0
+
+
+async def test_export_parallel_writers(
+    hass: HomeAssistant, influx_server: ThreadingHTTPServer
+) -> None:
+    """Test batches are written in parallel by the writers."""
+    config = {
+        "influxdb": {
+            "host": "127.0.0.1",
+            "port": influx_server.server_port,
+            "writers": 2,
+        }
+    }
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    assert influx_server.writing.acquire(timeout=0)
+    instance = hass.data[influxdb.DOMAIN]
+
+    influx_server.release.clear()
+    hass.states.async_set("fake.a", 1)
+    await hass.async_block_till_done()
+    assert await hass.async_add_executor_job(influx_server.writing.acquire, True, 10)
+    # The second batch is written while the first write is blocked
+    hass.states.async_set("fake.b", 2)
+    await hass.async_block_till_done()
+    assert await hass.async_add_executor_job(influx_server.writing.acquire, True, 10)
+
+    influx_server.release.set()
+    await hass.async_add_executor_job(instance.block_till_done)
+    assert len(influx_server.writes) == 3
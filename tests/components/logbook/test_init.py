@@ -1392,6 +1392,97 @@ async def test_logbook_entity_context_parent_id(
     assert json_dict[8]["context_user_id"] == "485cacf93ef84d25a99ced3126b921d2"
 
 
+async def test_logbook_pages_link_contexts(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the pages of the logbook view link contexts of earlier pages."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    for entity_id in ("automation.alarm", "light.kitchen", "light.hall", "switch.fan"):
+        hass.states.async_set(entity_id, STATE_OFF)
+    await hass.async_block_till_done()
+
+    context = ha.Context(id="01GTDGKBCH00GW0X476W5TVAAA")
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=context,
+    )
+    hass.states.async_set("automation.alarm", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    child_context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVDDD", parent_id="01GTDGKBCH00GW0X476W5TVAAA"
+    )
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+        context=child_context,
+    )
+    await hass.async_block_till_done()
+    for entity_id in ("light.kitchen", "light.hall", "switch.fan"):
+        hass.states.async_set(entity_id, STATE_ON, context=child_context)
+        await hass.async_block_till_done()
+    grandchild_context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVEEE", parent_id="01GTDGKBCH00GW0X476W5TVDDD"
+    )
+    for entity_id in ("light.kitchen", "light.hall"):
+        hass.states.async_set(entity_id, STATE_OFF, context=grandchild_context)
+        await hass.async_block_till_done()
+    hass.states.async_set("switch.fan", STATE_OFF)
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_ON, context=child_context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    start_date = dt_util.utcnow() - timedelta(hours=1)
+    end_time = dt_util.utcnow() + timedelta(hours=1)
+    for params in (
+        {"end_time": end_time.isoformat()},
+        {"end_time": end_time.isoformat(), "entity": "light.kitchen,light.hall"},
+        {"end_time": end_time.isoformat(), "entity": "light.hall,switch.fan"},
+    ):
+        response = await client.get(
+            f"/api/logbook/{start_date.isoformat()}", params=params
+        )
+        assert response.status == HTTPStatus.OK
+        expected = await response.json()
+        assert any("context_event_type" in event for event in expected)
+        assert any("context_entity_id" in event for event in expected)
+        for limit in (1, 2, 3, 5, 100):
+            events = []
+            cursor = None
+            while True:
+                page_params = {**params, "limit": limit}
+                if cursor is not None:
+                    page_params["cursor"] = cursor
+                response = await client.get(
+                    f"/api/logbook/{start_date.isoformat()}", params=page_params
+                )
+                assert response.status == HTTPStatus.OK
+                page = await response.json()
+                events.extend(page["events"])
+                if (cursor := page["next_cursor"]) is None:
+                    break
+            assert events == expected
+
+    for params, message in (
+        ({"limit": "0"}, "Invalid limit"),
+        ({"limit": "many"}, "Invalid limit"),
+        ({"cursor": "1:1"}, "A cursor requires a limit"),
+        ({"limit": "1", "cursor": "invalid"}, "Invalid cursor"),
+    ):
+        response = await client.get(
+            f"/api/logbook/{start_date.isoformat()}", params=params
+        )
+        assert response.status == HTTPStatus.BAD_REQUEST
+        assert (await response.json())["message"] == message
+
+
 async def test_logbook_context_from_template(
     recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
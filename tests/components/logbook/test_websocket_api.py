@@ -571,6 +571,99 @@ async def test_get_events_with_device_ids(
     assert isinstance(results[4]["when"], float)
 
 
+async def test_get_events_pages(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events in pages."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.hall", STATE_OFF)
+    await hass.async_block_till_done()
+    context = core.Context(id="01GTDGKBCH00GW0X276W5TEDDD")
+    for state in (STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.kitchen", state, context=context)
+        await hass.async_block_till_done()
+        hass.states.async_set("light.hall", state, context=context)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    msg_id = 0
+    for query in (
+        {},
+        {"entity_ids": ["light.hall"]},
+        {"context_id": "01GTDGKBCH00GW0X276W5TEDDD"},
+    ):
+        msg_id += 1
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                **query,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        expected = response["result"]
+        assert any("context_entity_id" in event for event in expected)
+
+        events = []
+        cursor = None
+        while True:
+            msg_id += 1
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "logbook/get_events",
+                    "start_time": now.isoformat(),
+                    "limit": 2,
+                    **query,
+                    **({"cursor": cursor} if cursor else {}),
+                }
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            events.extend(response["result"]["events"])
+            if (cursor := response["result"]["next_cursor"]) is None:
+                break
+        assert events == expected
+
+    await client.send_json(
+        {
+            "id": msg_id + 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 2,
+            "cursor": "invalid",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+    await client.send_json(
+        {
+            "id": msg_id + 2,
+            "type": "logbook/get_events",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "limit": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"events": [], "next_cursor": None}
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_excluded_entities(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
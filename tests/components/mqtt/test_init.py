@@ -13,7 +13,11 @@ import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -1288,6 +1292,66 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0].payload == "test-payload"
 
 
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        ("a/b/c", ["a/b/c", "a/+/c", "a/#", "+/b/#", "#"]),
+        ("a/b", ["a/#", "+/b/#", "#", "+/+"]),
+        ("a", ["a/#", "#"]),
+        ("x/b/c/d", ["+/b/#", "#"]),
+        ("$SYS/a", ["$SYS/+"]),
+    ],
+)
+def test_subscription_trie_match(topic: str, expected: list[str]) -> None:
+    """Test the subscription trie matches wildcards in insertion order."""
+    trie = SubscriptionTrie()
+    filters = ["a/b/c", "a/+/c", "a/#", "+/b/#", "#", "+/+", "$SYS/+", "b/#"]
+    subscriptions = {
+        topic_filter: Subscription(topic_filter, MagicMock())
+        for topic_filter in filters
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    assert [sub.topic for sub in trie.match(topic)] == [
+        topic_filter for topic_filter in filters if topic_filter in expected
+    ]
+    assert trie.has_filter("a/+/c")
+    assert not trie.has_filter("a/+")
+
+    for topic_filter in filters:
+        trie.remove(subscriptions[topic_filter])
+    assert trie.match(topic) == []
+    assert list(trie) == []
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions["a/#"])
+
+
+async def test_subscribe_wildcard_after_cached_match(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test a new wildcard subscription receives topics matched before."""
+    await mqtt_mock_entry()
+    unsub = await mqtt.async_subscribe(hass, "test-topic/+/state", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/light/state", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/light/state", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    unsub()
+    async_fire_mqtt_message(hass, "test-topic/light/state", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
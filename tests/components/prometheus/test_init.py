@@ -64,6 +64,8 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
+from tests.typing import ClientSessionGenerator
+
 PROMETHEUS_PATH = "homeassistant.components.prometheus"
 
 
@@ -969,6 +971,53 @@ async def test_disabling_entity(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_exposition_matches_client(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    hass_client: ClientSessionGenerator,
+    namespace,
+    sensor_entities,
+    climate_entities,
+    cover_entities,
+    switch_entities,
+) -> None:
+    """Test the incrementally rendered metrics match the client rendering."""
+    data = {**sensor_entities, **climate_entities, **cover_entities}
+    prometheus_client.REGISTRY = prometheus_client.CollectorRegistry(auto_describe=True)
+    prometheus_client.ProcessCollector(registry=prometheus_client.REGISTRY)
+    with mock.patch.object(
+        prometheus, "PrometheusView", wraps=prometheus.PrometheusView
+    ) as mock_view:
+        assert await async_setup_component(
+            hass, prometheus.DOMAIN, {prometheus.DOMAIN: {}}
+        )
+    await hass.async_block_till_done()
+    metrics = mock_view.call_args[0][0]
+    client = await hass_client()
+
+    async def assert_exposition_matches() -> None:
+        registry = prometheus_client.CollectorRegistry(auto_describe=True)
+        for cached_metric in metrics._metrics.values():
+            registry.register(cached_metric.metric)
+        resp = await client.get(prometheus.API_ENDPOINT)
+        body = await resp.text()
+        # Skip the process metrics which change between the renderings
+        assert body.endswith(prometheus_client.generate_latest(registry).decode())
+
+    await assert_exposition_matches()
+
+    set_state_with_entry(hass, data["sensor_1"], 16.2, {ATTR_FRIENDLY_NAME: 'A "b"'})
+    set_state_with_entry(hass, data["cover_open"], STATE_CLOSED)
+    await hass.async_block_till_done()
+    await assert_exposition_matches()
+
+    entity_registry.async_remove(data["climate_1"].entity_id)
+    set_state_with_entry(hass, data["sensor_1"], 17.0, {ATTR_FRIENDLY_NAME: "A\\b"})
+    await hass.async_block_till_done()
+    await assert_exposition_matches()
+
+
 @pytest.fixture(name="sensor_entities")
 async def sensor_fixture(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -32,6 +33,8 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READ_WORKER_PREFIX,
+    DB_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -79,6 +82,7 @@ from homeassistant.util.json import json_loads
 
 from .common import (
     async_block_recorder,
+    async_recorder_block_till_done,
     async_wait_recording_done,
     convert_pending_states_to_meta,
     corrupt_db_file,
@@ -119,6 +123,7 @@ def _default_recorder(hass):
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        db_read_workers=4,
     )
 
 
@@ -341,6 +346,57 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_many_states_in_one_commit(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states changed within one commit interval are linked to each other."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    assert instance._bulk_insert_states is True
+
+    for idx in range(3):
+        hass.states.async_set("test.one", str(idx), {"attr": idx})
+        hass.states.async_set("test.two", str(idx), {"attr": "same"})
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "3", {"attr": 3})
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = {
+            db_state.state_id: (states_meta.entity_id, db_state, shared_attrs)
+            for db_state, states_meta, shared_attrs in (
+                session.query(States, StatesMeta, StateAttributes.shared_attrs)
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            )
+        }
+        assert len(db_states) == 7
+        for entity_id, attrs in (("test.one", "{0}"), ("test.two", '"same"')):
+            old_state_id = None
+            for idx in range(4 if entity_id == "test.one" else 3):
+                state_id, db_state, shared_attrs = next(
+                    (state_id, db_state, shared_attrs)
+                    for state_id, (
+                        state_entity_id,
+                        db_state,
+                        shared_attrs,
+                    ) in db_states.items()
+                    if state_entity_id == entity_id and db_state.state == str(idx)
+                )
+                assert db_state.old_state_id == old_state_id
+                assert shared_attrs == f'{{"attr":{attrs.format(idx)}}}'
+                old_state_id = state_id
+        assert session.query(StateAttributes).count() == 5
+
+
 async def test_saving_state_with_intermixed_time_changes(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -378,7 +434,8 @@ def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        instance = get_instance(hass)
+        for obj in (*instance.event_session, *instance._pending_bulk_states):
             if isinstance(obj, States):
                 raise OperationalError(
                     "insert the state", "fake params", "forced to fail"
@@ -1778,6 +1835,73 @@ async def test_database_lock_and_unlock(
     assert len(db_events) == 1
 
 
+async def test_read_executor(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test read only jobs run in the db read executor with their own pool."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # Read only connections are only used for SQLite
+        return
+
+    if recorder_db_url == "sqlite://":
+        # Use file DB, in memory DB does not use a read engine
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    config = {
+        recorder.CONF_COMMIT_INTERVAL: 0,
+        recorder.CONF_DB_URL: recorder_db_url,
+    }
+    instance = await async_setup_recorder_instance(hass, config)
+    hass.bus.async_fire("EVENT_TEST", {"test_attr": 5})
+    await async_wait_recording_done(hass)
+
+    def _read_events() -> tuple[str, bool, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            read_from_read_engine = session.get_bind() is instance.read_engine
+            num_events = (
+                session.query(Events)
+                .filter(
+                    Events.event_type_id.in_(select_event_type_ids(("EVENT_TEST",)))
+                )
+                .count()
+            )
+            with pytest.raises(OperationalError, match="readonly"):
+                session.execute(text("DELETE FROM events"))
+        return threading.current_thread().name, read_from_read_engine, num_events
+
+    results = await asyncio.gather(
+        *(instance.async_add_read_executor_job(_read_events) for _ in range(2))
+    )
+    for thread_name, read_from_read_engine, num_events in results:
+        assert thread_name.startswith(DB_READ_WORKER_PREFIX)
+        assert read_from_read_engine
+        assert num_events == 1
+
+    def _read_events_in_db_executor() -> bool:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.get_bind() is instance.engine
+
+    assert await instance.async_add_executor_job(_read_events_in_db_executor)
+
+
+async def test_read_executor_disabled(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test read only jobs run in the db executor without db read workers."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_DB_READ_WORKERS: 0}
+    )
+    assert instance.read_engine is None
+    assert (
+        await instance.async_add_read_executor_job(
+            lambda: threading.current_thread().name
+        )
+    ).startswith(DB_WORKER_PREFIX)
+
+
 async def test_database_lock_and_overflow(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
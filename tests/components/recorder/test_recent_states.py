@@ -0,0 +1,229 @@
+"""The tests for the recent states kept in memory by the recorder."""
+from __future__ import annotations
+
+from datetime import timedelta
+from itertools import product
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import Recorder, get_instance, history
+from homeassistant.components.recorder.const import DOMAIN
+from homeassistant.components.recorder.recent_states import RecentStates
+from homeassistant.const import ATTR_ATTRIBUTION, ATTR_FRIENDLY_NAME
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_purge_done, async_wait_recording_done
+
+
+async def test_recent_states_match_database(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test history from the recent states is the history in the database."""
+    entity_ids = [
+        "sensor.power",
+        "climate.living_room",
+        "input_datetime.alarm",
+        "light.kitchen",
+        "sensor.unknown",
+    ]
+    changes = [
+        ("sensor.power", "10", {ATTR_FRIENDLY_NAME: "Power", ATTR_ATTRIBUTION: "x"}),
+        ("climate.living_room", "heat", {"current_temperature": 19.5}),
+        ("input_datetime.alarm", "07:00:00", {"hour": 7}),
+        ("light.kitchen", "on", {"brightness": 100}),
+        ("sensor.power", "10", {ATTR_FRIENDLY_NAME: "Power", "attr": 1}),
+        ("climate.living_room", "heat", {"current_temperature": 20}),
+        ("light.kitchen", "on", {"brightness": 200}),
+        ("sensor.power", "12", {ATTR_FRIENDLY_NAME: "Power", "attr": 1}),
+        ("input_datetime.alarm", "07:30:00", {"hour": 7}),
+        ("light.kitchen", "off", {}),
+        ("sensor.power", "12", {ATTR_FRIENDLY_NAME: "Power"}),
+        ("climate.living_room", "off", {"current_temperature": 20}),
+        ("light.kitchen", "on", {"brightness": 50}),
+        ("sensor.power", "10", {ATTR_FRIENDLY_NAME: "Power"}),
+    ]
+    times = []
+    for entity_id, state, attributes in changes:
+        freezer.tick(timedelta(seconds=10))
+        hass.states.async_set(entity_id, state, attributes)
+        times.append(dt_util.utcnow())
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+
+    start_times = [
+        times[3] + timedelta(seconds=1),
+        times[4],
+        times[6] + timedelta(seconds=5),
+        times[9],
+    ]
+    end_times = [None, times[-3], times[-1] + timedelta(seconds=1)]
+    for (
+        start_time,
+        end_time,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    ) in product(start_times, end_times, *([(True, False)] * 4)):
+        recent = instance.recent_states.get_significant_states(
+            start_time.timestamp(),
+            end_time.timestamp() if end_time else None,
+            entity_ids[:-1],
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        assert recent is not None
+        assert recent == await instance.async_add_executor_job(
+            history.get_significant_states,
+            hass,
+            start_time,
+            end_time,
+            entity_ids[:-1],
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+
+    # Queries which need states which are not in memory are not answered
+    for start_time, query_entity_ids in (
+        (times[3], entity_ids[:-1]),
+        (times[4], entity_ids),
+        (dt_util.utcnow() - timedelta(days=1), entity_ids[:1]),
+    ):
+        assert (
+            instance.recent_states.get_significant_states(
+                start_time.timestamp(), None, query_entity_ids, True, True, False, False
+            )
+            is None
+        )
+
+
+@pytest.mark.parametrize(
+    ("max_states", "max_states_per_entity", "expected_count"),
+    [(100, 10, 10), (15, 100, 14)],
+)
+def test_eviction(
+    max_states: int, max_states_per_entity: int, expected_count: int
+) -> None:
+    """Test the oldest states are evicted to stay within the limits."""
+    recent_states = RecentStates(100, max_states, max_states_per_entity)
+    now = dt_util.utcnow().timestamp()
+    recent_states.add("sensor.one", "0", now, None, b"{}")
+    for idx in range(1, 30):
+        recent_states.add("sensor.two", str(idx), now + idx, None, b"{}")
+    assert len(recent_states) == expected_count + 1
+
+    first_last_updated = now + 30 - expected_count
+    states = recent_states.get_significant_states(
+        first_last_updated + 0.5, None, ["sensor.two"], True, True, False, True
+    )
+    assert states is not None
+    assert len(states["sensor.two"]) == expected_count
+    # The state before the oldest state kept in memory is not known
+    assert (
+        recent_states.get_significant_states(
+            first_last_updated, None, ["sensor.two"], True, True, False, True
+        )
+        is None
+    )
+
+
+def test_window_eviction() -> None:
+    """Test states replaced before the window are evicted."""
+    recent_states = RecentStates(100, 100, 100)
+    now = dt_util.utcnow().timestamp()
+    recent_states.add("sensor.one", "0", now, None, b"{}")
+    recent_states.add("sensor.one", "1", now + 200, None, b"{}")
+    assert len(recent_states) == 2
+    recent_states.add("sensor.one", "2", now + 301, None, b'{"attr":1}')
+    assert len(recent_states) == 2
+
+    assert (
+        recent_states.get_significant_states(
+            now + 200, None, ["sensor.one"], True, True, False, True
+        )
+        is None
+    )
+    assert recent_states.get_significant_states(
+        now + 250, None, ["sensor.one"], True, True, False, False
+    ) == {
+        "sensor.one": [
+            {"s": "1", "a": {}, "lu": now + 250},
+            {"s": "2", "a": {"attr": 1}, "lu": now + 301},
+        ]
+    }
+
+
+def test_purge_before() -> None:
+    """Test the states purged from the database are removed."""
+    recent_states = RecentStates(100, 100, 100)
+    now = dt_util.utcnow().timestamp()
+    recent_states.add("sensor.one", "0", now, None, b"{}")
+    recent_states.add("sensor.one", "1", now + 10, None, b"{}")
+    recent_states.add("sensor.one", "2", now + 20, None, b"{}")
+    recent_states.add("sensor.two", "0", now, None, b"{}")
+    recent_states.purge_before(now + 15)
+    assert len(recent_states) == 1
+
+    # The state at the purge time is no longer known
+    assert (
+        recent_states.get_significant_states(
+            now + 15, None, ["sensor.one"], True, True, False, True
+        )
+        is None
+    )
+    assert recent_states.get_significant_states(
+        now + 25, None, ["sensor.one"], True, True, False, True
+    ) == {"sensor.one": [{"s": "2", "a": {}, "lu": now + 25}]}
+    assert (
+        recent_states.get_significant_states(
+            now + 5, None, ["sensor.two"], True, True, False, True
+        )
+        is None
+    )
+
+
+async def test_recent_states_purged(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the states purged by the purge service are not served from memory."""
+    hass.states.async_set("sensor.power", "10")
+    freezer.tick(timedelta(seconds=10))
+    hass.states.async_set("sensor.power", "12")
+    await async_wait_recording_done(hass)
+    freezer.tick(timedelta(seconds=10))
+    start_time = dt_util.utcnow() - timedelta(seconds=5)
+    instance = get_instance(hass)
+    assert (
+        instance.recent_states.get_significant_states(
+            start_time.timestamp(), None, ["sensor.power"], True, True, False, True
+        )
+        is not None
+    )
+
+    await hass.services.async_call(DOMAIN, "purge", {"keep_days": 0})
+    await async_wait_purge_done(hass)
+    assert len(instance.recent_states) == 0
+    assert (
+        instance.recent_states.get_significant_states(
+            start_time.timestamp(), None, ["sensor.power"], True, True, False, True
+        )
+        is None
+    )
+    assert (
+        await instance.async_add_executor_job(
+            history.get_significant_states,
+            hass,
+            start_time,
+            None,
+            ["sensor.power"],
+        )
+        == {}
+    )
@@ -32,7 +32,11 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -5193,3 +5197,14 @@ async def test_exclude_attributes(
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [0.0, 1.0000005, 1.0000015, 1699999999.9999995, 1700000000.123456, 1.9999999],
+)
+def test_timestamp_to_microseconds(timestamp: float) -> None:
+    """Test timestamps are rounded to microseconds like utc_from_timestamp."""
+    assert sensor_recorder._timestamp_to_microseconds(timestamp) == (
+        dt_util.utc_from_timestamp(timestamp) - dt_util.utc_from_timestamp(0)
+    ) // timedelta(microseconds=1)
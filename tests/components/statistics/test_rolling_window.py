@@ -0,0 +1,115 @@
+"""Test the rolling window of the statistics sensor."""
+from datetime import datetime, timedelta
+import math
+import random
+import statistics
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.statistics import rolling_window
+from homeassistant.components.statistics.rolling_window import RollingWindow
+
+
+@pytest.mark.parametrize("max_size", [1, 2, 7, 50])
+def test_rolling_window_matches_recompute(max_size: int) -> None:
+    """Test the incremental aggregates match recomputing them from the samples."""
+    rng = random.Random(max_size)
+    window = RollingWindow(max_size, order_statistics=True)
+    age = datetime(2023, 1, 1)
+    for step in range(500):
+        age += timedelta(seconds=rng.randint(1, 60))
+        window.append(round(rng.uniform(-50, 50), 1), age)
+        if step % 7 == 0 and len(window) > 1:
+            window.popleft()
+
+        states = list(window.states)
+        ages = list(window.ages)
+        assert len(window) <= max_size
+        assert window.sum == pytest.approx(sum(states))
+        assert window.median == pytest.approx(statistics.median(states))
+        assert window.value_max == max(states)
+        assert window.value_min == min(states)
+        assert window.mean_circular == pytest.approx(
+            (
+                math.degrees(
+                    math.atan2(
+                        sum(math.sin(math.radians(x)) for x in states),
+                        sum(math.cos(math.radians(x)) for x in states),
+                    )
+                )
+                + 360
+            )
+            % 360
+        )
+        if len(states) < 2:
+            continue
+        assert window.variance == pytest.approx(statistics.variance(states))
+        percentiles = statistics.quantiles(states, n=100, method="exclusive")
+        for percentile in (1, 25, 50, 99):
+            assert window.percentile(percentile) == pytest.approx(
+                percentiles[percentile - 1]
+            )
+        pairs = list(zip(states, states[1:], ages, ages[1:]))
+        assert window.area_linear == pytest.approx(
+            sum(
+                0.5 * (first + second) * (second_age - first_age).total_seconds()
+                for first, second, first_age, second_age in pairs
+            )
+        )
+        assert window.area_step == pytest.approx(
+            sum(
+                first * (second_age - first_age).total_seconds()
+                for first, _, first_age, second_age in pairs
+            )
+        )
+        assert window.sum_differences == pytest.approx(
+            sum(abs(second - first) for first, second, _, _ in pairs)
+        )
+        assert window.sum_differences_nonnegative == pytest.approx(
+            sum(
+                second - first if second >= first else second
+                for first, second, _, _ in pairs
+            )
+        )
+
+
+@pytest.mark.parametrize("bucket_size", [1, 2, 5])
+def test_rolling_window_order_statistics_in_buckets(bucket_size: int) -> None:
+    """Test the order statistics while the sorted samples split and merge buckets."""
+    rng = random.Random(bucket_size)
+    age = datetime(2023, 1, 1)
+    with patch.object(rolling_window, "_BUCKET_SIZE", bucket_size):
+        window = RollingWindow(None, order_statistics=True)
+        for step in range(1000):
+            age += timedelta(seconds=1)
+            # Grow the window first and shrink it to a single sample at the end
+            if len(window) and rng.random() < (0.3 if step < 500 else 0.9):
+                window.popleft()
+            else:
+                window.append(rng.randint(0, 20), age)
+            if len(window) < 2:
+                continue
+            states = sorted(window.states)
+            assert window.value_min == states[0]
+            assert window.value_max == states[-1]
+            assert window.median == statistics.median(states)
+            percentiles = statistics.quantiles(states, n=100, method="exclusive")
+            for percentile in (1, 25, 50, 99):
+                assert window.percentile(percentile) == pytest.approx(
+                    percentiles[percentile - 1]
+                )
+
+
+def test_rolling_window_empty_after_purge() -> None:
+    """Test the aggregates are reset when the last sample is removed."""
+    window = RollingWindow(None, order_statistics=False)
+    window.append(5.0, datetime(2023, 1, 1))
+    window.append(7.0, datetime(2023, 1, 1, 0, 1))
+    window.popleft()
+    window.popleft()
+    assert len(window) == 0
+    assert window.sum == 0
+    assert window.area_linear == 0
+    window.append(3.0, datetime(2023, 1, 1, 0, 2))
+    assert window.sum == 3.0
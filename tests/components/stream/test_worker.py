@@ -25,7 +25,12 @@ import av
 import numpy as np
 import pytest
 
-from homeassistant.components.stream import KeyFrameConverter, Stream, create_stream
+from homeassistant.components.stream import (
+    KeyFrameConverter,
+    Stream,
+    async_get_images,
+    create_stream,
+)
 from homeassistant.components.stream.const import (
     ATTR_SETTINGS,
     CONF_LL_HLS,
@@ -831,7 +836,12 @@ async def test_durations(hass: HomeAssistant, worker_finished_stream) -> None:
     for segment in complete_segments:
         av_segment = av.open(io.BytesIO(segment.init + segment.get_data()))
         av_segment.close()
+        # The parts of a complete segment share a single buffer
+        segment_data = segment.get_data()
+        assert isinstance(segment_data, memoryview)
+        assert b"".join(part.data for part in segment.parts) == segment_data
         for part_num, part in enumerate(segment.parts):
+            assert part.data.obj is segment_data.obj
             av_part = av.open(io.BytesIO(segment.init + part.data))
             running_metadata_duration += part.duration
             # av_part.duration actually returns the dts of the first packet of the next
@@ -1006,6 +1016,57 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_images_cached(hass: HomeAssistant, h264_video, filename) -> None:
+    """Test images of many streams and sizes are encoded from one decoded frame."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        streams = [
+            create_stream(hass, h264_video, {}, dynamic_stream_settings())
+            for _ in range(2)
+        ]
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+
+    for stream in streams:
+        with patch.object(hass.config, "is_allowed_path", return_value=True):
+            await stream.async_record(filename)
+        # Stop the worker so no new keyframe is decoded during the test
+        await stream._stop()
+
+    with patch.object(Stream, "start"), patch.object(
+        KeyFrameConverter,
+        "_generate_images",
+        wraps=KeyFrameConverter._generate_images,
+    ) as mock_generate_images:
+        assert (
+            await async_get_images(
+                hass,
+                [
+                    (streams[0], None, None),
+                    (streams[0], 4, 2),
+                    (streams[1], None, None),
+                ],
+            )
+            == [EMPTY_8_6_JPEG] * 3
+        )
+        assert mock_generate_images.call_count == 1
+        assert encode.call_count == 3
+        frame = streams[0]._keyframe_converter._frame
+        assert frame is not None
+
+        # Sizes which were encoded before come from the cache
+        assert await streams[0].async_get_image(4, 2) == EMPTY_8_6_JPEG
+        assert encode.call_count == 3
+        assert await streams[0].async_get_image(8, 4) == EMPTY_8_6_JPEG
+        assert encode.call_count == 4
+        assert encode.call_args[0][0].shape == (4, 8, 3)
+        assert streams[0]._keyframe_converter._frame is frame
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
@@ -17,7 +17,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1185,6 +1185,46 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shares_state_changed_listener(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities subscriptions share one state changed listener."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    for msg_id, entity_ids in ((5, ["light.one"]), (6, ["light.two"]), (7, None)):
+        command = {"id": msg_id, "type": "subscribe_entities"}
+        if entity_ids:
+            command["entity_ids"] = entity_ids
+        await websocket_client.send_json(command)
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.two", "on")
+    received = set()
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["c"]["light.two"]["+"]["s"] == "on"
+        received.add(msg["id"])
+    assert received == {6, 7}
+
+    for msg_id in (5, 6, 7):
+        await websocket_client.send_json(
+            {"id": msg_id + 10, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
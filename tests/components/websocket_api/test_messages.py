@@ -1,10 +1,13 @@
 """Test Websocket API messages module."""
+from unittest.mock import patch
+
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
-    _partial_cached_event_message as lru_event_cache,
+    _message_to_json_or_none,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -29,26 +32,22 @@ async def test_cached_event_message(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
     assert len(events) == 2
-    lru_event_cache.cache_clear()
-
-    msg0 = cached_event_message(2, events[0])
-    assert msg0 == cached_event_message(2, events[0])
 
-    msg1 = cached_event_message(2, events[1])
-    assert msg1 == cached_event_message(2, events[1])
+    with patch(
+        "homeassistant.components.websocket_api.messages._message_to_json_or_none",
+        wraps=_message_to_json_or_none,
+    ) as mock_to_json:
+        msg0 = cached_event_message(2, events[0])
+        assert msg0 == cached_event_message(2, events[0])
 
-    assert msg0 != msg1
+        msg1 = cached_event_message(2, events[1])
+        assert msg1 == cached_event_message(2, events[1])
 
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+        assert msg0 != msg1
+        assert mock_to_json.call_count == 2
 
-    cached_event_message(2, events[1])
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 3
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+        cached_event_message(2, events[1])
+        assert mock_to_json.call_count == 2
 
 
 async def test_cached_event_message_with_different_idens(hass: HomeAssistant) -> None:
@@ -67,19 +66,37 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
 
     assert len(events) == 1
 
-    lru_event_cache.cache_clear()
-
-    msg0 = cached_event_message(2, events[0])
-    msg1 = cached_event_message(3, events[0])
-    msg2 = cached_event_message(4, events[0])
+    with patch(
+        "homeassistant.components.websocket_api.messages._message_to_json_or_none",
+        wraps=_message_to_json_or_none,
+    ) as mock_to_json:
+        msg0 = cached_event_message(2, events[0])
+        msg1 = cached_event_message(3, events[0])
+        msg2 = cached_event_message(4, events[0])
 
     assert msg0 != msg1
     assert msg0 != msg2
+    assert mock_to_json.call_count == 1
+
+
+async def test_cached_state_diff_message(hass: HomeAssistant) -> None:
+    """Test that we serialize the state diff of an event once."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.window", "off")
+    await hass.async_block_till_done()
 
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 1
-    assert cache_info.currsize == 1
+    with patch(
+        "homeassistant.components.websocket_api.messages._message_to_json_or_none",
+        wraps=_message_to_json_or_none,
+    ) as mock_to_json:
+        msg0 = cached_state_diff_message(2, state_change_events[1])
+        msg1 = cached_state_diff_message(3, state_change_events[1])
+        # The full event message is a different shape
+        cached_event_message(2, state_change_events[1])
+
+    assert msg0.replace('"id":2', '"id":3') == msg1
+    assert mock_to_json.call_count == 2
 
 
 async def test_state_diff_event(hass: HomeAssistant) -> None:
@@ -17,6 +17,7 @@ from homeassistant.const import (
 from homeassistant.core import Context, HomeAssistant
 from homeassistant.exceptions import Unauthorized
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.location import distance
 
 from tests.common import MockConfigEntry, MockUser
 from tests.typing import WebSocketGenerator
@@ -205,6 +206,74 @@ async def test_active_zone_prefers_smaller_zone_if_same_distance_2(
     assert active.entity_id == "zone.smallest_zone"
 
 
+async def test_active_zone_matches_all_zones(hass: HomeAssistant) -> None:
+    """Test the zone index finds the same zone as checking every zone."""
+    zones = [
+        {
+            "name": f"Zone {latitude} {longitude} {radius}",
+            "latitude": latitude,
+            "longitude": longitude,
+            "radius": radius,
+        }
+        for latitude in (-89.9, -45.0, 0.0, 0.05, 52.37, 88.95)
+        for longitude in (-179.99, -0.01, 0.0, 4.89, 179.99)
+        for radius in (0, 100, 5000, 50000, 2000000)
+    ]
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": zones})
+
+    def active_zone(latitude: float, longitude: float, radius: int) -> str | None:
+        """Return the closest zone from all zones."""
+        closest = None
+        for state in sorted(
+            hass.states.async_all(zone.DOMAIN), key=lambda state: state.entity_id
+        ):
+            zone_dist = distance(
+                latitude,
+                longitude,
+                state.attributes["latitude"],
+                state.attributes["longitude"],
+            )
+            if zone_dist is None or zone_dist - radius >= state.attributes["radius"]:
+                continue
+            if (
+                closest is None
+                or zone_dist < closest[0]
+                or (
+                    zone_dist == closest[0]
+                    and state.attributes["radius"] < closest[1].attributes["radius"]
+                )
+            ):
+                closest = (zone_dist, state)
+        return None if closest is None else closest[1].entity_id
+
+    for latitude in (-89.95, -45.02, -0.04, 0.0, 0.06, 52.4, 52.8, 88.9, 89.5):
+        for longitude in (-180.0, -179.9, -0.05, 0.0, 4.95, 5.3, 179.97, 180.0):
+            for radius in (0, 20, 1000, 60000):
+                active = zone.async_active_zone(hass, latitude, longitude, radius)
+                assert (active and active.entity_id) == active_zone(
+                    latitude, longitude, radius
+                )
+
+
+async def test_active_zone_follows_zone_changes(hass: HomeAssistant) -> None:
+    """Test the active zone is found after zones are moved or removed."""
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": {}})
+    attributes = {"latitude": 10.0, "longitude": 20.0, "radius": 100}
+    hass.states.async_set("zone.moving", "0", attributes)
+    assert zone.async_active_zone(hass, 10.0, 20.0).entity_id == "zone.moving"
+    assert zone.async_active_zone(hass, 40.0, 50.0) is None
+
+    hass.states.async_set(
+        "zone.moving", "0", {**attributes, "latitude": 40.0, "longitude": 50.0}
+    )
+    assert zone.async_active_zone(hass, 10.0, 20.0) is None
+    assert zone.async_active_zone(hass, 40.0, 50.0).entity_id == "zone.moving"
+
+    hass.states.async_set("zone.moving", "0", {**attributes, "radius": "invalid"})
+    hass.states.async_remove("zone.moving")
+    assert zone.async_active_zone(hass, 40.0, 50.0) is None
+
+
 async def test_in_zone_works_for_passive_zones(hass: HomeAssistant) -> None:
     """Test working in passive zones."""
     latitude = 32.880600
@@ -281,6 +281,64 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
     assert test(hass)
 
 
+async def test_condition_without_trace_collection(hass: HomeAssistant) -> None:
+    """Test conditions give the same results when traces are not collected."""
+    config = {
+        "condition": "or",
+        "conditions": [
+            {
+                "condition": "and",
+                "conditions": [
+                    {
+                        "condition": "state",
+                        "entity_id": ["sensor.temperature", "sensor.humidity"],
+                        "state": ["100", "input_number.wanted"],
+                    },
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": "sensor.temperature",
+                        "below": 110,
+                        "above": "input_number.wanted",
+                    },
+                ],
+            },
+            {
+                "condition": "not",
+                "conditions": [
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": "sensor.humidity",
+                        "attribute": "level",
+                        "below": 50,
+                    }
+                ],
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    for temperature, humidity, level, wanted in (
+        (100, 100, 10, 90),
+        (100, 100, 60, 90),
+        (100, 90, 10, 90),
+        (100, 100, 10, 100),
+        (120, 120, 60, 120),
+    ):
+        hass.states.async_set("sensor.temperature", temperature)
+        hass.states.async_set("sensor.humidity", humidity, {"level": level})
+        hass.states.async_set("input_number.wanted", wanted)
+        trace.trace_clear()
+        result = test(hass)
+        assert trace.trace_get(clear=False)
+
+        trace.trace_clear()
+        with trace.trace_collection(False):
+            assert test(hass) is result
+        assert trace.trace_get(clear=False) == {}
+
+
 async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
     """Test the 'and' condition shorthand."""
     config = {
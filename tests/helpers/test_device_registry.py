@@ -4,6 +4,7 @@ import time
 from typing import Any
 from unittest.mock import patch
 
+import attr
 import pytest
 from yarl import URL
 
@@ -838,6 +839,64 @@ async def test_removing_area_id(
     assert entry_w_area != entry_wo_area
 
 
+async def test_device_registry_items_indexes(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test looking up devices by area and config entry."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+    entry1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id,
+        identifiers={("bridgeid", "4567")},
+    )
+    entry1 = device_registry.async_update_device(
+        entry1.id, area_id="area1", add_config_entry_id=config_entry_2.entry_id
+    )
+
+    assert dr.async_entries_for_area(device_registry, "area1") == [entry1]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [entry1]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [entry2, entry1]
+
+    entry1 = device_registry.async_update_device(
+        entry1.id, area_id="area2", remove_config_entry_id=config_entry_1.entry_id
+    )
+    assert dr.async_entries_for_area(device_registry, "area1") == []
+    assert dr.async_entries_for_area(device_registry, "area2") == [entry1]
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_1.entry_id)
+        == []
+    )
+
+    device_registry.async_clear_config_entry(config_entry_2.entry_id)
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_2.entry_id)
+        == []
+    )
+    assert dr.async_entries_for_area(device_registry, "area2") == []
+
+
+def test_device_registry_items_empty_area_id() -> None:
+    """Test an empty area id is indexed and unindexed like any other area id."""
+    devices = dr.ActiveDeviceRegistryItems()
+    entry = dr.DeviceEntry(area_id="")
+    devices[entry.id] = entry
+    assert devices.get_devices_for_area_id("") == [entry]
+    devices[entry.id] = attr.evolve(entry, area_id=None)
+    assert devices.get_devices_for_area_id("") == []
+    del devices[entry.id]
+    assert devices._area_id_index == {}
+
+
 async def test_specifying_via_device_create(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
@@ -1476,6 +1476,61 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_indexes() -> None:
+    """Test the device, area and config entry indexes of EntityRegistryItems."""
+    entities = er.EntityRegistryItems()
+    assert entities.get_entries_for_device_id("device1") == []
+    assert entities.get_entries_for_area_id("area1") == []
+    assert entities.get_entries_for_config_entry_id("entry1") == []
+
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="area1",
+        config_entry_id="entry1",
+        device_id="device1",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        config_entry_id="entry1",
+        device_id="device1",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device1") == [entry1]
+    assert entities.get_entries_for_device_id("device1", True) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("area1") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry1") == [entry1, entry2]
+
+    entry1_moved = attr.evolve(
+        entry1, area_id="area2", config_entry_id=None, device_id="device2"
+    )
+    entities["test.entity1"] = entry1_moved
+    assert entities.get_entries_for_device_id("device1", True) == [entry2]
+    assert entities.get_entries_for_device_id("device2") == [entry1_moved]
+    assert entities.get_entries_for_area_id("area1") == []
+    assert entities.get_entries_for_area_id("area2") == [entry1_moved]
+    assert entities.get_entries_for_config_entry_id("entry1") == [entry2]
+
+    # Empty ids are indexed and unindexed like any other id
+    entry2_empty = attr.evolve(entry2, area_id="", config_entry_id="", device_id="")
+    entities["test.entity2"] = entry2_empty
+    assert entities.get_entries_for_device_id("", True) == [entry2_empty]
+    assert entities.get_entries_for_area_id("") == [entry2_empty]
+    assert entities.get_entries_for_config_entry_id("") == [entry2_empty]
+
+    del entities["test.entity1"]
+    del entities["test.entity2"]
+    assert entities._device_id_index == {}
+    assert entities._area_id_index == {}
+    assert entities._config_entry_id_index == {}
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
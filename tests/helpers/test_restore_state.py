@@ -13,6 +13,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
@@ -25,6 +26,7 @@ from homeassistant.helpers.restore_state import (
 )
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockEntityPlatform,
@@ -307,7 +309,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = json_loads(json_bytes(args[0]))
 
     for state in states:
         hass.states.async_remove(state.entity_id)
@@ -338,7 +340,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = json_loads(json_bytes(args[0]))
     assert len(written_states) == 2
     assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
     assert written_states[0]["state"]["state"] == "off"
@@ -346,6 +348,46 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert written_states[1]["state"]["state"] == "off"
 
 
+async def test_dump_only_encodes_changed_states(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the states which did not change since the last dump are not encoded."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(3):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    hass.states.async_set("input_boolean.b2", "on", {"bad": object()})
+
+    data = async_get(hass)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        encoded_state = data._encoded_states["input_boolean.b0"]
+        changed_encoded_state = data._encoded_states["input_boolean.b1"]
+        hass.states.async_set("input_boolean.b1", "on")
+        await data.async_dump_states()
+
+    first_states = json_loads(json_bytes(mock_write_data.mock_calls[0][1][0]))
+    second_states = json_loads(json_bytes(mock_write_data.mock_calls[1][1][0]))
+    # The state which can not be serialized is not saved
+    assert [state["state"]["entity_id"] for state in second_states] == [
+        "input_boolean.b0",
+        "input_boolean.b1",
+    ]
+    assert "Unable to save the state of input_boolean.b2" in caplog.text
+    assert first_states[0]["state"] == second_states[0]["state"]
+    assert first_states[1]["state"]["state"] == "unknown"
+    assert second_states[1]["state"]["state"] == "on"
+    assert second_states[1]["last_seen"] == second_states[0]["last_seen"]
+    assert data._encoded_states["input_boolean.b0"] is encoded_state
+    assert data._encoded_states["input_boolean.b1"] is not changed_encoded_state
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
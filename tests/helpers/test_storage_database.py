@@ -0,0 +1,252 @@
+"""Tests for the storage database helper."""
+import asyncio
+import json
+import os
+import sqlite3
+
+import py
+import pytest
+
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import storage
+from homeassistant.helpers.restore_state import (
+    RestoredExtraData,
+    RestoreStateData,
+    StoredState,
+)
+from homeassistant.helpers.storage_database import (
+    STORAGE_DATABASE,
+    StorageDatabase,
+    migrate_to_database,
+    migrate_to_json,
+)
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_test_home_assistant
+
+MOCK_KEY = "core.entity_registry"
+MOCK_DATA = {
+    "entities": [
+        {"id": "a", "entity_id": "light.a", "name": None},
+        {"id": "b", "entity_id": "light.b", "name": "B"},
+        {"id": "c", "entity_id": "light.c", "name": None},
+    ],
+    "deleted_entities": [],
+    "version_info": {"created": 1},
+}
+
+
+def _database_rows(path: str) -> dict[str, list[tuple]]:
+    """Return the rows of the tables of a storage database."""
+    with sqlite3.connect(path) as connection:
+        rows = {
+            table: connection.execute(query).fetchall()
+            for table, query in (
+                ("stores", "SELECT * FROM stores"),
+                ("lists", "SELECT * FROM lists"),
+                ("records", "SELECT * FROM records"),
+            )
+        }
+    connection.close()
+    return rows
+
+
+async def _async_test_home_assistant(config_dir: str) -> HomeAssistant:
+    """Return a Home Assistant instance with the given config dir."""
+    hass = await async_test_home_assistant(asyncio.get_running_loop())
+    hass.config.config_dir = config_dir
+    return hass
+
+
+async def _async_stop(hass: HomeAssistant) -> None:
+    """Stop Home Assistant and close the storage database."""
+    await hass.async_stop(force=True)
+    if database := hass.data.get(storage.DATA_STORAGE_DATABASE):
+        database.close()
+
+
+@pytest.fixture
+def config_dir(tmpdir: py.path.local) -> str:
+    """Return a config dir with an empty storage database."""
+    config_dir = str(tmpdir.mkdir("temp_storage"))
+    os.mkdir(os.path.join(config_dir, storage.STORAGE_DIR))
+    StorageDatabase(
+        os.path.join(config_dir, storage.STORAGE_DIR, STORAGE_DATABASE)
+    ).close()
+    return config_dir
+
+
+async def test_saving_load_round_trip(config_dir: str) -> None:
+    """Test the data of a store is saved to and loaded from the database."""
+    hass = await _async_test_home_assistant(config_dir)
+    store = storage.Store(hass, 1, MOCK_KEY, minor_version=2)
+    await store.async_save(MOCK_DATA)
+    await _async_stop(hass)
+
+    assert not os.path.exists(os.path.join(config_dir, storage.STORAGE_DIR, MOCK_KEY))
+    rows = _database_rows(
+        os.path.join(config_dir, storage.STORAGE_DIR, STORAGE_DATABASE)
+    )
+    assert rows["stores"] == [
+        (
+            MOCK_KEY,
+            1,
+            2,
+            b'{"deleted_entities":[],"version_info":{"created":1}}',
+        )
+    ]
+    assert rows["lists"] == [(MOCK_KEY, "entities", b'["a","b","c"]')]
+    assert [row[2] for row in rows["records"]] == ["a", "b", "c"]
+
+    hass = await _async_test_home_assistant(config_dir)
+    store = storage.Store(hass, 1, MOCK_KEY, minor_version=2)
+    assert await store.async_load() == MOCK_DATA
+    await _async_stop(hass)
+
+
+async def test_saving_only_writes_changed_records(config_dir: str) -> None:
+    """Test saving only writes the records which changed."""
+    hass = await _async_test_home_assistant(config_dir)
+    store = storage.Store(hass, 1, MOCK_KEY)
+    await store.async_save(MOCK_DATA)
+    database: StorageDatabase = hass.data[storage.DATA_STORAGE_DATABASE]
+    # pylint: disable-next=protected-access
+    connection = database._connection
+    total_changes = connection.total_changes
+
+    entities = [
+        {"id": "c", "entity_id": "light.c", "name": "C"},
+        MOCK_DATA["entities"][0],
+        {"id": "d", "entity_id": "light.d", "name": None},
+    ]
+    await store.async_save({**MOCK_DATA, "entities": entities})
+    # The list ids, record c, record d and the removal of record b
+    assert connection.total_changes - total_changes == 4
+    assert await store.async_load() == {**MOCK_DATA, "entities": entities}
+
+    # Lists which no longer have ids are kept with the data of the store
+    data = {"entities": [{"entity_id": "light.a"}]}
+    await store.async_save(data)
+    assert await store.async_load() == data
+    await _async_stop(hass)
+
+    rows = _database_rows(
+        os.path.join(config_dir, storage.STORAGE_DIR, STORAGE_DATABASE)
+    )
+    assert rows["lists"] == []
+    assert rows["records"] == []
+
+
+async def test_saving_restore_states(config_dir: str) -> None:
+    """Test the restore states are saved to and loaded from the database."""
+    now = dt_util.utcnow()
+    hass = await _async_test_home_assistant(config_dir)
+    data = RestoreStateData(hass)
+    data.last_states = {
+        "input_boolean.b1": StoredState(
+            State("input_boolean.b1", "on", {"attr": 1}),
+            RestoredExtraData({"native_value": 2}),
+            now,
+        )
+    }
+    await data.async_dump_states()
+    await _async_stop(hass)
+
+    hass = await _async_test_home_assistant(config_dir)
+    data = RestoreStateData(hass)
+    await data.async_load()
+    stored_state = data.last_states["input_boolean.b1"]
+    assert stored_state.state.state == "on"
+    assert stored_state.state.attributes == {"attr": 1}
+    assert stored_state.extra_data.as_dict() == {"native_value": 2}
+    assert stored_state.last_seen == now
+    await _async_stop(hass)
+
+
+async def test_saving_bad_data(
+    config_dir: str, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test data which can not be encoded is not written."""
+    hass = await _async_test_home_assistant(config_dir)
+    store = storage.Store(hass, 1, MOCK_KEY)
+    await store.async_save(MOCK_DATA)
+    await store.async_save({"entities": [{"id": "a", "bad": object()}]})
+    assert "Error writing config for core.entity_registry" in caplog.text
+    assert await store.async_load() == MOCK_DATA
+    await _async_stop(hass)
+
+
+async def test_remove(config_dir: str) -> None:
+    """Test removing the data of a store from the database."""
+    hass = await _async_test_home_assistant(config_dir)
+    store = storage.Store(hass, 1, MOCK_KEY)
+    await store.async_save(MOCK_DATA)
+    await store.async_remove()
+    assert await store.async_load() is None
+    await _async_stop(hass)
+
+    rows = _database_rows(
+        os.path.join(config_dir, storage.STORAGE_DIR, STORAGE_DATABASE)
+    )
+    assert rows == {"stores": [], "lists": [], "records": []}
+
+
+async def test_migration(tmpdir: py.path.local) -> None:
+    """Test migrating the JSON files to the database and back."""
+    config_dir = str(tmpdir.mkdir("temp_storage"))
+    storage_dir = os.path.join(config_dir, storage.STORAGE_DIR)
+    hass = await _async_test_home_assistant(config_dir)
+    await storage.Store(hass, 1, MOCK_KEY).async_save(MOCK_DATA)
+    await storage.Store(hass, 2, "other", minor_version=3).async_save(["a", "b"])
+    await hass.async_stop(force=True)
+    assert hass.data[storage.DATA_STORAGE_DATABASE] is None
+    # Files which are not the data of a store are left alone
+    for name, contents in (
+        (f"{MOCK_KEY}.corrupt.2023-01-01", "{"),
+        ("not_a_store", json.dumps({"key": "other"})),
+    ):
+        with open(os.path.join(storage_dir, name), "w", encoding="utf8") as file:
+            file.write(contents)
+
+    assert await asyncio.to_thread(migrate_to_database, storage_dir) == [
+        MOCK_KEY,
+        "other",
+    ]
+    assert sorted(os.listdir(storage_dir)) == [
+        f"{MOCK_KEY}.corrupt.2023-01-01",
+        "not_a_store",
+        STORAGE_DATABASE,
+    ]
+    assert os.stat(os.path.join(storage_dir, STORAGE_DATABASE)).st_mode & 0o777 == (
+        0o600
+    )
+
+    hass = await _async_test_home_assistant(config_dir)
+    assert await storage.Store(hass, 1, MOCK_KEY).async_load() == MOCK_DATA
+    assert await storage.Store(hass, 2, "other", minor_version=3).async_load() == [
+        "a",
+        "b",
+    ]
+    await _async_stop(hass)
+
+    assert await asyncio.to_thread(migrate_to_json, storage_dir) == [
+        MOCK_KEY,
+        "other",
+    ]
+    assert sorted(os.listdir(storage_dir)) == [
+        MOCK_KEY,
+        f"{MOCK_KEY}.corrupt.2023-01-01",
+        "not_a_store",
+        "other",
+    ]
+    with open(os.path.join(storage_dir, "other"), encoding="utf8") as file:
+        assert json.load(file) == {
+            "version": 2,
+            "minor_version": 3,
+            "key": "other",
+            "data": ["a", "b"],
+        }
+
+    hass = await _async_test_home_assistant(config_dir)
+    assert await storage.Store(hass, 1, MOCK_KEY).async_load() == MOCK_DATA
+    await _async_stop(hass)
@@ -4789,3 +4789,59 @@ async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     assert template.CACHED_TEMPLATE_NO_COLLECT_LRU.get_size() == int(
         round(mock_entity_count * template.ENTITY_COUNT_GROWTH_FACTOR)
     )
+
+
+async def test_bytecode_cache(hass: HomeAssistant, tmp_path) -> None:
+    """Test compiled templates are kept across restarts."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    await template.async_load_bytecode_cache(hass)
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    tpl.ensure_valid()
+    assert tpl.async_render() == 2
+    await hass.async_add_executor_job(hass.data[template._BYTECODE_CACHE].save)
+    assert (tmp_path / ".storage" / template.BYTECODE_CACHE_FILE).exists()
+
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch(
+        "jinja2.sandbox.ImmutableSandboxedEnvironment.compile",
+        side_effect=AssertionError,
+    ):
+        tpl = template.Template("{{ 1 + 1 }}", hass)
+        tpl.ensure_valid()
+        assert tpl.async_render() == 2
+
+
+async def test_bytecode_cache_other_version(hass: HomeAssistant, tmp_path) -> None:
+    """Test a bytecode cache of another version is ignored."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    await template.async_load_bytecode_cache(hass)
+    template.Template("{{ 1 + 1 }}", hass).ensure_valid()
+    await hass.async_add_executor_job(hass.data[template._BYTECODE_CACHE].save)
+
+    hass.data.pop(template._ENVIRONMENT)
+    with patch(
+        "homeassistant.helpers.template._bytecode_cache_version",
+        return_value=("0.0.0", "0.0.0", b""),
+    ):
+        await template.async_load_bytecode_cache(hass)
+    assert hass.data[template._BYTECODE_CACHE].get("default", "{{ 1 + 1 }}") is None
+
+
+async def test_bytecode_cache_limited_environment(
+    hass: HomeAssistant, tmp_path
+) -> None:
+    """Test code compiled by the limited environment is not used by the others."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    await template.async_load_bytecode_cache(hass)
+    hass.states.async_set("sensor.x", "on")
+    source = "{{ 'sensor.x' | has_value }}"
+    template.TemplateEnvironment(hass, limited=True).compile(source)
+
+    await hass.async_add_executor_job(hass.data[template._BYTECODE_CACHE].save)
+    await template.async_load_bytecode_cache(hass)
+    for strict in (False, True):
+        assert template.Template(source, hass).async_render(strict=strict) is True
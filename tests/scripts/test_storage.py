@@ -0,0 +1,43 @@
+"""Test the storage script to move the data between JSON files and a database."""
+import json
+import os
+
+import py
+import pytest
+
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.storage_database import STORAGE_DATABASE
+from homeassistant.scripts import storage as script_storage
+
+
+def test_to_sqlite_and_back(
+    tmpdir: py.path.local, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test moving the data to the database and back to JSON files."""
+    storage_dir = tmpdir.mkdir(STORAGE_DIR)
+    data = {"version": 1, "minor_version": 1, "key": "test", "data": {"a": 1}}
+    storage_dir.join("test").write(json.dumps(data))
+    config = ["-c", str(tmpdir)]
+
+    assert script_storage.run([*config, "to_json"]) == 1
+    assert script_storage.run([*config, "to_sqlite"]) == 0
+    assert os.listdir(storage_dir) == [STORAGE_DATABASE]
+    assert script_storage.run([*config, "to_sqlite"]) == 1
+    assert script_storage.run([*config, "to_json"]) == 0
+    assert os.listdir(storage_dir) == ["test"]
+    assert json.loads(storage_dir.join("test").read()) == data
+
+    assert capsys.readouterr().out == "\n".join(
+        [
+            "There is no database to move the data from",
+            "Moved 1 stores to the database",
+            "The data is already in the database",
+            "Moved 1 stores to JSON files",
+            "",
+        ]
+    )
+
+
+def test_missing_storage_dir(tmpdir: py.path.local) -> None:
+    """Test the script fails without a storage directory."""
+    assert script_storage.run(["-c", str(tmpdir), "to_sqlite"]) == 1
@@ -750,6 +750,31 @@ def test_state_as_compressed_state_json() -> None:
     assert state.as_compressed_state_json is as_compressed_state
 
 
+def test_state_cached_json() -> None:
+    """Test a State is encoded once per shape."""
+    state = ha.State("happy.happy", "on", {"pig": "dog"})
+    encoder = Mock(side_effect=lambda state: f'"{state.state}"')
+    other_encoder = Mock(side_effect=lambda state: f'"{state.entity_id}"')
+
+    assert state.cached_json("state", encoder) == '"on"'
+    assert state.cached_json("state", encoder) == '"on"'
+    assert state.cached_json("entity_id", other_encoder) == '"happy.happy"'
+    assert encoder.call_count == 1
+    assert other_encoder.call_count == 1
+
+
+def test_event_cached_json() -> None:
+    """Test an Event is encoded once per shape."""
+    event = ha.Event("some_type", {"some": "attr"})
+    encoder = Mock(side_effect=lambda event: f'"{event.event_type}"')
+
+    assert event.cached_json("event_type", encoder) == '"some_type"'
+    assert event.cached_json("event_type", encoder) == '"some_type"'
+    assert encoder.call_count == 1
+    assert ha.Event("some_type").cached_json("event_type", encoder) == '"some_type"'
+    assert encoder.call_count == 2
+
+
 async def test_eventbus_add_remove_listener(hass: HomeAssistant) -> None:
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -798,6 +823,68 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners only run for matching data values."""
+    calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "device_id", ["abc", "def"], listener, run_immediately=True
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    hass.bus.async_fire("test", {"device_id": "xyz"})
+    hass.bus.async_fire("test", {"device_id": ["abc"]})
+    hass.bus.async_fire("test", {"other": "abc"})
+    hass.bus.async_fire("test", {"device_id": "def"})
+    assert [event.data for event in calls] == [
+        {"device_id": "abc"},
+        {"device_id": "def"},
+    ]
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    assert len(calls) == 2
+
+
+async def test_eventbus_keyed_listener_first_present_key(
+    hass: HomeAssistant,
+) -> None:
+    """Test keyed listeners on a tuple of keys use the first key in the data."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", ("old_entity_id", "entity_id"), ["light.old"], listener
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.old"})
+    hass.bus.async_fire(
+        "test", {"old_entity_id": "light.old", "entity_id": "light.new"}
+    )
+    hass.bus.async_fire(
+        "test", {"old_entity_id": "light.new", "entity_id": "light.old"}
+    )
+    await hass.async_block_till_done()
+    assert [event.data for event in calls] == [
+        {"entity_id": "light.old"},
+        {"old_entity_id": "light.old", "entity_id": "light.new"},
+    ]
+
+    unsub()
+
+
 async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     """Test we can call events immediately."""
     calls = []